@@ -0,0 +1,102 @@
+"""
+Memory benchmark for the cached item catalog
+
+Builds a realistic catalog from the article translations shipped with
+bring_api (one entry per article, translated into every bundled locale) and
+compares resident memory of the raw response objects with the compact
+representation used by the server's catalog cache.
+
+Usage:
+    python benchmarks/catalog_memory.py [--locales N]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import bring_api
+
+from bring_mcp_server.catalog import CatalogPool
+
+
+@dataclass
+class RawCatalogItem:
+    """Shape of a catalog entry as deserialized from a bring_api response."""
+
+    itemId: str
+    imagePath: str
+    translations: Dict[str, str] = field(default_factory=dict)
+
+
+def load_article_translations() -> Dict[str, Dict[str, str]]:
+    locales_dir = Path(bring_api.__file__).parent / "locales"
+    return {
+        path.stem.split(".", 1)[1]: json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(locales_dir.glob("articles.*.json"))
+    }
+
+
+def catalog_payload(articles: Dict[str, Dict[str, str]]) -> List[Dict[str, Any]]:
+    """JSON payload of one locale's catalog download."""
+    item_ids = sorted(articles["de-CH"])
+    return [
+        {
+            "itemId": item_id,
+            "imagePath": f"{item_id.lower().replace(' ', '_')}.png",
+            "translations": {
+                locale: names.get(item_id, item_id) for locale, names in articles.items()
+            },
+        }
+        for item_id in item_ids
+    ]
+
+
+def measure(build: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--locales", type=int, default=5, help="Number of cached locales")
+    args = parser.parse_args()
+
+    articles = load_article_translations()
+    # Each download is parsed separately, so the raw side gets fresh strings
+    payload = json.dumps(catalog_payload(articles))
+    locales = list(articles)[: args.locales]
+
+    def build_raw() -> Dict[str, List[RawCatalogItem]]:
+        return {
+            locale: [RawCatalogItem(**item) for item in json.loads(payload)]
+            for locale in locales
+        }
+
+    def build_compact() -> Any:
+        pool = CatalogPool()
+        catalogs = {locale: pool.compact(json.loads(payload)) for locale in locales}
+        return pool, catalogs
+
+    raw = measure(build_raw)
+    compact = measure(build_compact)
+    items = len(json.loads(payload))
+
+    print(f"Catalog: {items} items x {len(articles)} translations, {len(locales)} cached locale(s)")
+    print(f"{'representation':<16} {'total KiB':>10} {'KiB/locale':>11}")
+    print(f"{'raw objects':<16} {raw / 1024:>10.0f} {raw / 1024 / len(locales):>11.0f}")
+    print(f"{'compact':<16} {compact / 1024:>10.0f} {compact / 1024 / len(locales):>11.0f}")
+    print(f"compact / raw: {compact / raw:.1%}")
+
+
+if __name__ == "__main__":
+    main()
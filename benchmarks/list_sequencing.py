@@ -0,0 +1,104 @@
+"""
+Stress benchmark for per-list write sequencing
+
+Fires concurrent bring_complete_item calls at the server's call_tool handler
+across many lists, with a stub Bring client that simulates upstream
+latency. Reports throughput, checks that writes to each list never overlapped
+and arrived in issue order, and compares with a single global lock (the
+alternative of serializing all writes).
+
+Usage:
+    python benchmarks/list_sequencing.py [--lists N] [--writes N] [--latency MS]
+"""
+
+import argparse
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from bring_mcp_server import server
+from bring_mcp_server.sequencer import ListSequencer
+
+
+class StubBring:
+    """Bring client stand-in whose writes take a fixed time."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.applied: Dict[str, List[str]] = defaultdict(list)
+        self.in_flight: Dict[str, int] = defaultdict(int)
+        self.overlaps = 0
+
+    async def get_items_details(self, locale: Any = None) -> List[Any]:
+        # An empty catalog: item names are written as typed
+        return []
+
+    async def complete_item(self, list_uuid: str, item_name: str) -> None:
+        self.in_flight[list_uuid] += 1
+        self.overlaps += self.in_flight[list_uuid] > 1
+        await asyncio.sleep(self.latency)
+        self.applied[list_uuid].append(item_name)
+        self.in_flight[list_uuid] -= 1
+
+
+class GlobalSequencer(ListSequencer):
+    """Baseline: one lock for every list."""
+
+    def hold(self, list_uuid: str) -> Any:
+        return super().hold("*")
+
+
+async def run(lists: int, writes: int, latency: float, sequencer: ListSequencer) -> Dict[str, Any]:
+    stub = StubBring(latency)
+    calls = [
+        (f"list-{i}", f"item-{n}")
+        for n in range(writes)
+        for i in range(lists)
+    ]
+
+    previous_sequencer = server._sequencer
+    server._sequencer = sequencer
+    try:
+        with server.stand_in_client(stub):
+            start = time.perf_counter()
+            await asyncio.gather(*(
+                server.call_tool("bring_complete_item", {"list_uuid": list_uuid, "item_name": item})
+                for list_uuid, item in calls
+            ))
+            elapsed = time.perf_counter() - start
+    finally:
+        server._sequencer = previous_sequencer
+
+    expected = [f"item-{n}" for n in range(writes)]
+    return {
+        "elapsed": elapsed,
+        "throughput": len(calls) / elapsed,
+        "overlaps": stub.overlaps,
+        "in_order": all(stub.applied[f"list-{i}"] == expected for i in range(lists)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lists", type=int, default=50, help="Number of lists written to")
+    parser.add_argument("--writes", type=int, default=20, help="Writes per list")
+    parser.add_argument(
+        "--latency", type=float, default=5.0, help="Simulated upstream ms per write"
+    )
+    args = parser.parse_args()
+
+    latency = args.latency / 1000
+    total = args.lists * args.writes
+    print(f"{total} writes: {args.lists} list(s) x {args.writes}, {args.latency:g} ms latency")
+    print(f"{'sequencer':<12} {'elapsed s':>10} {'writes/s':>10} {'overlaps':>9} {'in order':>9}")
+    for label, sequencer in (("per-list", ListSequencer()), ("global", GlobalSequencer())):
+        result = asyncio.run(run(args.lists, args.writes, latency, sequencer))
+        print(
+            f"{label:<12} {result['elapsed']:>10.2f} {result['throughput']:>10.0f} "
+            f"{result['overlaps']:>9} {str(result['in_order']):>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Session state helpers for the Bring! MCP Server
+
+Exports the authenticated state of a logged-in Bring client and restores it
+into a fresh client, so another process can reuse a login instead of
+performing its own. Sessions can also be persisted in an encrypted file
+(requires the optional ``cryptography`` package).
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import secrets
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Request headers that carry the authenticated identity
+AUTH_HEADERS = (
+    "Authorization",
+    "X-BRING-USER-UUID",
+    "X-BRING-PUBLIC-USER-UUID",
+    "X-BRING-COUNTRY",
+)
+
+# Do not hand out tokens that are about to expire
+EXPIRY_MARGIN_SECONDS = 60.0
+
+
+def export_session(bring: Any) -> Dict[str, Any]:
+    """Capture the authenticated state of a logged-in client."""
+    return {
+        "mail": bring.mail,
+        "uuid": bring.uuid,
+        "public_uuid": bring.public_uuid,
+        "headers": {key: bring.headers[key] for key in AUTH_HEADERS if key in bring.headers},
+        # bring_api keeps the refresh token private
+        "refresh_token": getattr(bring, "_Bring__refresh_token", None),
+        "expires_at": bring._expires_at,
+        "user_locale": bring.user_locale,
+        "user_list_settings": bring.user_list_settings,
+    }
+
+
+def session_valid(state: Optional[Dict[str, Any]], mail: str) -> bool:
+    """Check that a session belongs to this account and is not (nearly) expired."""
+    if not state or state.get("mail") != mail:
+        return False
+    expires_at = state.get("expires_at") or 0
+    return expires_at - EXPIRY_MARGIN_SECONDS > time.time()
+
+
+async def restore_session(bring: Any, state: Dict[str, Any]) -> bool:
+    """Apply an exported session to a fresh client; return False if it is unusable."""
+    if not session_valid(state, bring.mail):
+        return False
+
+    bring.uuid = state["uuid"]
+    bring.public_uuid = state["public_uuid"]
+    bring.headers.update(state["headers"])
+    bring._Bring__refresh_token = state.get("refresh_token")
+    # The setter takes seconds from now
+    bring._expires_at = state["expires_at"] - time.time()
+    bring.user_locale = state["user_locale"]
+    bring.user_list_settings = state.get("user_list_settings") or {}
+
+    # Article translations come from files bundled with bring_api
+    await bring.reload_article_translations()
+    return True
+
+
+def write_handoff(state: Dict[str, Any]) -> str:
+    """Write a session for child processes to a new owner-only file; returns its path.
+
+    Only the path is passed on (e.g. in the environment), so the tokens never
+    show up in process environments or reach unrelated subprocesses.
+    """
+    # mkstemp creates the file readable by the owner only
+    fd, path = tempfile.mkstemp(prefix="bring-session-", suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(state, f)
+    return path
+
+
+def read_handoff(path: str) -> Optional[Dict[str, Any]]:
+    """Read a session written by ``write_handoff``; None if it is gone or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable session hand-off {path}: {type(e).__name__}")
+        return None
+
+
+class SessionStore:
+    """Encrypted on-disk store for one Bring! session.
+
+    The encryption key is derived from the account password with scrypt, so
+    the file is useless without the credentials and a password change
+    invalidates it.
+    """
+
+    def __init__(self, path: Path, password: str):
+        try:
+            from cryptography.fernet import Fernet, InvalidToken
+        except ImportError:
+            raise ImportError(
+                "cryptography package is required for session persistence. "
+                "Install it with: pip install bring-mcp-server[session]"
+            )
+
+        self.path = Path(path)
+        self._password = password
+        self._fernet_class = Fernet
+        self._invalid_token = InvalidToken
+
+    def _fernet(self, salt: bytes) -> Any:
+        key = hashlib.scrypt(
+            self._password.encode("utf-8"), salt=salt, n=2**14, r=8, p=1, dklen=32
+        )
+        return self._fernet_class(base64.urlsafe_b64encode(key))
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the stored session, or None if missing or undecryptable."""
+        try:
+            envelope = json.loads(self.path.read_text())
+            salt = base64.b64decode(envelope["salt"])
+            plaintext = self._fernet(salt).decrypt(envelope["token"].encode("ascii"))
+            return json.loads(plaintext)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, self._invalid_token) as e:
+            logger.warning(f"Ignoring unreadable session store {self.path}: {type(e).__name__}")
+            return None
+
+    def save(self, state: Dict[str, Any]) -> None:
+        """Encrypt and atomically write a session."""
+        salt = secrets.token_bytes(16)
+        token = self._fernet(salt).encrypt(json.dumps(state).encode("utf-8"))
+        envelope = {"salt": base64.b64encode(salt).decode("ascii"), "token": token.decode("ascii")}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            # mkstemp already creates the file readable by the owner only
+            with os.fdopen(fd, "w") as f:
+                json.dump(envelope, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def clear(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
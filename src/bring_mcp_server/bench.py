@@ -0,0 +1,329 @@
+"""
+Load generator for the Bring! MCP Server
+
+Starts N simulated MCP clients that speak the real protocol (initialize,
+tools/call) to the server over in-memory streams, against a stub Bring!
+backend with optional simulated latency. Reports throughput, latency
+percentiles per tool and upstream call amplification (Bring! API calls per
+tool call).
+
+Usage:
+    bring-mcp-server bench --clients 20 --calls 50 --mix read-heavy
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from .replay import ReplayReport
+
+# Relative weights of the tools each simulated client calls
+MIXES: Dict[str, Dict[str, int]] = {
+    "read-heavy": {
+        "bring_get_lists": 2,
+        "bring_get_list_items": 6,
+        "bring_get_list_details": 1,
+        "bring_add_item": 1,
+    },
+    "write-heavy": {
+        "bring_get_list_items": 2,
+        "bring_add_item": 3,
+        "bring_complete_item": 2,
+        "bring_remove_item": 1,
+        "bring_batch_update_items": 1,
+        "bring_sync_list": 1,
+    },
+    "catalog-heavy": {
+        "bring_get_item_details": 4,
+        "bring_get_all_item_details": 2,
+        "bring_add_item": 3,
+        "bring_get_list_items": 1,
+    },
+}
+
+THEME = "ch.publisheria.bring.theme.home"
+
+SECTIONS = ("Fruits & Vegetables", "Bread & Pastries", "Dairy", "Meat & Fish", "Household")
+
+# Fallback when bring_api's bundled article translations are unavailable
+FALLBACK_LOCALES = ("de-DE", "en-US", "fr-FR")
+
+
+def _load_articles(size: int) -> Dict[str, Dict[str, str]]:
+    """Up to ``size`` item ids with their names per locale, from bring_api's bundled files."""
+    try:
+        import bring_api
+
+        locales_dir = Path(bring_api.__file__).parent / "locales"
+        articles = {
+            path.stem.split(".", 1)[1]: json.loads(path.read_text(encoding="utf-8"))
+            for path in sorted(locales_dir.glob("articles.*.json"))
+        }
+    except (ImportError, OSError, ValueError):
+        articles = {}
+
+    if not articles:
+        item_ids = [f"Item {i}" for i in range(size)]
+        return {locale: {i: f"{i} ({locale})" for i in item_ids} for locale in FALLBACK_LOCALES}
+
+    item_ids = sorted(next(iter(articles.values())))[:size]
+    return {locale: {i: names.get(i, i) for i in item_ids} for locale, names in articles.items()}
+
+
+class StubBring:
+    """In-memory Bring! backend: lists keep their state, every call is counted."""
+
+    def __init__(
+        self,
+        lists: int = 5,
+        items_per_list: int = 20,
+        catalog_size: int = 300,
+        latency: float = 0.0,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.calls: Counter = Counter()
+        self.user_locale = "de-DE"
+
+        articles = _load_articles(catalog_size)
+        self.locales = list(articles)
+        self.item_ids = list(next(iter(articles.values())))
+        self.catalog = [
+            {
+                "itemId": item_id,
+                "imagePath": f"{item_id.lower().replace(' ', '_')}.png",
+                "section": SECTIONS[n % len(SECTIONS)],
+                "translations": {locale: names[item_id] for locale, names in articles.items()},
+            }
+            for n, item_id in enumerate(self.item_ids)
+        ]
+
+        rng = random.Random(seed)
+        per_list = min(items_per_list, len(self.item_ids))
+        self.list_uuids = [f"bench-list-{n}" for n in range(lists)]
+        self.purchase: Dict[str, Dict[str, str]] = {
+            list_uuid: {item_id: "" for item_id in rng.sample(self.item_ids, per_list)}
+            for list_uuid in self.list_uuids
+        }
+        self.recently: Dict[str, Dict[str, str]] = {list_uuid: {} for list_uuid in self.list_uuids}
+
+    @property
+    def upstream_calls(self) -> int:
+        return sum(self.calls.values())
+
+    async def _upstream(self, method: str) -> None:
+        self.calls[method] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def load_lists(self) -> Any:
+        await self._upstream("load_lists")
+        return SimpleNamespace(lists=[
+            SimpleNamespace(listUuid=list_uuid, name=f"List {n}", theme=THEME)
+            for n, list_uuid in enumerate(self.list_uuids)
+        ])
+
+    async def get_list(self, list_uuid: str) -> Any:
+        await self._upstream("get_list")
+
+        def entries(items: Dict[str, str]) -> List[Any]:
+            return [
+                SimpleNamespace(itemId=item_id, specification=spec, uuid=f"{list_uuid}-{item_id}")
+                for item_id, spec in items.items()
+            ]
+
+        return SimpleNamespace(items=SimpleNamespace(
+            purchase=entries(self.purchase[list_uuid]),
+            recently=entries(self.recently[list_uuid]),
+        ))
+
+    async def get_list_details(self, list_uuid: str) -> Any:
+        await self._upstream("get_list_details")
+        return SimpleNamespace(listUuid=list_uuid, name=list_uuid, theme=THEME)
+
+    async def get_user_account(self) -> Any:
+        await self._upstream("get_user_account")
+        return SimpleNamespace(
+            email="bench@example.com", userUuid="bench-user", name="Bench", photoPath=""
+        )
+
+    async def get_items_details(self, locale: Optional[str] = None) -> Any:
+        await self._upstream("get_items_details")
+        return [dict(item) for item in self.catalog]
+
+    def _apply(self, list_uuid: str, item_id: str, spec: str, operation: str) -> None:
+        self.purchase[list_uuid].pop(item_id, None)
+        self.recently[list_uuid].pop(item_id, None)
+        if operation == "TO_PURCHASE":
+            self.purchase[list_uuid][item_id] = spec
+        elif operation == "TO_RECENTLY":
+            self.recently[list_uuid][item_id] = spec
+
+    async def save_item(self, list_uuid: str, item_id: str, spec: str = "") -> None:
+        await self._upstream("save_item")
+        self._apply(list_uuid, item_id, spec, "TO_PURCHASE")
+
+    async def complete_item(self, list_uuid: str, item_id: str) -> None:
+        await self._upstream("complete_item")
+        self._apply(list_uuid, item_id, self.purchase[list_uuid].get(item_id, ""), "TO_RECENTLY")
+
+    async def remove_item(self, list_uuid: str, item_id: str) -> None:
+        await self._upstream("remove_item")
+        self._apply(list_uuid, item_id, "", "REMOVE")
+
+    async def batch_update_list(self, list_uuid: str, items: Any, operation: Any = None) -> None:
+        await self._upstream("batch_update_list")
+        for item in items if isinstance(items, list) else [items]:
+            item_operation = item.get("operation", operation)
+            self._apply(
+                list_uuid,
+                item["itemId"],
+                item.get("spec", ""),
+                str(getattr(item_operation, "value", item_operation) or "TO_PURCHASE"),
+            )
+
+
+def make_arguments(tool: str, stub: StubBring, rng: random.Random) -> Dict[str, Any]:
+    """Plausible arguments for a tool call against the stub backend."""
+    list_uuid = rng.choice(stub.list_uuids)
+    item_id = rng.choice(stub.item_ids)
+    locale = rng.choice(stub.locales)
+
+    if tool in ("bring_get_list_items", "bring_get_list_details"):
+        arguments: Dict[str, Any] = {"list_uuid": list_uuid}
+        if tool == "bring_get_list_items" and rng.random() < 0.5:
+            arguments["group_by_section"] = True
+        return arguments
+    if tool == "bring_add_item":
+        # Localized names exercise the catalog lookup
+        name = stub.catalog[stub.item_ids.index(item_id)]["translations"][locale]
+        return {"list_uuid": list_uuid, "item_name": name}
+    if tool in ("bring_complete_item", "bring_remove_item"):
+        active = list(stub.purchase[list_uuid]) or [item_id]
+        return {"list_uuid": list_uuid, "item_name": rng.choice(active)}
+    if tool == "bring_batch_update_items":
+        items = [{"itemId": i} for i in rng.sample(stub.item_ids, 3)]
+        operation = rng.choice(["ADD", "COMPLETE"])
+        return {"list_uuid": list_uuid, "items": items, "operation": operation}
+    if tool == "bring_sync_list":
+        items = [{"itemId": i} for i in rng.sample(stub.item_ids, 10)]
+        return {"list_uuid": list_uuid, "items": items, "unwanted": "keep"}
+    if tool == "bring_get_item_details":
+        return {"item_ids": rng.sample(stub.item_ids, 3), "locale": locale}
+    if tool == "bring_get_all_item_details":
+        return {"locale": locale}
+    return {}
+
+
+async def _run_client(
+    index: int,
+    calls: int,
+    mix: Dict[str, int],
+    stub: StubBring,
+    seed: int,
+    report: ReplayReport,
+) -> None:
+    import anyio
+    from mcp.client.session import ClientSession
+    from mcp.shared.memory import create_client_server_memory_streams
+
+    from . import server
+
+    rng = random.Random(seed * 1000 + index)
+    tools = list(mix)
+    weights = list(mix.values())
+
+    async with create_client_server_memory_streams() as (client_streams, server_streams):
+        async with anyio.create_task_group() as tg:
+            # One server session per client, as with separate stdio connections
+            tg.start_soon(
+                server.app.run,
+                server_streams[0],
+                server_streams[1],
+                server.create_initialization_options(),
+            )
+            async with ClientSession(client_streams[0], client_streams[1]) as session:
+                await session.initialize()
+                for _ in range(calls):
+                    tool = rng.choices(tools, weights)[0]
+                    arguments = make_arguments(tool, stub, rng)
+
+                    t0 = time.perf_counter()
+                    result = await session.call_tool(tool, arguments)
+                    report.latencies[tool].append(time.perf_counter() - t0)
+
+                    text = getattr(result.content[0], "text", "") if result.content else ""
+                    if result.isError or text.startswith("Error:"):
+                        report.errors += 1
+            tg.cancel_scope.cancel()
+
+
+async def bench(
+    clients: int = 10,
+    calls: int = 50,
+    mix: str = "read-heavy",
+    latency: float = 0.0,
+    lists: int = 5,
+    seed: int = 0,
+) -> ReplayReport:
+    """Drive the server with simulated MCP clients; returns the collected report."""
+    from . import server
+
+    stub = StubBring(lists=lists, latency=latency, seed=seed)
+    report = ReplayReport()
+
+    with server.stand_in_client(stub):
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            _run_client(index, calls, MIXES[mix], stub, seed, report)
+            for index in range(clients)
+        ))
+        report.elapsed = time.perf_counter() - start
+
+    report.upstream_calls = stub.upstream_calls
+    return report
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--clients", type=int, default=10, help="Concurrent MCP clients")
+    parser.add_argument("--calls", type=int, default=50, help="Tool calls per client")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="read-heavy", help="Tool mix")
+    parser.add_argument(
+        "--latency", type=float, default=0.0,
+        help="Simulated Bring! API latency per call in milliseconds",
+    )
+    parser.add_argument("--lists", type=int, default=5, help="Shopping lists in the stub backend")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the call sequence")
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run the benchmark from parsed command line arguments and print the report."""
+    from . import runtime
+
+    report = runtime.run(bench(
+        clients=args.clients,
+        calls=args.calls,
+        mix=args.mix,
+        latency=args.latency / 1000,
+        lists=args.lists,
+        seed=args.seed,
+    ), loop=getattr(args, "loop", "auto"), eager_tasks=getattr(args, "eager_tasks", False))
+    print(f"Mix: {args.mix}  Clients: {args.clients}  Calls per client: {args.calls}")
+    print(report.format())
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Load test the Bring! MCP server")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
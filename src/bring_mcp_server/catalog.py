@@ -0,0 +1,242 @@
+"""
+Catalog helpers for the Bring! MCP Server
+
+Builds lookup structures from the item catalog returned by
+``get_items_details`` so tools can resolve user-typed names and store
+sections locally, and keeps cached catalogs in a compact form: slotted entries, interned strings
+and translation tables shared across locales.
+"""
+
+import sys
+import unicodedata
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Joins the translated names of one entry (ASCII unit separator)
+_SEPARATOR = "\x1f"
+
+
+def _get(obj: Any, key: str, default: Any = None) -> Any:
+    """Read an attribute or dict key (catalog entries may be either)."""
+    if hasattr(obj, key):
+        return getattr(obj, key)
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return default
+
+
+def section_of(item: Any) -> Optional[str]:
+    """Store section of a catalog item (display name, falling back to the id)."""
+    return _get(item, "section") or _get(item, "sectionId") or None
+
+
+def normalize_name(name: str) -> str:
+    """Fold case and strip diacritics so 'Käse' and 'kase' compare equal."""
+    decomposed = unicodedata.normalize("NFKD", name.strip())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
+
+
+class TranslationIndex:
+    """Reverse index from normalized (translated) item names to catalog itemIds."""
+
+    def __init__(self, items: Iterable[Any]):
+        self._index: Dict[str, str] = {}
+
+        for item in items:
+            item_id = _get(item, "itemId")
+            if not item_id:
+                continue
+
+            # Canonical ids win over translations that happen to collide with them
+            self._index[normalize_name(item_id)] = item_id
+
+            translations = _get(item, "translations", {}) or {}
+            for translated in translations.values():
+                if translated:
+                    self._index.setdefault(normalize_name(translated), item_id)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Return the canonical itemId for a name, or None if it is not in the catalog."""
+        return self._index.get(normalize_name(name))
+
+    def canonicalize(self, name: str) -> str:
+        """Return the canonical itemId for a name, falling back to the name itself."""
+        return self.resolve(name) or name
+
+
+class SectionIndex:
+    """Item -> store section lookup, with sections in catalog order (as in the Bring! app)."""
+
+    # Heading for items the catalog does not know (custom items)
+    OTHER = "Other"
+
+    def __init__(self, items: Iterable[Any]):
+        self._by_id: Dict[str, Tuple[int, str]] = {}
+        self._by_name: Dict[str, Tuple[int, str]] = {}
+        translated: Dict[str, Tuple[int, str]] = {}
+        positions: Dict[str, int] = {}
+
+        for item in items:
+            item_id = _get(item, "itemId")
+            section = section_of(item)
+            if not item_id or not section:
+                continue
+
+            entry = (positions.setdefault(section, len(positions)), section)
+            self._by_id.setdefault(item_id, entry)
+            self._by_name.setdefault(normalize_name(item_id), entry)
+
+            # bring_api returns list items translated into the list's language
+            translations = _get(item, "translations", {}) or {}
+            for name in translations.values():
+                if name:
+                    translated.setdefault(normalize_name(name), entry)
+
+        # Canonical ids win over translations that happen to collide with them
+        for name, entry in translated.items():
+            self._by_name.setdefault(name, entry)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def _lookup(self, item_id: str) -> Optional[Tuple[int, str]]:
+        # Lists in the catalog's language carry canonical ids, so the exact lookup
+        # usually hits; other lists resolve through their translated names
+        entry = self._by_id.get(item_id)
+        if entry is None:
+            entry = self._by_name.get(normalize_name(item_id))
+        return entry
+
+    def section(self, item_id: str) -> Optional[str]:
+        """Return the store section of an item, or None if it is not in the catalog."""
+        entry = self._lookup(item_id)
+        return entry[1] if entry else None
+
+    def group(self, items: Iterable[Any]) -> List[Tuple[str, List[Any]]]:
+        """Group list items by section, sections in catalog order and unknown items last."""
+        groups: Dict[Tuple[int, str], List[Any]] = {}
+        other: List[Any] = []
+
+        for item in items:
+            item_id = _get(item, "itemId") or _get(item, "name") or ""
+            entry = self._lookup(item_id) if item_id else None
+            if entry is None:
+                other.append(item)
+            else:
+                groups.setdefault(entry, []).append(item)
+
+        grouped = [(section, group) for (_, section), group in sorted(groups.items())]
+        if other:
+            grouped.append((self.OTHER, other))
+        return grouped
+
+
+class CompactTranslations(Mapping):
+    """Read-only locale -> name mapping packed into a single string.
+
+    The locale -> position layout is shared by every entry with the same set
+    of locales, and all names of an entry live in one separator-joined string
+    instead of one object per name.
+    """
+
+    __slots__ = ("_layout", "_packed")
+
+    def __init__(self, layout: Dict[str, int], packed: str):
+        self._layout = layout
+        self._packed = packed
+
+    def __getitem__(self, locale: str) -> str:
+        return self._packed.split(_SEPARATOR)[self._layout[locale]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout)
+
+    def __len__(self) -> int:
+        return len(self._layout)
+
+    def values(self) -> Any:
+        return self._packed.split(_SEPARATOR) if self._layout else []
+
+    def items(self) -> Any:
+        return list(zip(self._layout, self.values()))
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class CatalogEntry:
+    """Compact catalog item, attribute-compatible with the bring_api objects."""
+
+    __slots__ = ("itemId", "imagePath", "section", "translations")
+
+    def __init__(
+        self,
+        item_id: str,
+        image_path: Optional[str],
+        translations: CompactTranslations,
+        section: Optional[str] = None,
+    ):
+        self.itemId = item_id
+        self.imagePath = image_path
+        self.section = section
+        self.translations = translations
+
+    def __repr__(self) -> str:
+        return f"CatalogEntry({self.itemId!r})"
+
+
+class CatalogPool:
+    """Interning pool shared by the cached catalogs of all locales (and accounts)."""
+
+    def __init__(self) -> None:
+        self._layouts: Dict[Tuple[str, ...], Dict[str, int]] = {}
+        self._translations: Dict[Tuple[int, str], CompactTranslations] = {}
+        self._entries: Dict[Tuple[str, Optional[str], Optional[str], int], CatalogEntry] = {}
+
+    def _intern(self, value: Any) -> Any:
+        return sys.intern(value) if isinstance(value, str) else value
+
+    def _compact_translations(self, translations: Any) -> CompactTranslations:
+        pairs = sorted((translations or {}).items())
+        locales = tuple(locale for locale, _ in pairs)
+
+        layout = self._layouts.get(locales)
+        if layout is None:
+            layout = {self._intern(locale): i for i, locale in enumerate(locales)}
+            self._layouts[tuple(layout)] = layout
+
+        # Rows are shared across locales: each locale's catalog repeats the same names
+        packed = _SEPARATOR.join(str(name or "") for _, name in pairs)
+        key = (id(layout), packed)
+        compact = self._translations.get(key)
+        if compact is None:
+            compact = self._translations[key] = CompactTranslations(layout, packed)
+        return compact
+
+    def compact(self, items: Iterable[Any]) -> List[CatalogEntry]:
+        """Convert raw catalog items into shared, slotted entries."""
+        entries = []
+        for item in items:
+            item_id = self._intern(_get(item, "itemId"))
+            image_path = self._intern(_get(item, "imagePath"))
+            section = self._intern(section_of(item))
+            translations = self._compact_translations(_get(item, "translations", {}))
+
+            # The same item in another locale's catalog is usually identical
+            key = (item_id, image_path, section, id(translations))
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = CatalogEntry(
+                    item_id, image_path, translations, section
+                )
+            entries.append(entry)
+        return entries
+
+    def clear(self) -> None:
+        self._layouts.clear()
+        self._translations.clear()
+        self._entries.clear()
@@ -0,0 +1,79 @@
+"""
+Tool deadlines for the Bring! MCP Server
+
+Every tool call runs under a deadline (``BRING_TOOL_TIMEOUT``, overridable
+per tool via ``BRING_TOOL_TIMEOUTS``). When it passes, the handler task is
+cancelled, which also cancels its in-flight Bring! requests and releases
+their pooled connections.
+"""
+
+import asyncio
+import os
+from typing import Awaitable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_TOOL_TIMEOUT = 45.0
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """A tool call did not finish within its deadline."""
+
+    def __init__(self, tool: str, seconds: float):
+        super().__init__(f"{tool} did not finish within {seconds:g}s")
+        self.tool = tool
+        self.seconds = seconds
+
+
+class Deadlines:
+    """Per-tool deadlines in seconds (0 or less disables the deadline)."""
+
+    def __init__(
+        self,
+        default: float = DEFAULT_TOOL_TIMEOUT,
+        overrides: Optional[Dict[str, float]] = None,
+    ):
+        self.default = default
+        self.overrides = dict(overrides or {})
+
+    def for_tool(self, tool: str) -> float:
+        return self.overrides.get(tool, self.default)
+
+    async def run(self, tool: str, awaitable: Awaitable[T]) -> T:
+        """Await a tool handler, cancelling it once the tool's deadline has passed."""
+        seconds = self.for_tool(tool)
+        if seconds <= 0:
+            return await awaitable
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + seconds
+        try:
+            if hasattr(asyncio, "timeout_at"):
+                # Python 3.11+: cancels the current task, so tracing and profiling stay attached
+                async with asyncio.timeout_at(deadline):
+                    return await awaitable
+            return await asyncio.wait_for(awaitable, seconds)
+        except asyncio.TimeoutError:
+            # Upstream (aiohttp) timeouts inside the deadline are reported as they are
+            if loop.time() >= deadline:
+                raise DeadlineExceeded(tool, seconds) from None
+            raise
+
+
+def parse_overrides(value: str) -> Dict[str, float]:
+    """Parse ``tool=seconds,tool=seconds``."""
+    overrides = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        tool, sep, seconds = part.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid tool timeout '{part}', expected tool=seconds")
+        overrides[tool.strip()] = float(seconds)
+    return overrides
+
+
+def deadlines_from_env() -> Deadlines:
+    """Create deadlines from BRING_TOOL_TIMEOUT and BRING_TOOL_TIMEOUTS."""
+    default = float(os.getenv("BRING_TOOL_TIMEOUT", DEFAULT_TOOL_TIMEOUT))
+    return Deadlines(default, parse_overrides(os.getenv("BRING_TOOL_TIMEOUTS", "")))
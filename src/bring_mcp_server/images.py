@@ -0,0 +1,197 @@
+"""
+Item image cache for the Bring! MCP Server
+
+Images are stored content-addressed (by SHA-256) on disk, with a small
+index mapping source URLs to digests. The cache is bounded in size and
+evicts least recently used images first. Methods do blocking file I/O and
+are safe to call from worker threads. Processes sharing a cache directory
+merge their index updates under a file lock.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: index updates are not locked across processes
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Image data: bytes, or a read-only view of a memory-mapped file
+ImageData = Union[bytes, memoryview]
+
+
+class ImageCache:
+    """Size-bounded, content-addressed on-disk cache with LRU eviction."""
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES, use_mmap: bool = False):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.use_mmap = use_mmap
+
+        self._objects_dir = self.directory / "objects"
+        self._index_path = self.directory / "index.json"
+        self._index_lock_path = self.directory / "index.lock"
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+
+        # url -> (digest, mime type)
+        self._index: Dict[str, Tuple[str, str]] = {}
+        # digest -> size, least recently used first
+        self._lru: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self._load()
+
+    def _object_path(self, digest: str) -> Path:
+        return self._objects_dir / digest[:2] / digest
+
+    def _load(self) -> None:
+        """Rebuild LRU state from the files on disk (mtime = last use)."""
+        objects = []
+        for path in self._objects_dir.glob("*/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            objects.append((stat.st_mtime, path.name, stat.st_size))
+
+        for _, digest, size in sorted(objects):
+            self._lru[digest] = size
+            self._total_bytes += size
+
+        self._index = {
+            url: entry for url, entry in self._read_index().items() if entry[0] in self._lru
+        }
+
+    def _read_index(self) -> Dict[str, Tuple[str, str]]:
+        try:
+            raw = json.loads(self._index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return {url: (entry[0], entry[1]) for url, entry in raw.items() if entry}
+
+    @contextmanager
+    def _locked_index(self) -> Iterator[None]:
+        """Exclude other processes from updating the index file."""
+        with open(self._index_lock_path, "a") as f:
+            if fcntl is not None:
+                # Released when the file is closed
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            yield
+
+    def _merge_index(self, entries: Dict[str, Tuple[str, str]]) -> None:
+        """Adopt URLs other processes cached since we read the index; ours win."""
+        for url, (digest, mime_type) in entries.items():
+            if url in self._index:
+                continue
+            if digest not in self._lru:
+                try:
+                    size = self._object_path(digest).stat().st_size
+                except OSError:
+                    # Evicted since it was indexed
+                    continue
+                self._lru[digest] = size
+                self._lru.move_to_end(digest, last=False)
+                self._total_bytes += size
+            self._index[url] = (digest, mime_type)
+
+    def _save_index(self) -> None:
+        """Merge the index on disk into ours, evict, and write the result."""
+        with self._locked_index():
+            self._merge_index(self._read_index())
+            self._evict()
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, self._index_path)
+
+    def _read(self, path: Path) -> ImageData:
+        with open(path, "rb") as f:
+            if not self.use_mmap:
+                return f.read()
+            if os.fstat(f.fileno()).st_size == 0:
+                return b""
+            # No copy: pages are read as the caller consumes the view, and the
+            # mapping is released with the last reference to it
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def get(self, url: str) -> Optional[Tuple[ImageData, str]]:
+        """Return (data, mime type) for a cached URL, or None on a miss."""
+        with self._lock:
+            return self._get(url)
+
+    def _get(self, url: str) -> Optional[Tuple[ImageData, str]]:
+        entry = self._index.get(url)
+        if entry is None:
+            return None
+
+        digest, mime_type = entry
+        path = self._object_path(digest)
+        try:
+            data = self._read(path)
+            os.utime(path)
+        except OSError:
+            # File vanished underneath us; treat as a miss
+            self._forget(digest)
+            return None
+
+        self._lru.move_to_end(digest)
+        return data, mime_type
+
+    def put(self, url: str, data: bytes, mime_type: str) -> str:
+        """Store image data for a URL and return its content digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self._put(url, digest, data, mime_type)
+        return digest
+
+    def _put(self, url: str, digest: str, data: bytes, mime_type: str) -> None:
+        path = self._object_path(digest)
+
+        if digest not in self._lru:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._lru[digest] = len(data)
+            self._total_bytes += len(data)
+        else:
+            os.utime(path)
+            self._lru.move_to_end(digest)
+
+        self._index[url] = (digest, mime_type)
+        self._save_index()
+
+    def _forget(self, digest: str) -> None:
+        self._total_bytes -= self._lru.pop(digest, 0)
+        for url in [u for u, entry in self._index.items() if entry[0] == digest]:
+            del self._index[url]
+
+    def _evict(self) -> None:
+        # Always keep the most recent image, even if it alone exceeds the limit
+        while self._total_bytes > self.max_bytes and len(self._lru) > 1:
+            digest = next(iter(self._lru))
+            try:
+                self._object_path(digest).unlink()
+            except OSError as e:
+                logger.warning(f"Failed to evict cached image {digest}: {e}")
+            self._forget(digest)
+            logger.debug(f"Evicted cached image {digest}")
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
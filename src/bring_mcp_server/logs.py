@@ -0,0 +1,234 @@
+"""
+Logging pipeline for the Bring! MCP Server
+
+Log calls only put records on a bounded queue; a background thread formats
+them and writes them to stderr, so a slow stderr pipe of the MCP host never
+blocks the event loop. Records carry the tool call's key-value fields (tool,
+list_uuid, latency_ms), high-volume loggers can be sampled, and records that
+do not fit in the queue are dropped and counted instead of waiting.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+from .metrics import Metrics
+
+DEFAULT_QUEUE_SIZE = 10000
+
+# Structured fields appended to every record that has them
+FIELDS = ("tool", "list_uuid", "latency_ms")
+
+_log_fields: ContextVar[Dict[str, Any]] = ContextVar("bring_log_fields", default={})
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[None]:
+    """Attach key-value fields to all records logged in the block (and its tasks)."""
+    fields = {name: value for name, value in fields.items() if value is not None}
+    token = _log_fields.set({**_log_fields.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_fields.reset(token)
+
+
+def _render_value(value: Any) -> str:
+    if isinstance(value, float):
+        value = f"{value:.1f}"
+    text = str(value)
+    if not text or any(c in text for c in ' ="'):
+        text = '"' + text.replace('"', '\\"') + '"'
+    return text
+
+
+class KeyValueFormatter(logging.Formatter):
+    """Formats records as usual, followed by their structured ``key=value`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        fields = [
+            f"{name}={_render_value(getattr(record, name))}"
+            for name in FIELDS
+            if getattr(record, name, None) is not None
+        ]
+        return f"{text} {' '.join(fields)}" if fields else text
+
+
+class ContextFilter(logging.Filter):
+    """Copies the current log context onto records (runs in the calling thread)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for name, value in _log_fields.get().items():
+            if not hasattr(record, name):
+                setattr(record, name, value)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a fraction of the records of high-volume loggers; warnings always pass."""
+
+    def __init__(self, rates: Dict[str, float], metrics: Metrics):
+        super().__init__()
+        self.rates = rates
+        self.metrics = metrics
+        self._seen: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _rate(self, logger_name: str) -> Optional[str]:
+        # The most specific configured logger wins
+        for prefix in sorted(self.rates, key=len, reverse=True):
+            if logger_name == prefix or logger_name.startswith(prefix + "."):
+                return prefix
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        prefix = self._rate(record.name)
+        if prefix is None:
+            return True
+
+        # Deterministic: keep a record whenever the kept share falls below the rate
+        rate = self.rates[prefix]
+        with self._lock:
+            seen = self._seen[prefix]
+            self._seen[prefix] += 1
+        if int((seen + 1) * rate) > int(seen * rate):
+            return True
+        self.metrics.increment("log_records_dropped_total", reason="sampled")
+        return False
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Queue handler that drops (and counts) records when the queue is full."""
+
+    def __init__(self, log_queue: "queue.Queue[Any]", metrics: Metrics):
+        super().__init__(log_queue)
+        self.metrics = metrics
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting happens on the listener thread; only merge the arguments
+        # now, as they may be mutated once the log call returns
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.metrics.increment("log_records_dropped_total", reason="overflow")
+
+
+class _StderrHandler(logging.StreamHandler):
+    """Writes to whatever ``sys.stderr`` is at the time of the write."""
+
+    def __init__(self) -> None:
+        super().__init__(sys.stderr)
+
+    @property  # type: ignore[override]
+    def stream(self) -> TextIO:
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value: TextIO) -> None:
+        pass
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # The queue may be full: wait for the thread to make room
+        self.queue.put(self._sentinel)
+
+
+class LogPipeline:
+    """Root logging through a bounded queue drained by a background writer thread."""
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        level: int = logging.INFO,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        sample_rates: Optional[Dict[str, float]] = None,
+        stream: Optional[TextIO] = None,
+    ):
+        self.metrics = metrics
+        self.level = level
+        self.queue_size = queue_size
+
+        self.writer = logging.StreamHandler(stream) if stream else _StderrHandler()
+        self.writer.setFormatter(KeyValueFormatter(logging.BASIC_FORMAT))
+
+        self._listener: Optional[QueueListener] = None
+        self._started = False
+        self._previous_level = logging.NOTSET
+        if queue_size > 0:
+            log_queue: "queue.Queue[Any]" = queue.Queue(queue_size)
+            self.handler: logging.Handler = BoundedQueueHandler(log_queue, metrics)
+            self._listener = _Listener(log_queue, self.writer)
+        else:
+            # Synchronous writes, for debugging
+            self.handler = self.writer
+        if sample_rates:
+            self.handler.addFilter(SamplingFilter(sample_rates, metrics))
+        self.handler.addFilter(ContextFilter())
+
+    def start(self) -> None:
+        """Install the pipeline on the root logger."""
+        root = logging.getLogger()
+        self._previous_level = root.level
+        root.setLevel(self.level)
+        root.addHandler(self.handler)
+        if self._listener is not None:
+            self._listener.start()
+        self._started = True
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Write out the queued records and remove the pipeline from the root logger."""
+        if not self._started:
+            return
+        self._started = False
+        atexit.unregister(self.stop)
+        root = logging.getLogger()
+        root.removeHandler(self.handler)
+        root.setLevel(self._previous_level)
+        if self._listener is not None:
+            self._listener.stop()
+        self.writer.flush()
+
+
+def parse_sample_rates(value: str) -> Dict[str, float]:
+    """Parse ``logger=rate,logger=rate`` (rates between 0 and 1)."""
+    rates = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        name, sep, rate = part.partition("=")
+        if not sep or not 0 <= float(rate) <= 1:
+            raise ValueError(f"Invalid log sample rate '{part}', expected logger=rate (0-1)")
+        rates[name.strip()] = float(rate)
+    return rates
+
+
+def log_pipeline_from_env(metrics: Metrics) -> LogPipeline:
+    """Create the logging pipeline from BRING_LOG_LEVEL, BRING_LOG_QUEUE and BRING_LOG_SAMPLE."""
+    level = logging.getLevelName(os.getenv("BRING_LOG_LEVEL", "INFO").upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level: {os.getenv('BRING_LOG_LEVEL')}")
+    return LogPipeline(
+        metrics,
+        level=level,
+        queue_size=int(os.getenv("BRING_LOG_QUEUE", DEFAULT_QUEUE_SIZE)),
+        sample_rates=parse_sample_rates(os.getenv("BRING_LOG_SAMPLE", "")),
+    )
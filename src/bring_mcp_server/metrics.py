@@ -0,0 +1,59 @@
+"""
+Metrics for the Bring! MCP Server
+
+Process-local counters and gauges with optional labels, rendered in the Prometheus
+text exposition format and served as the ``bring://metrics`` resource.
+"""
+
+import threading
+from collections import Counter
+from typing import Dict, Tuple
+
+METRICS_URI = "bring://metrics"
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _series(key: _Key) -> str:
+    name, labels = key
+    if not labels:
+        return name
+    rendered = ",".join(f'{label}="{value}"' for label, value in labels)
+    return f"{name}{{{rendered}}}"
+
+
+class Metrics:
+    """Thread-safe labelled counters and gauges."""
+
+    def __init__(self) -> None:
+        self._counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] += value
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        """Set a gauge to the current value."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = value
+
+    def get(self, name: str, **labels: str) -> float:
+        """Current value of one series (0 if it was never incremented)."""
+        with self._lock:
+            return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """All series keyed by their rendered name, e.g. ``tool_timeouts{tool="x"}``."""
+        with self._lock:
+            return {_series(key): value for key, value in sorted(self._counters.items())}
+
+    def render(self) -> str:
+        """Prometheus text format."""
+        return "".join(f"bring_{series} {value:g}\n" for series, value in self.snapshot().items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
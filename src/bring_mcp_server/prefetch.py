@@ -0,0 +1,191 @@
+"""
+Predictive prefetching for the Bring! MCP Server
+
+Sessions follow recognizable patterns: ``bring_get_lists``, then
+``bring_get_list_items`` on the same one or two lists, then often
+``bring_get_item_details``. A transition model (learned from the observed
+tool-call sequences, or a fixed policy) predicts the next tool, and the
+server starts its upstream fetch in the background so the follow-up call is
+answered from the prefetched result. Prefetches are bounded, cancellable,
+expire when unused and are counted as hits or waste in the metrics.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+# Fixed policy: tool -> tools that usually follow it
+DEFAULT_POLICY: Dict[str, Tuple[str, ...]] = {
+    "bring_get_lists": ("bring_get_list_items",),
+    "bring_get_list_items": ("bring_get_item_details",),
+}
+
+DEFAULT_MAX_INFLIGHT = 4
+DEFAULT_TTL = 10.0
+# Sessions whose last tool is remembered (stateless HTTP makes one per request)
+DEFAULT_MAX_SESSIONS = 1024
+
+# Returned by Prefetcher.take when nothing usable was prefetched
+MISS = object()
+
+
+class TransitionModel:
+    """Predicts the next tool of a session, learned from observed calls or from a policy."""
+
+    def __init__(
+        self,
+        policy: Optional[Mapping[str, Sequence[str]]] = None,
+        min_support: int = 3,
+        min_probability: float = 0.5,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+    ):
+        self.policy = policy
+        self.min_support = min_support
+        self.min_probability = min_probability
+        self.max_sessions = max_sessions
+
+        self._transitions: Dict[str, Counter] = defaultdict(Counter)
+        # Least recently active sessions first
+        self._last_tool: "OrderedDict[str, str]" = OrderedDict()
+        self._lists: Counter = Counter()
+
+    def observe(self, session: str, tool: str, list_uuid: Optional[str] = None) -> None:
+        """Record a served tool call."""
+        previous = self._last_tool.pop(session, None)
+        if previous is not None:
+            self._transitions[previous][tool] += 1
+        self._last_tool[session] = tool
+        while len(self._last_tool) > self.max_sessions:
+            self._last_tool.popitem(last=False)
+        if list_uuid:
+            self._lists[list_uuid] += 1
+
+    def predict(self, tool: str) -> List[str]:
+        """Tools likely to be called after ``tool``."""
+        if self.policy is not None:
+            return list(self.policy.get(tool, ()))
+
+        followers = self._transitions.get(tool)
+        if not followers:
+            return []
+        total = sum(followers.values())
+        if total < self.min_support:
+            return []
+        return [
+            follower for follower, count in followers.most_common()
+            if count / total >= self.min_probability
+        ]
+
+    def likely_lists(self, n: int = 2) -> List[str]:
+        """The lists this user works with most."""
+        return [list_uuid for list_uuid, _ in self._lists.most_common(n)]
+
+
+class Prefetcher:
+    """Runs speculative fetches in the background and hands out their results once."""
+
+    def __init__(
+        self,
+        model: TransitionModel,
+        metrics: Metrics,
+        max_inflight: int = DEFAULT_MAX_INFLIGHT,
+        ttl: float = DEFAULT_TTL,
+    ):
+        self.model = model
+        self.metrics = metrics
+        self.max_inflight = max_inflight
+        self.ttl = ttl
+        # key -> (task, expires_at); completed results stay until taken or expired
+        self._entries: Dict[str, Tuple["asyncio.Task[Any]", float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def inflight(self) -> int:
+        return sum(1 for task, _ in self._entries.values() if not task.done())
+
+    def _waste(self, key: str, reason: str) -> None:
+        task, _ = self._entries.pop(key)
+        if not task.done():
+            task.cancel()
+        self.metrics.increment("prefetch_wasted_total", reason=reason)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]:
+            self._waste(key, "expired")
+
+    def schedule(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> bool:
+        """Start fetching ``key`` in the background; False if skipped."""
+        self._expire()
+        if key in self._entries:
+            return False
+        if self.inflight >= self.max_inflight:
+            self.metrics.increment("prefetch_skipped_total")
+            return False
+
+        async def run() -> Any:
+            return await fetch()
+
+        task = asyncio.create_task(run(), name=f"bring-prefetch {key}")
+        task.add_done_callback(self._log_failure)
+        self._entries[key] = (task, time.monotonic() + self.ttl)
+        self.metrics.increment("prefetch_started_total")
+        return True
+
+    def _log_failure(self, task: "asyncio.Task[Any]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self.metrics.increment("prefetch_errors_total")
+            logger.debug(f"Prefetch {task.get_name()} failed: {task.exception()}")
+
+    async def take(self, key: str) -> Any:
+        """Return the prefetched result for ``key`` (waiting if still in flight), or MISS."""
+        self._expire()
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return MISS
+
+        task, _ = entry
+        try:
+            result = await task
+        except Exception:
+            # Already counted; the caller fetches again
+            return MISS
+
+        self.metrics.increment("prefetch_hits_total")
+        return result
+
+    def discard(self, key: str) -> None:
+        """Drop a prefetched result that is no longer valid (e.g. the list was modified)."""
+        if key in self._entries:
+            self._waste(key, "invalidated")
+
+    async def close(self) -> None:
+        """Cancel all in-flight prefetches."""
+        tasks = [task for task, _ in self._entries.values()]
+        for key in list(self._entries):
+            self._waste(key, "cancelled")
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def prefetcher_from_env(metrics: Metrics) -> Optional[Prefetcher]:
+    """Create a prefetcher if BRING_PREFETCH is 'learn' or 'policy'."""
+    mode = os.getenv("BRING_PREFETCH", "").lower()
+    if mode not in ("learn", "policy"):
+        return None
+
+    model = TransitionModel(DEFAULT_POLICY if mode == "policy" else None)
+    return Prefetcher(
+        model,
+        metrics,
+        max_inflight=int(os.getenv("BRING_PREFETCH_MAX", DEFAULT_MAX_INFLIGHT)),
+        ttl=float(os.getenv("BRING_PREFETCH_TTL", DEFAULT_TTL)),
+    )
@@ -0,0 +1,171 @@
+"""
+Sampling profiler for the Bring! MCP Server
+
+While tool calls are running, a background thread samples the event loop
+thread's stack and attributes each sample to the asyncio task (and thus the
+tool call) that is currently executing. The stacks of the slowest N calls
+are kept as collapsed ``frame;frame;frame count`` files, ready for
+flamegraph.pl, speedscope or inferno, written on the background writer
+thread.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .writer import BackgroundWriter, background_writer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.005
+
+
+class CallProfile:
+    """Stack samples collected during one tool call."""
+
+    __slots__ = ("label", "started", "duration", "samples", "path")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.samples: Counter = Counter()
+        self.path: Optional[Path] = None
+
+    def collapsed(self) -> str:
+        """Render samples in the collapsed-stack format used by flamegraph tools."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+def _collapse(frame: Any) -> str:
+    stack: List[str] = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(stack))
+
+
+class SamplingProfiler:
+    """Samples the event loop thread and keeps the stacks of the slowest calls."""
+
+    def __init__(
+        self,
+        slowest: int,
+        output_dir: Path,
+        interval: float = DEFAULT_INTERVAL,
+        writer: Optional[BackgroundWriter] = None,
+    ):
+        self.slowest = slowest
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.writer = writer or background_writer()
+
+        self._active: Dict[Any, CallProfile] = {}
+        self._kept: List[CallProfile] = []
+        self._lock = threading.Lock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="bring-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                if not self._active:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id)
+                task = asyncio.current_task(self._loop) if self._loop else None
+                profile = self._active.get(task)
+                if frame is not None and profile is not None:
+                    profile.samples[_collapse(frame)] += 1
+
+    @contextmanager
+    def profile(self, label: str) -> Iterator[CallProfile]:
+        """Sample the current task for the duration of the block."""
+        self._ensure_started()
+        task = asyncio.current_task()
+        profile = CallProfile(label)
+
+        with self._lock:
+            self._active[task] = profile
+        try:
+            yield profile
+        finally:
+            profile.duration = time.perf_counter() - profile.started
+            with self._lock:
+                self._active.pop(task, None)
+            self._keep_if_slow(profile)
+
+    def _keep_if_slow(self, profile: CallProfile) -> None:
+        if len(self._kept) >= self.slowest and profile.duration <= self._kept[-1].duration:
+            return
+
+        self._kept.append(profile)
+        self._kept.sort(key=lambda p: p.duration, reverse=True)
+        evicted = [old.path for old in self._kept[self.slowest:] if old.path is not None]
+        del self._kept[self.slowest:]
+
+        path = None
+        if profile in self._kept:
+            path = profile.path = self.output_dir / (
+                f"{profile.duration * 1000:010.1f}ms-{profile.label}-{id(profile):x}.folded"
+            )
+        self.writer.submit(self._write, profile, path, evicted)
+
+    def _write(self, profile: CallProfile, path: Optional[Path], evicted: List[Path]) -> None:
+        # Runs on the writer thread
+        for old in evicted:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+        if path is not None:
+            try:
+                path.write_text(profile.collapsed())
+            except OSError as e:
+                logger.warning(f"Failed to write profile: {e}")
+
+    @property
+    def slowest_calls(self) -> List[CallProfile]:
+        return list(self._kept)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.writer.flush()
+
+
+def profiler_from_env() -> Optional[SamplingProfiler]:
+    """Create a profiler if BRING_PROFILE_SLOWEST is set to a positive count."""
+    slowest = int(os.getenv("BRING_PROFILE_SLOWEST", "0") or 0)
+    if slowest <= 0:
+        return None
+
+    output_dir = os.getenv("BRING_PROFILE_DIR") or "bring-profiles"
+    interval_ms = float(os.getenv("BRING_PROFILE_INTERVAL_MS", DEFAULT_INTERVAL * 1000))
+    return SamplingProfiler(slowest, Path(output_dir), interval_ms / 1000)
@@ -0,0 +1,223 @@
+"""
+Traffic capture for the Bring! MCP Server
+
+When enabled, every ``call_tool`` invocation is appended to a JSONL file
+together with the Bring! API responses it triggered, so that real usage can
+be replayed later (see ``bring_mcp_server.replay``). Identifiers are hashed
+and credential-like values are removed before anything is written. Records
+are serialized and appended on the background writer thread.
+"""
+
+import dataclasses
+import enum
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+
+from .tracing import LIST_METHODS
+from .writer import BackgroundWriter, background_writer
+
+logger = logging.getLogger(__name__)
+
+# Argument keys whose values are replaced entirely
+SECRET_KEYS = frozenset({"password", "email", "mail", "token", "access_token", "refresh_token"})
+
+# Argument keys holding identifiers; hashed so replays keep them consistent
+ID_KEYS = frozenset({"list_uuid", "listUuid", "uuid", "userUuid", "publicUuid"})
+
+REDACTED = "<redacted>"
+
+# Marks a serialized object (as opposed to a plain dict) in recorded responses
+OBJECT_MARKER = "__object__"
+
+
+def hash_id(value: str) -> str:
+    """Stable, non-reversible stand-in for an identifier."""
+    return "id-" + hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
+def redact(value: Any, key: Optional[str] = None) -> Any:
+    """Redact secrets and hash identifiers in arguments or responses."""
+    if key in SECRET_KEYS:
+        return REDACTED
+    if key in ID_KEYS and isinstance(value, str) and value:
+        return hash_id(value)
+    if isinstance(value, dict):
+        if OBJECT_MARKER in value:
+            return {OBJECT_MARKER: redact(value[OBJECT_MARKER])}
+        return {k: redact(v, k) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(v) for v in value]
+    return value
+
+
+def to_jsonable(obj: Any) -> Any:
+    """Serialize Bring! API responses, keeping objects distinguishable from dicts."""
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, enum.Enum):
+        return to_jsonable(obj.value)
+    if isinstance(obj, dict):
+        return {str(k): to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [to_jsonable(v) for v in obj]
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        fields = {f.name: to_jsonable(getattr(obj, f.name)) for f in dataclasses.fields(obj)}
+        return {OBJECT_MARKER: fields}
+    if hasattr(obj, "__dict__"):
+        fields = {k: to_jsonable(v) for k, v in vars(obj).items() if not k.startswith("_")}
+        return {OBJECT_MARKER: fields}
+    return repr(obj)
+
+
+def from_jsonable(value: Any) -> Any:
+    """Rebuild serialized responses: objects become namespaces, dicts stay dicts."""
+    if isinstance(value, dict):
+        if OBJECT_MARKER in value:
+            return SimpleNamespace(**{k: from_jsonable(v) for k, v in value[OBJECT_MARKER].items()})
+        return {k: from_jsonable(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [from_jsonable(v) for v in value]
+    return value
+
+
+class CallRecord:
+    """One recorded tool call and the upstream calls it made."""
+
+    __slots__ = ("session", "seq", "tool", "arguments", "started", "duration", "error", "upstream")
+
+    def __init__(self, session: str, seq: int, tool: str, arguments: Any):
+        self.session = session
+        self.seq = seq
+        self.tool = tool
+        self.arguments = redact(arguments or {})
+        self.started = time.time()
+        self.duration = 0.0
+        self.error: Optional[str] = None
+        self.upstream: List[Dict[str, Any]] = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session": self.session,
+            "seq": self.seq,
+            "tool": self.tool,
+            "arguments": self.arguments,
+            "started": self.started,
+            "duration": self.duration,
+            "error": self.error,
+            "upstream": self.upstream,
+        }
+
+
+_current_call: ContextVar[Optional[CallRecord]] = ContextVar("bring_current_call", default=None)
+
+
+class TrafficRecorder:
+    """Appends tool calls and their upstream responses to a JSONL file."""
+
+    def __init__(self, path: str, writer: Optional[BackgroundWriter] = None):
+        self.path = path
+        self.writer = writer or background_writer()
+        self._seq = 0
+
+    @contextmanager
+    def record_call(self, session: str, tool: str, arguments: Any) -> Iterator[CallRecord]:
+        """Record a tool call; upstream calls made inside the block are attached to it."""
+        self._seq += 1
+        record = CallRecord(session, self._seq, tool, arguments)
+        token = _current_call.set(record)
+        start = time.perf_counter()
+
+        try:
+            yield record
+        except BaseException as e:
+            record.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record.duration = time.perf_counter() - start
+            _current_call.reset(token)
+            self.writer.submit(self._write, record)
+
+    def flush(self) -> None:
+        """Wait until recorded calls have been written."""
+        self.writer.flush()
+
+    def _write(self, record: CallRecord) -> None:
+        # Runs on the writer thread
+        try:
+            line = json.dumps(record.to_dict(), separators=(",", ":")) + "\n"
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to record tool call {record.tool}: {e}")
+
+
+def _upstream_entry(method: str, args: Any, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    positional = redact(to_jsonable(list(args)))
+    if method in LIST_METHODS and positional and isinstance(positional[0], str):
+        positional[0] = hash_id(positional[0])
+    return {"method": method, "args": positional, "kwargs": redact(to_jsonable(kwargs))}
+
+
+def record_prefetched(method: str, args: Any, result: Any) -> None:
+    """Attach a result fetched ahead of time to the current call record, if any.
+
+    The call that takes a prefetched result makes no upstream call itself, but
+    a replay (which does not prefetch) needs the response it was served.
+    """
+    record = _current_call.get()
+    if record is None:
+        return
+    entry = _upstream_entry(method, args, {})
+    entry["result"] = redact(to_jsonable(result))
+    entry["duration"] = 0.0
+    entry["prefetched"] = True
+    record.upstream.append(entry)
+
+
+class RecordingClient:
+    """Proxy that attaches every Bring client coroutine's result to the current call record."""
+
+    def __init__(self, client: Any):
+        self._client = client
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def recorded(*args: Any, **kwargs: Any) -> Any:
+            record = _current_call.get()
+            if record is None:
+                return await attr(*args, **kwargs)
+
+            start = time.perf_counter()
+            entry = _upstream_entry(name, args, kwargs)
+            try:
+                result = await attr(*args, **kwargs)
+            except Exception as e:
+                entry["error"] = f"{type(e).__name__}: {e}"
+                raise
+            else:
+                entry["result"] = redact(to_jsonable(result))
+                return result
+            finally:
+                entry["duration"] = time.perf_counter() - start
+                record.upstream.append(entry)
+
+        return recorded
+
+
+def recorder_from_env() -> Optional[TrafficRecorder]:
+    """Create a recorder writing to BRING_RECORD_FILE, if set."""
+    path = os.getenv("BRING_RECORD_FILE")
+    return TrafficRecorder(path) if path else None
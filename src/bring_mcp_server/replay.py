@@ -0,0 +1,206 @@
+"""
+Replay harness for the Bring! MCP Server
+
+Re-drives sessions captured with ``BRING_RECORD_FILE`` against the server's
+``call_tool`` handler, with the Bring! client replaced by a stub that serves
+the recorded upstream responses. Reports throughput and latency percentiles.
+
+Usage:
+    python -m bring_mcp_server.replay capture.jsonl --speed 10
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .recorder import from_jsonable, redact, to_jsonable
+
+
+def load_capture(path: str) -> List[Dict[str, Any]]:
+    """Load recorded tool calls, ordered by start time."""
+    calls = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                calls.append(json.loads(line))
+    calls.sort(key=lambda call: (call["started"], call["seq"]))
+    return calls
+
+
+def _key(method: str, args: Any, kwargs: Any) -> Tuple[str, str]:
+    return method, json.dumps([args, kwargs], sort_keys=True)
+
+
+class ReplayBring:
+    """Stub Bring client answering from recorded upstream responses."""
+
+    def __init__(self, calls: List[Dict[str, Any]], upstream_latency: float = 0.0):
+        # Exact (method, arguments) matches are served in recorded order;
+        # otherwise the last response recorded for the method is reused
+        self._exact: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._by_method: Dict[str, Dict[str, Any]] = {}
+        self.upstream_latency = upstream_latency
+        self.upstream_calls = 0
+        self.user_locale = "en-US"
+
+        for call in calls:
+            for entry in call.get("upstream", []):
+                key = _key(entry["method"], entry.get("args", []), entry.get("kwargs", {}))
+                self._exact[key].append(entry)
+                self._by_method[entry["method"]] = entry
+
+    def __getattr__(self, method: str) -> Any:
+        if method.startswith("_"):
+            raise AttributeError(method)
+
+        async def replayed(*args: Any, **kwargs: Any) -> Any:
+            self.upstream_calls += 1
+            key = _key(method, redact(to_jsonable(list(args))), redact(to_jsonable(kwargs)))
+            queue = self._exact.get(key)
+            entry = queue.popleft() if queue else self._by_method.get(method)
+
+            if entry is not None and self.upstream_latency:
+                await asyncio.sleep(entry.get("duration", 0.0) * self.upstream_latency)
+            if entry is None or "result" not in entry:
+                if entry is not None and entry.get("error"):
+                    raise RuntimeError(entry["error"])
+                return None
+            return from_jsonable(entry["result"])
+
+        return replayed
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+class ReplayReport:
+    """Latency samples and counters collected during a replay."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors = 0
+        self.elapsed = 0.0
+        self.upstream_calls = 0
+
+    @property
+    def all_latencies(self) -> List[float]:
+        return [value for values in self.latencies.values() for value in values]
+
+    @property
+    def total_calls(self) -> int:
+        return len(self.all_latencies)
+
+    @property
+    def throughput(self) -> float:
+        return self.total_calls / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def amplification(self) -> float:
+        """Upstream (Bring! API) calls per tool call."""
+        return self.upstream_calls / self.total_calls if self.total_calls else 0.0
+
+    def format(self) -> str:
+        def row(label: str, samples: List[float]) -> str:
+            return (
+                f"{label:<28} {len(samples):>7} "
+                f"{percentile(samples, 50) * 1000:>9.2f} "
+                f"{percentile(samples, 95) * 1000:>9.2f} "
+                f"{percentile(samples, 99) * 1000:>9.2f}"
+            )
+
+        lines = [
+            f"Calls: {self.total_calls}  Errors: {self.errors}  "
+            f"Elapsed: {self.elapsed:.2f}s  Throughput: {self.throughput:.1f} calls/s  "
+            f"Upstream calls: {self.upstream_calls} ({self.amplification:.2f} per call)",
+            "",
+            f"{'tool':<28} {'calls':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+        ]
+        for tool in sorted(self.latencies):
+            lines.append(row(tool, self.latencies[tool]))
+        lines.append(row("all", self.all_latencies))
+        return "\n".join(lines)
+
+
+async def _replay_session(
+    calls: List[Dict[str, Any]],
+    speed: float,
+    start: float,
+    origin: float,
+    report: ReplayReport,
+) -> None:
+    from . import server
+
+    for call in calls:
+        if speed > 0:
+            due = start + (call["started"] - origin) / speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        t0 = time.perf_counter()
+        result = await server.call_tool(call["tool"], call["arguments"])
+        report.latencies[call["tool"]].append(time.perf_counter() - t0)
+        if result and getattr(result[0], "text", "").startswith("Error:"):
+            report.errors += 1
+
+
+async def replay(
+    calls: List[Dict[str, Any]],
+    speed: float = 1.0,
+    upstream_latency: float = 0.0,
+) -> ReplayReport:
+    """Replay recorded calls against the server; speed 0 replays as fast as possible."""
+    from . import server
+
+    stub = ReplayBring(calls, upstream_latency)
+    report = ReplayReport()
+
+    sessions: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for call in calls:
+        sessions[call["session"]].append(call)
+
+    with server.stand_in_client(stub):
+        origin = calls[0]["started"] if calls else 0.0
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            _replay_session(session_calls, speed, start, origin, report)
+            for session_calls in sessions.values()
+        ))
+        report.elapsed = time.perf_counter() - start
+
+    report.upstream_calls = stub.upstream_calls
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Replay captured Bring! MCP traffic")
+    parser.add_argument("capture", help="JSONL file written via BRING_RECORD_FILE")
+    parser.add_argument(
+        "--speed", type=float, default=1.0,
+        help="Replay speed multiplier (1 = real time, 0 = as fast as possible)",
+    )
+    parser.add_argument(
+        "--upstream-latency", type=float, default=0.0,
+        help="Scale factor for simulating recorded upstream latency (0 = none)",
+    )
+    args = parser.parse_args(argv)
+
+    calls = load_capture(args.capture)
+    report = asyncio.run(replay(calls, args.speed, args.upstream_latency))
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Event loop runtime for the Bring! MCP Server
+
+Selects the event loop implementation (uvloop when installed, or plain
+asyncio), enables eager task execution on Python 3.12+, and provides a
+loop-lag monitor: a heartbeat task measures scheduling delay, and a watchdog
+thread reports which tool handler was running when the loop was blocked.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Coroutine, Dict, Iterator, Optional, TypeVar
+
+from .metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LOOP_CHOICES = ("auto", "asyncio", "uvloop")
+
+
+def loop_factory(kind: str = "auto") -> Callable[[], asyncio.AbstractEventLoop]:
+    """Return a factory for the requested loop; 'auto' uses uvloop when it is installed."""
+    if kind not in LOOP_CHOICES:
+        raise ValueError(f"Unknown event loop: {kind}")
+
+    if kind in ("auto", "uvloop"):
+        try:
+            import uvloop
+        except ImportError:
+            if kind == "uvloop":
+                raise ImportError(
+                    "uvloop package is required for --loop uvloop. "
+                    "Install it with: pip install bring-mcp-server[speed]"
+                )
+        else:
+            return uvloop.new_event_loop
+
+    return asyncio.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, T], loop: str = "auto", eager_tasks: bool = False) -> T:
+    """Like ``asyncio.run``, on the selected loop and optionally with eager tasks."""
+    factory = loop_factory(loop)
+    eager_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_tasks and eager_factory is None:
+        logger.info("Eager task execution needs Python 3.12+; using regular tasks")
+
+    def new_loop() -> asyncio.AbstractEventLoop:
+        event_loop = factory()
+        if eager_tasks and eager_factory is not None:
+            event_loop.set_task_factory(eager_factory)
+        return event_loop
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=new_loop) as runner:
+            return runner.run(main)
+
+    # Python 3.10: asyncio.run has no loop factory, so switch the policy instead
+    if factory is not asyncio.new_event_loop:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(main)
+
+
+def _blocking_location(frame: Any) -> str:
+    """Innermost frame of this package in a stack (else the innermost frame)."""
+    innermost = frame
+    while frame is not None:
+        if f"{os.sep}bring_mcp_server{os.sep}" in frame.f_code.co_filename:
+            break
+        frame = frame.f_back
+    frame = frame or innermost
+    if frame is None:
+        return "unknown"
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+class LoopLagMonitor:
+    """Measures event loop scheduling delay and names the handlers that block it."""
+
+    def __init__(self, metrics: Metrics, threshold: float = 0.1, interval: float = 0.05):
+        self.metrics = metrics
+        self.threshold = threshold
+        self.interval = interval
+
+        self._handlers: Dict[Any, str] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional["asyncio.Task[None]"] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._last_beat = time.monotonic()
+        self._max_lag = 0.0
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = self._loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="bring-loop-lag", daemon=True)
+        self._thread.start()
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._last_beat = now
+            lag = max(0.0, now - expected)
+            if lag > self._max_lag:
+                self._max_lag = lag
+                self.metrics.set("loop_lag_max_seconds", round(lag, 6))
+            self.metrics.increment("loop_lag_seconds_total", lag)
+            if lag >= self.threshold:
+                self.metrics.increment("loop_lag_events_total")
+
+    def _watch(self) -> None:
+        # Runs in its own thread, so it can look at the loop while it is blocked
+        reported_beat = None
+        while not self._stop.wait(self.interval):
+            beat = self._last_beat
+            blocked = time.monotonic() - beat - self.interval
+            if blocked < self.threshold or beat == reported_beat:
+                continue
+            reported_beat = beat
+            self._report(blocked)
+
+    def _report(self, blocked: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        task = asyncio.current_task(self._loop) if self._loop else None
+        with self._lock:
+            handler = self._handlers.get(task, "unknown")
+
+        self.metrics.increment("loop_slow_callbacks_total", handler=handler)
+        logger.warning(
+            f"Event loop blocked for more than {blocked * 1000:.0f} ms "
+            f"in {handler} at {_blocking_location(frame)}"
+        )
+
+    @contextmanager
+    def track(self, handler: str) -> Iterator[None]:
+        """Attribute loop stalls during the block to a handler (e.g. a tool name)."""
+        self._ensure_started()
+        task = asyncio.current_task()
+        with self._lock:
+            self._handlers[task] = handler
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._handlers.pop(task, None)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def lag_monitor_from_env(metrics: Metrics) -> Optional[LoopLagMonitor]:
+    """Create a loop-lag monitor if BRING_LOOP_LAG_MS is set to a positive threshold."""
+    threshold_ms = float(os.getenv("BRING_LOOP_LAG_MS", "0") or 0)
+    if threshold_ms <= 0:
+        return None
+    return LoopLagMonitor(metrics, threshold_ms / 1000)
@@ -0,0 +1,87 @@
+"""
+Per-list write sequencing for the Bring! MCP Server
+
+Concurrent tool calls may write to the same shopping list. Writes to one
+list are applied one at a time in arrival order (asyncio locks wake their
+waiters first-in, first-out), while writes to different lists never wait
+for each other. A task that holds a list's slot (e.g. for a read-plan-write
+sequence) can write to that list without waiting for itself.
+"""
+
+import asyncio
+import functools
+from collections import Counter
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, FrozenSet
+
+# Client methods that modify a list (the first argument is the list UUID)
+WRITE_METHODS = frozenset({
+    "save_item", "update_item", "complete_item", "remove_item", "batch_update_list",
+})
+
+
+# Lists whose slot the current task holds (asyncio locks are not re-entrant)
+_held: ContextVar[FrozenSet[str]] = ContextVar("bring_held_lists", default=frozenset())
+
+
+class ListSequencer:
+    """Serializes work per list in arrival order; different lists run in parallel."""
+
+    def __init__(self) -> None:
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._users: Counter = Counter()
+
+    def __len__(self) -> int:
+        """Number of lists with a write in flight or waiting."""
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def hold(self, list_uuid: str) -> AsyncIterator[None]:
+        """Hold the write slot of a list for the duration of the block."""
+        held = _held.get()
+        if list_uuid in held:
+            # Nested in a block that already holds the slot
+            yield
+            return
+
+        lock = self._locks.get(list_uuid)
+        if lock is None:
+            lock = self._locks[list_uuid] = asyncio.Lock()
+        self._users[list_uuid] += 1
+        try:
+            async with lock:
+                token = _held.set(held | {list_uuid})
+                try:
+                    yield
+                finally:
+                    _held.reset(token)
+        finally:
+            # Forget idle lists so the table only holds lists with pending writes
+            self._users[list_uuid] -= 1
+            if not self._users[list_uuid]:
+                del self._users[list_uuid]
+                del self._locks[list_uuid]
+
+
+class SequencedClient:
+    """Proxy that routes the Bring client's write methods through a ListSequencer."""
+
+    def __init__(self, client: Any, sequencer: ListSequencer):
+        self._client = client
+        self._sequencer = sequencer
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name not in WRITE_METHODS:
+            return attr
+
+        sequencer = self._sequencer
+
+        @functools.wraps(attr)
+        async def sequenced(*args: Any, **kwargs: Any) -> Any:
+            list_uuid = args[0] if args else kwargs.get("list_uuid")
+            async with sequencer.hold(str(list_uuid)):
+                return await attr(*args, **kwargs)
+
+        return sequenced
@@ -6,14 +6,21 @@ Provides comprehensive access to shopping list management, item operations,
 and user information.
 """
 
+import argparse
 import asyncio
+import base64
 import logging
+import mimetypes
 import os
-from typing import Any, Dict, List, Optional, Union
+import time
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
 import aiohttp
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.types import (
     Resource,
     Tool,
@@ -23,56 +30,231 @@ from mcp.types import (
 )
 from pydantic import AnyUrl
 
+from . import bench, runtime
+from .auth import SessionStore, export_session, read_handoff, restore_session, write_handoff
+from .catalog import CatalogPool, SectionIndex, TranslationIndex
+from .deadlines import DeadlineExceeded, deadlines_from_env
+from .images import DEFAULT_MAX_BYTES, ImageCache, ImageData
+from .logs import LogPipeline, log_context, log_pipeline_from_env
+from .metrics import METRICS_URI, Metrics
+from .prefetch import MISS, prefetcher_from_env
+from .profiler import profiler_from_env
+from .recorder import (
+    RecordingClient,
+    from_jsonable,
+    hash_id,
+    record_prefetched,
+    recorder_from_env,
+    to_jsonable,
+)
+from .runtime import lag_monitor_from_env
+from .sequencer import ListSequencer, SequencedClient
+from .shared_cache import SharedCache
+from .subscriptions import DEFAULT_POLL_INTERVAL, ListWatcher, list_uri, list_uuid_from_uri
+from .sync import ADD, COMPLETE, REMOVE, UNWANTED_ACTIONS, plan_sync
+from .tracing import SPAN_KIND_SERVER, TracedClient, tracer_from_env
+from .writer import background_writer
+
 # Import the Bring API
 try:
-    from bring_api import Bring, BringItemOperation
+    from bring_api import Bring, BringAuthException, BringItemOperation
 except ImportError:
     raise ImportError(
         "bring-api package is required. Install it with: pip install bring-api"
     )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# One record per tool call with its latency (sample with BRING_LOG_SAMPLE)
+call_logger = logging.getLogger(f"{__name__}.calls")
+
+
+class BringServer(Server):
+    """MCP server advertising resource subscriptions on every transport."""
+    
+    def create_initialization_options(self, *args: Any, **kwargs: Any) -> Any:
+        init_options = super().create_initialization_options(*args, **kwargs)
+        # The low-level server never advertises subscriptions on its own
+        init_options.capabilities.resources.subscribe = True
+        return init_options
+
+
+@asynccontextmanager
+async def session_lifespan(server: Server) -> AsyncIterator[Dict[str, Any]]:
+    """Per-session state; a session's list subscriptions end with the session."""
+    state: Dict[str, Any] = {"session": None}
+    try:
+        yield state
+    finally:
+        if state["session"] is not None and _list_watcher is not None:
+            _list_watcher.unsubscribe_all(state["session"])
+
 
 # Initialize the MCP server
-app = Server("bring-mcp-server")
+app = BringServer("bring-mcp-server", lifespan=session_lifespan)
 
 # Global session and Bring instance
 _session: Optional[aiohttp.ClientSession] = None
 _bring: Optional[Bring] = None
+# Serializes client creation, so concurrent first calls wait for one login
+_client_lock = asyncio.Lock()
+
+# Encrypted login persisted across restarts (BRING_PERSIST_SESSION / BRING_SESSION_FILE)
+_session_store: Optional[SessionStore] = None
+_session_restored = False
+
+DEFAULT_SESSION_PATH = Path.home() / ".cache" / "bring-mcp-server" / "session.bin"
+
+# Tracing (BRING_TRACE_FILE) and sampling profiler (BRING_PROFILE_SLOWEST)
+_tracer = tracer_from_env()
+_profiler = profiler_from_env()
+
+# Traffic capture for replay (BRING_RECORD_FILE)
+_recorder = recorder_from_env()
+
+# Per-tool deadlines (BRING_TOOL_TIMEOUT / BRING_TOOL_TIMEOUTS) and process metrics
+_deadlines = deadlines_from_env()
+_metrics = Metrics()
+
+# Queue-based logging to stderr, installed by setup_logging()
+_log_pipeline: Optional[LogPipeline] = None
+
+# Event loop stall detection (BRING_LOOP_LAG_MS)
+_lag_monitor = lag_monitor_from_env(_metrics)
+
+# Speculative fetches for the likely next tool call (BRING_PREFETCH)
+_prefetcher = prefetcher_from_env(_metrics)
+
+# Limit for a single Bring! HTTP request (BRING_HTTP_TIMEOUT)
+HTTP_TIMEOUT = float(os.getenv("BRING_HTTP_TIMEOUT", 20))
+
+# Orders concurrent writes per list; different lists proceed in parallel
+_sequencer = ListSequencer()
+
+# Catalog data per locale (None = the user's default locale)
+_catalog_cache: Dict[Optional[str], List[Any]] = {}
+_translation_indexes: Dict[Optional[str], TranslationIndex] = {}
+_section_indexes: Dict[Optional[str], SectionIndex] = {}
+# One catalog download per locale; concurrent first callers wait for it
+_catalog_locks: Dict[Optional[str], asyncio.Lock] = {}
+# Failed downloads per locale: (retry after, error); callers fail fast until then
+_catalog_failures: Dict[Optional[str], Tuple[float, Exception]] = {}
+_catalog_pool = CatalogPool()
+
+# On-disk item image cache (created on first use)
+_image_cache: Optional[ImageCache] = None
+# In-flight image downloads by URL, shared by concurrent callers
+_image_fetches: Dict[str, "asyncio.Task[tuple[ImageData, str]]"] = {}
+
+# Cache shared between server processes and restarts (BRING_CACHE / BRING_CACHE_PATH)
+_shared_cache: Optional[SharedCache] = None
+# Set while bench and replay serve calls from a stand-in client
+_shared_cache_disabled = False
+# Opening the cache may wait for other processes: one opener at a time
+_shared_cache_lock = asyncio.Lock()
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "bring-mcp-server" / "cache.sqlite3"
+
+CATALOG_TTL = float(os.getenv("BRING_CATALOG_TTL", 24 * 60 * 60))
+CATALOG_RETRY = float(os.getenv("BRING_CATALOG_RETRY", 60))
+LISTS_TTL = float(os.getenv("BRING_LISTS_TTL", 5 * 60))
+LIST_TTL = float(os.getenv("BRING_LIST_TTL", 10))
+
+# Shared poller for subscribed list resources (created on first subscription)
+_list_watcher: Optional[ListWatcher] = None
+
+IMAGE_BASE_URL = os.getenv(
+    "BRING_IMAGE_BASE_URL", "https://web.getbring.com/assets/images/items/"
+)
 
 
 async def get_bring_client() -> Bring:
     """Get or create the Bring client instance."""
-    global _session, _bring
-    
     if _bring is None:
-        # Get credentials from environment variables
-        email = os.getenv("BRING_EMAIL")
-        password = os.getenv("BRING_PASSWORD")
-        
-        if not email or not password:
-            raise ValueError(
-                "BRING_EMAIL and BRING_PASSWORD environment variables must be set"
-            )
-        
-        # Create session if needed
-        if _session is None:
-            _session = aiohttp.ClientSession()
-        
-        # Create Bring instance
-        _bring = Bring(_session, email, password)
-        
+        async with _client_lock:
+            if _bring is None:
+                await create_bring_client()
+    
+    client = instrumented_client(_bring)
+    if _recorder is not None:
+        client = RecordingClient(client)
+    return client
+
+
+@contextmanager
+def stand_in_client(client: Any) -> Iterator[None]:
+    """Serve tool calls from ``client`` without the shared cache, prefetcher or recorder.
+    
+    Used by bench and replay: their stub data must not reach the shared cache of
+    the real account, nor be served from it, prefetched or captured.
+    """
+    global _bring, _shared_cache, _shared_cache_disabled, _prefetcher, _recorder
+    
+    saved = (_bring, _shared_cache, _shared_cache_disabled, _prefetcher, _recorder)
+    _bring, _shared_cache, _shared_cache_disabled = client, None, True
+    _prefetcher = _recorder = None
+    try:
+        yield
+    finally:
+        _bring, _shared_cache, _shared_cache_disabled, _prefetcher, _recorder = saved
+
+
+def instrumented_client(bring: Bring) -> Any:
+    """Wrap the client in the tracing and per-list sequencing proxies."""
+    client: Any = bring
+    if _tracer.enabled:
+        client = TracedClient(client, _tracer)
+    # Outside the tracing proxy, so client spans do not include the wait for the list
+    return SequencedClient(client, _sequencer)
+
+
+async def create_bring_client() -> None:
+    """Log in (or restore a session) and publish the authenticated client."""
+    global _session, _bring, _session_restored
+    
+    # Get credentials from environment variables
+    email = os.getenv("BRING_EMAIL")
+    password = os.getenv("BRING_PASSWORD")
+    
+    if not email or not password:
+        raise ValueError(
+            "BRING_EMAIL and BRING_PASSWORD environment variables must be set"
+        )
+    
+    # Create session if needed
+    if _session is None:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT if HTTP_TIMEOUT > 0 else None)
+        )
+    
+    # Create Bring instance; only published once it is authenticated
+    bring = Bring(_session, email, password)
+    
+    # Reuse a login handed over by the parent process (multi-worker mode)
+    handoff = os.getenv("BRING_SESSION_HANDOFF")
+    session_state = await asyncio.to_thread(read_handoff, handoff) if handoff else None
+    store = get_session_store()
+    stored = await asyncio.to_thread(store.load) if store is not None else None
+    if session_state and await restore_session(bring, session_state):
+        logger.info("Reusing Bring! session from parent process")
+        restored = True
+    elif stored and await restore_session(bring, stored):
+        logger.info("Reusing stored Bring! session")
+        restored = True
+    else:
         # Login
         try:
-            await _bring.login()
+            with _tracer.span("bring.login"):
+                await bring.login()
             logger.info("Successfully logged in to Bring!")
         except Exception as e:
             logger.error(f"Failed to login to Bring: {e}")
             raise
+        restored = False
     
-    return _bring
+    _bring = bring
+    _session_restored = restored
+    if not restored:
+        await save_session()
 
 
 def safe_get_attr(obj: Any, key: str, default: Any = None) -> Any:
@@ -84,6 +266,465 @@ def safe_get_attr(obj: Any, key: str, default: Any = None) -> Any:
     return default
 
 
+def get_session_store() -> Optional[SessionStore]:
+    """Get the encrypted session store, if session persistence is enabled."""
+    global _session_store
+    
+    if _session_store is None:
+        path = os.getenv("BRING_SESSION_FILE")
+        if not path and os.getenv("BRING_PERSIST_SESSION", "").lower() in ("1", "true", "yes"):
+            path = str(DEFAULT_SESSION_PATH)
+        if path:
+            _session_store = SessionStore(Path(path).expanduser(), os.getenv("BRING_PASSWORD", ""))
+    
+    return _session_store
+
+
+async def save_session() -> None:
+    """Persist the current login (tokens may have been refreshed since it was stored)."""
+    if _session_store is None or _bring is None or not _bring.uuid:
+        return
+    try:
+        await asyncio.to_thread(_session_store.save, export_session(_bring))
+    except Exception as e:
+        logger.warning(f"Failed to store Bring! session: {e}")
+
+
+async def discard_session() -> None:
+    """Forget a restored session the Bring! API rejected, so the next call logs in."""
+    global _bring, _session_restored
+    
+    if _session_store is not None:
+        await asyncio.to_thread(_session_store.clear)
+    os.environ.pop("BRING_SESSION_HANDOFF", None)
+    _bring = None
+    _session_restored = False
+
+
+async def get_shared_cache() -> Optional[SharedCache]:
+    """Get the cross-process cache, if one is configured."""
+    global _shared_cache
+    
+    if _shared_cache is None and not _shared_cache_disabled:
+        path = os.getenv("BRING_CACHE_PATH")
+        if not path and os.getenv("BRING_CACHE", "").lower() in ("1", "true", "yes"):
+            path = str(DEFAULT_CACHE_PATH)
+        if path:
+            async with _shared_cache_lock:
+                if _shared_cache is None:
+                    # Creating the schema and purging wait for other processes' write locks
+                    _shared_cache = await asyncio.to_thread(open_shared_cache, path)
+    
+    return _shared_cache
+
+
+def open_shared_cache(path: str) -> SharedCache:
+    """Open the shared cache and purge its expired entries (blocking)."""
+    cache = SharedCache(Path(path).expanduser())
+    try:
+        removed = cache.purge_expired()
+        logger.info(f"Using shared cache {path} ({removed} expired entries removed)")
+    except Exception as e:
+        logger.warning(f"Failed to purge shared cache: {e}")
+    return cache
+
+
+async def cached_fetch(key: str, fetch: Any, ttl: float) -> Any:
+    """Fetch a Bring! response through the prefetcher and shared cache, if configured."""
+    if _prefetcher is not None:
+        prefetched = await _prefetcher.take(key)
+        if prefetched is not MISS:
+            if _recorder is not None:
+                record_prefetched(*upstream_call(key), prefetched)
+            return prefetched
+    
+    return await shared_fetch(key, fetch, ttl)
+
+
+async def shared_fetch(key: str, fetch: Any, ttl: float) -> Any:
+    """Fetch a Bring! response through the shared cache, if configured."""
+    shared = await get_shared_cache()
+    if shared is None:
+        return await fetch()
+    
+    async def fetch_jsonable() -> Any:
+        return to_jsonable(await fetch())
+    
+    return from_jsonable(await shared.get_or_fetch(shared_key(key), fetch_jsonable, ttl))
+
+
+def shared_key(key: str) -> str:
+    """Namespace a shared cache key by account, so accounts never see each other's data."""
+    return f"{key}:{hash_id(os.getenv('BRING_EMAIL', ''))}"
+
+
+async def get_catalog(bring: Bring, locale: Optional[str] = None) -> List[Any]:
+    """Get the item catalog for a locale, downloading it only once per process."""
+    if locale not in _catalog_cache:
+        async def fetch() -> Any:
+            if locale:
+                return await bring.get_items_details(locale)
+            return await bring.get_items_details()
+        
+        lock = _catalog_locks.setdefault(locale, asyncio.Lock())
+        async with lock:
+            if locale not in _catalog_cache:
+                # Waiters behind a failed download do not each retry it in turn
+                retry_at, error = _catalog_failures.get(locale, (0.0, None))
+                if error is not None and time.monotonic() < retry_at:
+                    raise RuntimeError(f"Item catalog unavailable: {error}") from error
+                
+                try:
+                    details = await cached_fetch(
+                        f"catalog:{locale or 'default'}", fetch, CATALOG_TTL
+                    )
+                except Exception as e:
+                    _catalog_failures[locale] = (time.monotonic() + CATALOG_RETRY, e)
+                    raise
+                _catalog_failures.pop(locale, None)
+                _catalog_cache[locale] = _catalog_pool.compact(details or [])
+    
+    return _catalog_cache[locale]
+
+
+async def get_lists(bring: Bring) -> Any:
+    """Get the user's lists (metadata only)."""
+    return await cached_fetch("lists", bring.load_lists, LISTS_TTL)
+
+
+async def get_list_details(bring: Bring, list_uuid: str) -> Any:
+    """Get the settings and metadata of a list."""
+    return await cached_fetch(
+        f"list_details:{list_uuid}", lambda: bring.get_list_details(list_uuid), LISTS_TTL
+    )
+
+
+async def get_list(bring: Bring, list_uuid: str) -> Any:
+    """Get the items of a list (a short-lived snapshot when shared)."""
+    return await cached_fetch(f"list:{list_uuid}", lambda: bring.get_list(list_uuid), LIST_TTL)
+
+
+async def get_translation_index(bring: Bring, locale: Optional[str] = None) -> TranslationIndex:
+    """Get the reverse translation index (localized name -> itemId) for a locale."""
+    if locale not in _translation_indexes:
+        _translation_indexes[locale] = TranslationIndex(await get_catalog(bring, locale))
+    
+    return _translation_indexes[locale]
+
+
+async def get_section_index(bring: Bring, locale: Optional[str] = None) -> SectionIndex:
+    """Get the item -> store section index for a locale."""
+    if locale not in _section_indexes:
+        _section_indexes[locale] = SectionIndex(await get_catalog(bring, locale))
+    
+    return _section_indexes[locale]
+
+
+async def get_grouping_sections(bring: Bring) -> Optional[SectionIndex]:
+    """Get the section index for grouping list items, or None if the catalog is unavailable."""
+    try:
+        return await get_section_index(bring)
+    except Exception as e:
+        # The list is already fetched: show it ungrouped rather than failing the call
+        logger.warning(f"Could not load item catalog for section grouping: {e}")
+        return None
+
+
+async def get_item_name_resolver(bring: Bring) -> Callable[[str], str]:
+    """Get a function mapping typed or localized item names to canonical catalog itemIds."""
+    try:
+        index = await get_translation_index(bring)
+    except Exception as e:
+        # Writing with the name as typed is always better than failing the call
+        logger.warning(f"Could not load item catalog for name lookup: {e}")
+        return lambda name: name
+    
+    return index.canonicalize
+
+
+async def canonicalize_item_name(bring: Bring, name: str) -> str:
+    """Map a user-typed item name to its canonical catalog itemId when one is known."""
+    return (await get_item_name_resolver(bring))(name)
+
+
+def get_image_cache() -> ImageCache:
+    """Get or create the on-disk image cache."""
+    global _image_cache
+    
+    if _image_cache is None:
+        directory = os.getenv("BRING_IMAGE_CACHE_DIR") or str(
+            Path.home() / ".cache" / "bring-mcp-server" / "images"
+        )
+        max_mb = os.getenv("BRING_IMAGE_CACHE_MAX_MB")
+        max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+        use_mmap = os.getenv("BRING_IMAGE_CACHE_MMAP", "").lower() in ("1", "true", "yes")
+        
+        _image_cache = ImageCache(Path(directory), max_bytes, use_mmap=use_mmap)
+    
+    return _image_cache
+
+
+async def fetch_item_image(image_path: str) -> tuple[ImageData, str]:
+    """Fetch an item image, serving it from the disk cache when possible."""
+    if image_path.startswith(("http://", "https://")):
+        url = image_path
+    else:
+        url = IMAGE_BASE_URL.rstrip("/") + "/" + image_path.lstrip("/")
+    
+    task = _image_fetches.get(url)
+    if task is None:
+        task = asyncio.ensure_future(load_item_image(url))
+        _image_fetches[url] = task
+        
+        def forget(done: "asyncio.Task[tuple[ImageData, str]]") -> None:
+            if _image_fetches.get(url) is done:
+                del _image_fetches[url]
+        
+        task.add_done_callback(forget)
+    
+    # A cancelled caller must not cancel the download other callers are waiting for
+    return await asyncio.shield(task)
+
+
+async def load_item_image(url: str) -> tuple[ImageData, str]:
+    """Read an image from the disk cache, downloading and storing it on a miss."""
+    cache = get_image_cache()
+    cached = await asyncio.to_thread(cache.get, url)
+    if cached is not None:
+        return cached
+    
+    # get_bring_client() has already created the shared session
+    async with _session.get(url) as response:
+        response.raise_for_status()
+        data = await response.read()
+        mime_type = response.content_type
+    
+    if not mime_type or not mime_type.startswith("image/"):
+        mime_type = mimetypes.guess_type(url)[0] or "image/png"
+    
+    await asyncio.to_thread(cache.put, url, data, mime_type)
+    return data, mime_type
+
+
+def render_list_items(
+    list_uuid: str,
+    items_response: Any,
+    sections: Optional[SectionIndex] = None,
+) -> str:
+    """Render the items of a shopping list as text, optionally grouped by store section."""
+    # The response is BringItemsResponse which has an .items attribute
+    # That .items is an Items object with .purchase and .recently attributes
+    items_obj = safe_get_attr(items_response, "items")
+    
+    purchase_items = []
+    recent_items = []
+    
+    if items_obj:
+        purchase_items = safe_get_attr(items_obj, "purchase", [])
+        recent_items = safe_get_attr(items_obj, "recently", [])
+    
+    output = f"Items in list {list_uuid}:\n\n"
+    
+    def render_active(items: List[Any]) -> str:
+        lines = ""
+        for item in items:
+            # BringPurchase objects use 'itemId' not 'name', and 'spec' not 'specification'
+            name = safe_get_attr(item, "itemId") or safe_get_attr(item, "name", "Unknown")
+            spec = safe_get_attr(item, "spec") or safe_get_attr(item, "specification", "")
+            uuid = safe_get_attr(item, "uuid", "")
+            lines += f"- {name}"
+            if spec:
+                lines += f" ({spec})"
+            if uuid:
+                lines += f" [UUID: {uuid}]"
+            lines += "\n"
+        return lines
+    
+    if purchase_items:
+        output += "=== Active Items (To Purchase) ===\n"
+        if sections is None:
+            output += render_active(purchase_items)
+        else:
+            for section, items in sections.group(purchase_items):
+                output += f"\n[{section}]\n"
+                output += render_active(items)
+        output += "\n"
+    
+    if recent_items:
+        output += "=== Recently Completed ===\n"
+        for item in recent_items:
+            name = safe_get_attr(item, "itemId") or safe_get_attr(item, "name", "Unknown")
+            spec = safe_get_attr(item, "spec") or safe_get_attr(item, "specification", "")
+            output += f"- {name}"
+            if spec:
+                output += f" ({spec})"
+            output += "\n"
+    
+    if not purchase_items and not recent_items:
+        output += "List is empty.\n"
+    
+    return output
+
+
+async def fetch_rendered_list(list_uuid: str) -> str:
+    """Fetch a shopping list from Bring! and render it as text."""
+    bring = await get_bring_client()
+    items_response = await get_list(bring, list_uuid)
+    with _tracer.span("render"):
+        return render_list_items(list_uuid, items_response)
+
+
+def get_list_watcher() -> ListWatcher:
+    """Get or create the shared list poller."""
+    global _list_watcher
+    
+    if _list_watcher is None:
+        interval = float(os.getenv("BRING_POLL_INTERVAL", DEFAULT_POLL_INTERVAL))
+        _list_watcher = ListWatcher(fetch_rendered_list, interval)
+    
+    return _list_watcher
+
+
+async def invalidate_list(list_uuid: str) -> None:
+    """Drop cached state for a list after writing to it."""
+    if _list_watcher is not None:
+        _list_watcher.invalidate(list_uuid)
+    if _shared_cache is not None:
+        # May wait for another process's write lock
+        await asyncio.to_thread(_shared_cache.delete, shared_key(f"list:{list_uuid}"))
+    if _prefetcher is not None:
+        _prefetcher.discard(f"list:{list_uuid}")
+
+
+# Tools whose first upstream fetch is the default-locale catalog (name lookups)
+CATALOG_TOOLS = frozenset({
+    "bring_add_item", "bring_batch_update_items", "bring_sync_list", "bring_get_item_details",
+})
+
+
+def upstream_call(key: str) -> Tuple[str, Tuple[Any, ...]]:
+    """The Bring client method and arguments that fetch a prefetchable cache key."""
+    kind, _, list_uuid = key.partition(":")
+    if kind == "lists":
+        return "load_lists", ()
+    if kind == "catalog":
+        return "get_items_details", ()
+    return {"list": "get_list", "list_details": "get_list_details"}[kind], (list_uuid,)
+
+
+def schedule_prefetches(tool: str, arguments: Any) -> None:
+    """Learn from a served call and start the fetches the next call likely needs."""
+    if _prefetcher is None or _bring is None:
+        return
+    
+    # Not recorded here: the triggering call's record is closed before the fetch
+    # ends; cached_fetch attaches the result to the record of the call taking it
+    bring = instrumented_client(_bring)
+    prefetcher = _prefetcher
+    model = prefetcher.model
+    list_uuid = arguments.get("list_uuid") if isinstance(arguments, dict) else None
+    model.observe(current_session_id(), tool, list_uuid)
+    
+    def prefetch(key: str, ttl: float) -> None:
+        method, args = upstream_call(key)
+        
+        async def fetch() -> Any:
+            # Resolved in the task, so a client without the method only fails the prefetch
+            return await getattr(bring, method)(*args)
+        
+        async def run() -> Any:
+            with _tracer.span(f"prefetch {key}"):
+                return await shared_fetch(key, fetch, ttl)
+        
+        prefetcher.schedule(key, run)
+    
+    for predicted in model.predict(tool):
+        if predicted == "bring_get_lists":
+            prefetch("lists", LISTS_TTL)
+        elif predicted == "bring_get_list_items":
+            for uuid in model.likely_lists():
+                prefetch(f"list:{uuid}", LIST_TTL)
+        elif predicted == "bring_get_list_details":
+            for uuid in model.likely_lists():
+                prefetch(f"list_details:{uuid}", LISTS_TTL)
+        elif predicted in CATALOG_TOOLS and None not in _catalog_cache:
+            prefetch("catalog:default", CATALOG_TTL)
+
+
+# Resource Definitions
+
+@app.list_resources()
+async def list_resources() -> list[Resource]:
+    """List every shopping list as a resource."""
+    bring = await get_bring_client()
+    result = await get_lists(bring)
+    lists = safe_get_attr(result, "lists", [])
+    
+    resources = [
+        Resource(
+            uri=AnyUrl(list_uri(safe_get_attr(lst, "listUuid"))),
+            name=safe_get_attr(lst, "name", "Unnamed"),
+            description="Items on this shopping list. Subscribe to be notified when it changes.",
+            mimeType="text/plain",
+        )
+        for lst in lists
+        if safe_get_attr(lst, "listUuid")
+    ]
+    resources.append(Resource(
+        uri=AnyUrl(METRICS_URI),
+        name="Server metrics",
+        description="Counters of this server process (timeouts, cancellations, errors).",
+        mimeType="text/plain",
+    ))
+    return resources
+
+
+@app.read_resource()
+async def read_resource(uri: AnyUrl) -> list[ReadResourceContents]:
+    """Read a shopping list resource (or the metrics resource)."""
+    if str(uri) == METRICS_URI:
+        return [ReadResourceContents(content=_metrics.render(), mime_type="text/plain")]
+    
+    list_uuid = list_uuid_from_uri(uri)
+    
+    # Watched lists are kept fresh by the poller; serve them without an upstream call
+    content = _list_watcher.snapshot(list_uuid) if _list_watcher is not None else None
+    if content is None:
+        content = await fetch_rendered_list(list_uuid)
+        if _list_watcher is not None:
+            # The read may be the first to see a change: tell the subscribers now,
+            # as the next poll compares against this content
+            await _list_watcher.update(list_uuid, content)
+    
+    return [ReadResourceContents(content=content, mime_type="text/plain")]
+
+
+@app.subscribe_resource()
+async def subscribe_resource(uri: AnyUrl) -> None:
+    """Subscribe the calling session to updates of a shopping list."""
+    list_uuid = list_uuid_from_uri(uri)
+    context = app.request_context
+    # Unsubscribed by session_lifespan when the session ends
+    context.lifespan_context["session"] = context.session
+    get_list_watcher().subscribe(list_uuid, context.session)
+
+
+@app.unsubscribe_resource()
+async def unsubscribe_resource(uri: AnyUrl) -> None:
+    """Unsubscribe the calling session from a shopping list."""
+    list_uuid = list_uuid_from_uri(uri)
+    if _list_watcher is not None:
+        _list_watcher.unsubscribe(list_uuid, app.request_context.session)
+
+
+def current_session_id() -> str:
+    """Identify the MCP session of the current request (for traffic capture)."""
+    try:
+        return f"session-{id(app.request_context.session):x}"
+    except LookupError:
+        return "default"
+
+
 # Tool Definitions
 
 @app.list_tools()
@@ -109,13 +750,17 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "The UUID of the shopping list to retrieve items from",
                     },
+                    "group_by_section": {
+                        "type": "boolean",
+                        "description": "Group active items by store section, in the order of the Bring! app (default: false)",
+                    },
                 },
                 "required": ["list_uuid"],
             },
         ),
         Tool(
             name="bring_add_item",
-            description="Add a new item to a shopping list. Optionally include specifications (e.g., 'low fat', '2 liters').",
+            description="Add a new item to a shopping list. Optionally include specifications (e.g., 'low fat', '2 liters'). Localized item names are mapped to canonical catalog items automatically.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -147,7 +792,7 @@ async def list_tools() -> list[Tool]:
                     },
                     "item_name": {
                         "type": "string",
-                        "description": "The name of the item to complete",
+                        "description": "The name of the item to complete (localized names are mapped to catalog itemIds)",
                     },
                 },
                 "required": ["list_uuid", "item_name"],
@@ -165,7 +810,7 @@ async def list_tools() -> list[Tool]:
                     },
                     "item_name": {
                         "type": "string",
-                        "description": "The name of the item to remove",
+                        "description": "The name of the item to remove (localized names are mapped to catalog itemIds)",
                     },
                 },
                 "required": ["list_uuid", "item_name"],
@@ -189,7 +834,7 @@ async def list_tools() -> list[Tool]:
                             "properties": {
                                 "itemId": {
                                     "type": "string",
-                                    "description": "The item name/ID",
+                                    "description": "The item name/ID (localized names are mapped to catalog itemIds)",
                                 },
                                 "spec": {
                                     "type": "string",
@@ -212,6 +857,43 @@ async def list_tools() -> list[Tool]:
                 "required": ["list_uuid", "items", "operation"],
             },
         ),
+        Tool(
+            name="bring_sync_list",
+            description="Make the active items of a shopping list match a desired set of items (e.g. a recipe or meal plan). Fetches the list once and applies only the missing changes (add, update spec, move back from recently completed, complete or remove) in a single batch. Returns what changed.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "list_uuid": {
+                        "type": "string",
+                        "description": "The UUID of the shopping list",
+                    },
+                    "items": {
+                        "type": "array",
+                        "description": "The desired active items. Localized names are mapped to catalog itemIds",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "itemId": {
+                                    "type": "string",
+                                    "description": "The item name/ID",
+                                },
+                                "spec": {
+                                    "type": "string",
+                                    "description": "Optional specification; if omitted, an existing item keeps its specification",
+                                },
+                            },
+                            "required": ["itemId"],
+                        },
+                    },
+                    "unwanted": {
+                        "type": "string",
+                        "enum": list(UNWANTED_ACTIONS),
+                        "description": "What to do with active items that are not in the desired set (default: complete)",
+                    },
+                },
+                "required": ["list_uuid", "items"],
+            },
+        ),
         Tool(
             name="bring_get_user_info",
             description="Get information about the currently authenticated user, including email and user settings.",
@@ -268,22 +950,118 @@ async def list_tools() -> list[Tool]:
                 "required": [],
             },
         ),
+        Tool(
+            name="bring_get_item_image",
+            description="Get the catalog image for an item. Images are cached on disk after the first download.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "item_id": {
+                        "type": "string",
+                        "description": "The item ID or localized item name",
+                    },
+                    "locale": {
+                        "type": "string",
+                        "description": "Optional locale code (e.g., 'en-US', 'de-DE'). Defaults to user's locale",
+                    },
+                },
+                "required": ["item_id"],
+            },
+        ),
     ]
 
 
 @app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+async def call_tool(name: str, arguments: Any) -> list[Union[TextContent, ImageContent]]:
     """Handle tool calls."""
+    with _tracer.span(f"call_tool {name}", kind=SPAN_KIND_SERVER, **{"mcp.tool.name": name}) as span, \
+            ExitStack() as stack:
+        record = None
+        if _profiler is not None:
+            stack.enter_context(_profiler.profile(name))
+        if _lag_monitor is not None:
+            stack.enter_context(_lag_monitor.track(name))
+        if _recorder is not None:
+            record = stack.enter_context(_recorder.record_call(current_session_id(), name, arguments))
+        list_uuid = arguments.get("list_uuid") if isinstance(arguments, dict) else None
+        stack.enter_context(log_context(tool=name, list_uuid=list_uuid))
+        start = time.perf_counter()
+        
+        try:
+            result = await _deadlines.run(name, run_tool(name, arguments))
+            # Speculation must never fail the call that triggered it
+            try:
+                schedule_prefetches(name, arguments)
+            except Exception as e:
+                _metrics.increment("prefetch_errors_total")
+                logger.warning(f"Failed to schedule prefetches after {name}: {e}")
+            call_logger.info(
+                "Tool call finished",
+                extra={"latency_ms": (time.perf_counter() - start) * 1000},
+            )
+            return result
+        
+        except asyncio.CancelledError:
+            # Cancelled by the client: in-flight Bring! requests are cancelled with us
+            _metrics.increment("tool_cancellations_total", tool=name)
+            raise
+        
+        except Exception as e:
+            if isinstance(e, DeadlineExceeded):
+                _metrics.increment("tool_timeouts_total", tool=name)
+            elif is_timeout(e):
+                _metrics.increment("upstream_timeouts_total", tool=name)
+            _metrics.increment("tool_errors_total", tool=name)
+            span.record_error(e)
+            if record is not None:
+                record.error = str(e)
+            logger.error(
+                f"Error in tool {name}: {e}",
+                extra={"latency_ms": (time.perf_counter() - start) * 1000},
+            )
+            return [TextContent(
+                type="text",
+                text=f"Error: {str(e)}"
+            )]
+
+
+def is_timeout(error: BaseException) -> bool:
+    """Whether an error is, or was raised from, a timeout."""
+    # bring_api re-raises aiohttp timeouts as BringRequestException(...) from e
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, asyncio.TimeoutError):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+async def run_tool(name: str, arguments: Any) -> list[Union[TextContent, ImageContent]]:
+    """Run a tool, logging in again once if a reused session is rejected."""
     try:
-        bring = await get_bring_client()
+        return await handle_tool(name, arguments)
+    except BringAuthException:
+        if not _session_restored:
+            raise
+        # The reused token was revoked or expired early: log in and retry once
+        logger.warning("Reused Bring! session was rejected, logging in again")
+        await discard_session()
+        return await handle_tool(name, arguments)
+
+
+async def handle_tool(name: str, arguments: Any) -> list[Union[TextContent, ImageContent]]:
+    """Dispatch a tool call to the Bring! API and render the result."""
+    bring = await get_bring_client()
+    
+    if name == "bring_get_lists":
+        result = await get_lists(bring)
+        lists = safe_get_attr(result, "lists", [])
         
-        if name == "bring_get_lists":
-            result = await bring.load_lists()
-            lists = safe_get_attr(result, "lists", [])
-            
-            if not lists:
-                return [TextContent(type="text", text="No shopping lists found.")]
-            
+        if not lists:
+            return [TextContent(type="text", text="No shopping lists found.")]
+        
+        with _tracer.span("render"):
             output = "Shopping Lists:\n\n"
             for lst in lists:
                 name_val = safe_get_attr(lst, 'name', 'Unnamed')
@@ -293,186 +1071,215 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 output += f"UUID: {uuid_val}\n"
                 output += f"Theme: {theme_val}\n"
                 output += "---\n"
-            
-            return [TextContent(type="text", text=output)]
         
-        elif name == "bring_get_list_items":
-            list_uuid = arguments["list_uuid"]
-            items_response = await bring.get_list(list_uuid)
-            
-            # The response is BringItemsResponse which has an .items attribute
-            # That .items is an Items object with .purchase and .recently attributes
-            items_obj = safe_get_attr(items_response, "items")
-            
-            purchase_items = []
-            recent_items = []
-            
-            if items_obj:
-                purchase_items = safe_get_attr(items_obj, "purchase", [])
-                recent_items = safe_get_attr(items_obj, "recently", [])
-            
-            output = f"Items in list {list_uuid}:\n\n"
-            
-            if purchase_items:
-                output += "=== Active Items (To Purchase) ===\n"
-                for item in purchase_items:
-                    # BringPurchase objects use 'itemId' not 'name', and 'spec' not 'specification'
-                    name = safe_get_attr(item, "itemId") or safe_get_attr(item, "name", "Unknown")
-                    spec = safe_get_attr(item, "spec") or safe_get_attr(item, "specification", "")
-                    uuid = safe_get_attr(item, "uuid", "")
-                    output += f"- {name}"
-                    if spec:
-                        output += f" ({spec})"
-                    if uuid:
-                        output += f" [UUID: {uuid}]"
-                    output += "\n"
-                output += "\n"
-            
-            if recent_items:
-                output += "=== Recently Completed ===\n"
-                for item in recent_items:
-                    name = safe_get_attr(item, "itemId") or safe_get_attr(item, "name", "Unknown")
-                    spec = safe_get_attr(item, "spec") or safe_get_attr(item, "specification", "")
-                    output += f"- {name}"
-                    if spec:
-                        output += f" ({spec})"
-                    output += "\n"
-            
-            if not purchase_items and not recent_items:
-                output += "List is empty.\n"
-            
-            return [TextContent(type="text", text=output)]
+        return [TextContent(type="text", text=output)]
+    
+    elif name == "bring_get_list_items":
+        list_uuid = arguments["list_uuid"]
+        items_response = await get_list(bring, list_uuid)
+        sections = await get_grouping_sections(bring) if arguments.get("group_by_section") else None
         
-        elif name == "bring_add_item":
-            list_uuid = arguments["list_uuid"]
-            item_name = arguments["item_name"]
-            specification = arguments.get("specification", "")
-            
-            await bring.save_item(list_uuid, item_name, specification)
-            
-            msg = f"Successfully added '{item_name}'"
-            if specification:
-                msg += f" ({specification})"
-            msg += f" to list {list_uuid}"
-            
-            return [TextContent(type="text", text=msg)]
+        with _tracer.span("render"):
+            output = render_list_items(list_uuid, items_response, sections)
         
-        elif name == "bring_complete_item":
-            list_uuid = arguments["list_uuid"]
-            item_name = arguments["item_name"]
-            
-            await bring.complete_item(list_uuid, item_name)
-            
-            return [TextContent(
-                type="text",
-                text=f"Successfully marked '{item_name}' as completed in list {list_uuid}"
-            )]
+        return [TextContent(type="text", text=output)]
+    
+    elif name == "bring_add_item":
+        list_uuid = arguments["list_uuid"]
+        item_name = arguments["item_name"]
+        specification = arguments.get("specification", "")
         
-        elif name == "bring_remove_item":
-            list_uuid = arguments["list_uuid"]
-            item_name = arguments["item_name"]
-            
-            await bring.remove_item(list_uuid, item_name)
-            
-            return [TextContent(
-                type="text",
-                text=f"Successfully removed '{item_name}' from list {list_uuid}"
-            )]
+        item_id = await canonicalize_item_name(bring, item_name)
+        await bring.save_item(list_uuid, item_id, specification)
+        await invalidate_list(list_uuid)
         
-        elif name == "bring_batch_update_items":
-            list_uuid = arguments["list_uuid"]
-            items = arguments["items"]
-            operation = arguments["operation"]
-            
-            # Convert operation string to BringItemOperation enum
-            if operation == "ADD":
-                op = BringItemOperation.ADD
-            elif operation == "COMPLETE":
-                op = BringItemOperation.COMPLETE
-            elif operation == "REMOVE":
-                op = BringItemOperation.REMOVE
-            else:
-                raise ValueError(f"Invalid operation: {operation}")
-            
-            # Add UUIDs to items that don't have them (for ADD operations)
-            if operation == "ADD":
-                for item in items:
-                    if "uuid" not in item or not item["uuid"]:
-                        item["uuid"] = str(uuid4())
-            
-            await bring.batch_update_list(list_uuid, items, op)
-            
-            item_count = len(items)
-            return [TextContent(
-                type="text",
-                text=f"Successfully performed {operation} operation on {item_count} item(s) in list {list_uuid}"
-            )]
+        msg = f"Successfully added '{item_name}'"
+        if item_id != item_name:
+            msg += f" as '{item_id}'"
+        if specification:
+            msg += f" ({specification})"
+        msg += f" to list {list_uuid}"
         
-        elif name == "bring_get_user_info":
-            user_info = await bring.get_user_account()
-            
-            output = "User Information:\n\n"
-            output += f"Email: {safe_get_attr(user_info, 'email', 'N/A')}\n"
-            output += f"User UUID: {safe_get_attr(user_info, 'userUuid', 'N/A')}\n"
-            output += f"Name: {safe_get_attr(user_info, 'name', 'N/A')}\n"
-            output += f"Photo Path: {safe_get_attr(user_info, 'photoPath', 'N/A')}\n"
-            
-            return [TextContent(type="text", text=output)]
+        return [TextContent(type="text", text=msg)]
+    
+    elif name == "bring_complete_item":
+        list_uuid = arguments["list_uuid"]
+        item_name = arguments["item_name"]
         
-        elif name == "bring_get_list_details":
-            list_uuid = arguments["list_uuid"]
-            details = await bring.get_list_details(list_uuid)
-            
-            output = f"List Details for {list_uuid}:\n\n"
-            output += f"Name: {safe_get_attr(details, 'name', 'N/A')}\n"
-            output += f"Theme: {safe_get_attr(details, 'theme', 'N/A')}\n"
-            
-            # Include any additional details if it's a dict
-            if isinstance(details, dict):
-                for key, value in details.items():
-                    if key not in ['name', 'theme', 'listUuid']:
-                        output += f"{key}: {value}\n"
-            
-            return [TextContent(type="text", text=output)]
+        # Match the itemId bring_add_item stored for the same name
+        item_id = await canonicalize_item_name(bring, item_name)
+        await bring.complete_item(list_uuid, item_id)
+        await invalidate_list(list_uuid)
+        
+        as_id = f" ('{item_id}')" if item_id != item_name else ""
+        return [TextContent(
+            type="text",
+            text=f"Successfully marked '{item_name}'{as_id} as completed in list {list_uuid}"
+        )]
+    
+    elif name == "bring_remove_item":
+        list_uuid = arguments["list_uuid"]
+        item_name = arguments["item_name"]
+        
+        item_id = await canonicalize_item_name(bring, item_name)
+        await bring.remove_item(list_uuid, item_id)
+        await invalidate_list(list_uuid)
+        
+        as_id = f" ('{item_id}')" if item_id != item_name else ""
+        return [TextContent(
+            type="text",
+            text=f"Successfully removed '{item_name}'{as_id} from list {list_uuid}"
+        )]
+    
+    elif name == "bring_batch_update_items":
+        list_uuid = arguments["list_uuid"]
+        items = arguments["items"]
+        operation = arguments["operation"]
+        
+        # Convert operation string to BringItemOperation enum
+        if operation == "ADD":
+            op = BringItemOperation.ADD
+        elif operation == "COMPLETE":
+            op = BringItemOperation.COMPLETE
+        elif operation == "REMOVE":
+            op = BringItemOperation.REMOVE
+        else:
+            raise ValueError(f"Invalid operation: {operation}")
+        
+        # Resolve localized names to canonical catalog itemIds
+        for item in items:
+            item["itemId"] = await canonicalize_item_name(bring, item["itemId"])
+        
+        # Add UUIDs to items that don't have them (for ADD operations)
+        if operation == "ADD":
+            for item in items:
+                if "uuid" not in item or not item["uuid"]:
+                    item["uuid"] = str(uuid4())
+        
+        await bring.batch_update_list(list_uuid, items, op)
+        await invalidate_list(list_uuid)
+        
+        item_count = len(items)
+        return [TextContent(
+            type="text",
+            text=f"Successfully performed {operation} operation on {item_count} item(s) in list {list_uuid}"
+        )]
+    
+    elif name == "bring_sync_list":
+        list_uuid = arguments["list_uuid"]
+        unwanted = arguments.get("unwanted", "complete")
         
-        elif name == "bring_get_item_details":
-            item_ids = arguments["item_ids"]
-            locale = arguments.get("locale")
+        canonical = await get_item_name_resolver(bring)
+        desired = [(canonical(item["itemId"]), item.get("spec")) for item in arguments["items"]]
+        
+        # Read, plan and write in the list's slot, so concurrent syncs of a list
+        # never plan against the same snapshot
+        async with _sequencer.hold(list_uuid):
+            # Plan against the live list, not a cached snapshot. Its itemIds come back
+            # translated into the list's language, so match them by catalog itemId too
+            items_obj = safe_get_attr(await bring.get_list(list_uuid), "items")
+            changes = plan_sync(
+                safe_get_attr(items_obj, "purchase", []) if items_obj else [],
+                safe_get_attr(items_obj, "recently", []) if items_obj else [],
+                desired,
+                unwanted,
+                key=canonical,
+            )
             
-            if locale:
-                details = await bring.get_items_details(locale)
-            else:
-                details = await bring.get_items_details()
+            if not changes:
+                return [TextContent(type="text", text=f"List {list_uuid} is already up to date.")]
             
-            # Filter to requested items
-            filtered_items = [
-                item for item in details
-                if safe_get_attr(item, "itemId") in item_ids
+            operations = {
+                ADD: BringItemOperation.ADD,
+                COMPLETE: BringItemOperation.COMPLETE,
+                REMOVE: BringItemOperation.REMOVE,
+            }
+            batch = [
+                {
+                    "itemId": change.item_id,
+                    "spec": change.spec,
+                    "uuid": change.uuid or str(uuid4()),
+                    "operation": operations[change.operation],
+                }
+                for change in changes
             ]
             
-            if not filtered_items:
-                return [TextContent(
-                    type="text",
-                    text=f"No details found for items: {', '.join(item_ids)}"
-                )]
-            
+            # Every change carries its own operation, so one request applies them all
+            await bring.batch_update_list(list_uuid, batch)
+        await invalidate_list(list_uuid)
+        
+        output = f"Synced list {list_uuid}: {len(changes)} change(s)\n\n"
+        for operation in operations:
+            for change in changes:
+                if change.operation == operation:
+                    output += f"{operation}: {change.describe()}\n"
+        
+        return [TextContent(type="text", text=output)]
+    
+    elif name == "bring_get_user_info":
+        user_info = await bring.get_user_account()
+        
+        output = "User Information:\n\n"
+        output += f"Email: {safe_get_attr(user_info, 'email', 'N/A')}\n"
+        output += f"User UUID: {safe_get_attr(user_info, 'userUuid', 'N/A')}\n"
+        output += f"Name: {safe_get_attr(user_info, 'name', 'N/A')}\n"
+        output += f"Photo Path: {safe_get_attr(user_info, 'photoPath', 'N/A')}\n"
+        
+        return [TextContent(type="text", text=output)]
+    
+    elif name == "bring_get_list_details":
+        list_uuid = arguments["list_uuid"]
+        details = await get_list_details(bring, list_uuid)
+        
+        output = f"List Details for {list_uuid}:\n\n"
+        output += f"Name: {safe_get_attr(details, 'name', 'N/A')}\n"
+        output += f"Theme: {safe_get_attr(details, 'theme', 'N/A')}\n"
+        
+        # Include any additional details if it's a dict
+        if isinstance(details, dict):
+            for key, value in details.items():
+                if key not in ['name', 'theme', 'listUuid']:
+                    output += f"{key}: {value}\n"
+        
+        return [TextContent(type="text", text=output)]
+    
+    elif name == "bring_get_item_details":
+        item_ids = arguments["item_ids"]
+        locale = arguments.get("locale")
+        
+        details = await get_catalog(bring, locale)
+        
+        # Filter to requested items
+        filtered_items = [
+            item for item in details
+            if safe_get_attr(item, "itemId") in item_ids
+        ]
+        
+        if not filtered_items:
+            return [TextContent(
+                type="text",
+                text=f"No details found for items: {', '.join(item_ids)}"
+            )]
+        
+        with _tracer.span("render"):
             output = "Item Details:\n\n"
             for item in filtered_items:
                 output += f"Item: {safe_get_attr(item, 'itemId', 'Unknown')}\n"
                 output += f"  Translations: {safe_get_attr(item, 'translations', {})}\n"
                 output += f"  Image: {safe_get_attr(item, 'imagePath', 'N/A')}\n"
                 output += "---\n"
-            
-            return [TextContent(type="text", text=output)]
         
-        elif name == "bring_get_all_item_details":
-            locale = arguments.get("locale", "en-US")
-            
-            details = await bring.get_items_details(locale)
-            
+        return [TextContent(type="text", text=output)]
+    
+    elif name == "bring_get_all_item_details":
+        locale = arguments.get("locale", "en-US")
+        
+        details = await get_catalog(bring, locale)
+        
+        with _tracer.span("render"):
             output = f"All Items (Locale: {locale}):\n\n"
             output += f"Total items: {len(details)}\n\n"
-            
+        
             # Show first 50 items to avoid overwhelming output
             for item in details[:50]:
                 item_id = safe_get_attr(item, "itemId", "Unknown")
@@ -484,37 +1291,93 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                     if first_trans:
                         output += f": {first_trans}"
                 output += "\n"
-            
+        
             if len(details) > 50:
                 output += f"\n... and {len(details) - 50} more items"
-            
-            return [TextContent(type="text", text=output)]
         
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+        return [TextContent(type="text", text=output)]
     
-    except Exception as e:
-        logger.error(f"Error in tool {name}: {e}")
-        return [TextContent(
-            type="text",
-            text=f"Error: {str(e)}"
-        )]
+    elif name == "bring_get_item_image":
+        item_id = arguments["item_id"]
+        locale = arguments.get("locale")
+        
+        index = await get_translation_index(bring, locale)
+        item_id = index.canonicalize(item_id)
+        
+        details = await get_catalog(bring, locale)
+        item = next(
+            (entry for entry in details if safe_get_attr(entry, "itemId") == item_id),
+            None,
+        )
+        image_path = safe_get_attr(item, "imagePath") if item is not None else None
+        
+        if not image_path:
+            return [TextContent(type="text", text=f"No image found for item: {item_id}")]
+        
+        data, mime_type = await fetch_item_image(image_path)
+        
+        return [
+            TextContent(type="text", text=f"Image for {item_id}:"),
+            ImageContent(
+                type="image",
+                data=base64.b64encode(data).decode("ascii"),
+                mimeType=mime_type,
+            ),
+        ]
+    
+    else:
+        raise ValueError(f"Unknown tool: {name}")
 
 
 async def cleanup():
     """Cleanup resources on shutdown."""
-    global _session, _bring
+    global _session, _bring, _list_watcher, _shared_cache, _session_store, _session_restored
+    
+    if _list_watcher is not None:
+        await _list_watcher.close()
+        _list_watcher = None
+    
+    if _session_store is not None:
+        await save_session()
+        _session_store = None
+    
+    if _prefetcher is not None:
+        await _prefetcher.close()
     
     if _session:
         await _session.close()
         _session = None
     
+    if _profiler is not None:
+        _profiler.stop()
+    
+    if _lag_monitor is not None:
+        _lag_monitor.stop()
+    
+    # Traces and traffic captures still queued for the writer thread
+    await asyncio.to_thread(background_writer().flush)
+    
+    if _shared_cache is not None:
+        _shared_cache.close()
+        _shared_cache = None
+    
     _bring = None
+    _session_restored = False
+    _catalog_cache.clear()
+    _catalog_failures.clear()
+    _translation_indexes.clear()
+    _section_indexes.clear()
+    _catalog_pool.clear()
     logger.info("Cleanup completed")
 
 
-async def main():
-    """Main entry point for the server."""
+def create_initialization_options() -> Any:
+    """Initialization options advertising resource subscriptions."""
+    return app.create_initialization_options()
+
+
+async def serve_stdio():
+    """Serve a single client over stdio."""
     from mcp.server.stdio import stdio_server
     
     async with stdio_server() as (read_stream, write_stream):
@@ -522,11 +1385,128 @@ async def main():
             await app.run(
                 read_stream,
                 write_stream,
-                app.create_initialization_options()
+                create_initialization_options()
             )
         finally:
             await cleanup()
 
 
+def setup_logging() -> None:
+    """Route logging through the queue-based pipeline (once per process)."""
+    global _log_pipeline
+    
+    if _log_pipeline is None:
+        _log_pipeline = log_pipeline_from_env(_metrics)
+        _log_pipeline.start()
+
+
+def create_http_app(stateless: Optional[bool] = None) -> Any:
+    """Create the ASGI app for the streamable HTTP transport (one per worker)."""
+    if stateless is None:
+        stateless = int(os.getenv("BRING_HTTP_WORKERS", 1)) > 1
+    setup_logging()
+    from contextlib import asynccontextmanager
+    
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+    
+    # Workers share one listening socket, so requests of a client may land on
+    # any worker: run stateless and keep shared state in the shared cache. A
+    # single process keeps sessions, so subscriptions and prefetching work.
+    session_manager = StreamableHTTPSessionManager(app=app, stateless=stateless)
+    
+    async def handle_mcp(scope: Any, receive: Any, send: Any) -> None:
+        await session_manager.handle_request(scope, receive, send)
+    
+    @asynccontextmanager
+    async def lifespan(_: Any) -> Any:
+        async with session_manager.run():
+            try:
+                yield
+            finally:
+                await cleanup()
+    
+    return Starlette(routes=[Mount("/mcp", app=handle_mcp)], lifespan=lifespan)
+
+
+async def _login_for_workers() -> Dict[str, Any]:
+    """Log in once in the parent process and export the session for the workers."""
+    try:
+        await get_bring_client()
+        return export_session(_bring)
+    finally:
+        await cleanup()
+
+
+def serve_http(host: str, port: int, workers: int, loop: str = "auto") -> None:
+    """Serve over streamable HTTP, optionally with several pre-forked workers."""
+    import uvicorn
+    
+    os.environ["BRING_HTTP_WORKERS"] = str(workers)
+    handoff = None
+    if workers > 1:
+        # Workers inherit the environment: point them all at one shared cache
+        # and hand them the parent's login instead of logging in N times. The
+        # tokens go through an owner-only file; only its path is inherited.
+        os.environ.setdefault("BRING_CACHE_PATH", str(DEFAULT_CACHE_PATH))
+        handoff = write_handoff(asyncio.run(_login_for_workers()))
+        os.environ["BRING_SESSION_HANDOFF"] = handoff
+    
+    try:
+        uvicorn.run(
+            "bring_mcp_server.server:create_http_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            loop=loop,
+        )
+    finally:
+        if handoff is not None:
+            os.environ.pop("BRING_SESSION_HANDOFF", None)
+            os.unlink(handoff)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main entry point for the server."""
+    parser = argparse.ArgumentParser(prog="bring-mcp-server", description="Bring! MCP server")
+    parser.add_argument(
+        "--transport", choices=["stdio", "http"], default="stdio",
+        help="Transport to serve (default: stdio)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP bind address")
+    parser.add_argument("--port", type=int, default=8000, help="HTTP port")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Number of HTTP worker processes sharing the cache and login",
+    )
+    parser.add_argument(
+        "--loop", choices=runtime.LOOP_CHOICES, default=os.getenv("BRING_EVENT_LOOP", "auto"),
+        help="Event loop implementation (default: uvloop when installed)",
+    )
+    parser.add_argument(
+        "--eager-tasks", action="store_true",
+        default=os.getenv("BRING_EAGER_TASKS", "").lower() in ("1", "true", "yes"),
+        help="Run new tasks eagerly until their first suspension (Python 3.12+, stdio only)",
+    )
+    
+    subparsers = parser.add_subparsers(dest="command")
+    bench_parser = subparsers.add_parser(
+        "bench", help="Load test the server with simulated MCP clients and a stub Bring! backend"
+    )
+    bench.add_arguments(bench_parser)
+    
+    args = parser.parse_args(argv)
+    setup_logging()
+    
+    if args.command == "bench":
+        bench.run(args)
+    elif args.transport == "http":
+        serve_http(args.host, args.port, args.workers, args.loop)
+    else:
+        runtime.run(serve_stdio(), args.loop, args.eager_tasks)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
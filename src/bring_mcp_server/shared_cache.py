@@ -0,0 +1,159 @@
+"""
+Shared cache for the Bring! MCP Server
+
+A small SQLite-backed key/value store (WAL mode) that several server
+processes can use at the same time, so catalog and list data downloaded by
+one process is reused by the others. Entries expire after a TTL, and a
+short-lived lease makes sure only one process fetches a missing key while
+the others wait for its result.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# How long a process may hold the right to fetch a missing key
+DEFAULT_LEASE_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leases (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class SharedCache:
+    """SQLite-backed key/value cache with TTLs, safe for concurrent processes."""
+
+    def __init__(self, path: Path, lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self._owner = f"{os.getpid()}-{id(self):x}"
+        self._local = threading.local()
+        self._connections: list = []
+        self._connections_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+        try:
+            os.chmod(self.path, 0o600)
+        except OSError:
+            pass
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread; SQLite handles cross-process locking
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=10.0, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired."""
+        row = self._connect().execute(
+            "SELECT value FROM entries WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a JSON-serializable value for ttl seconds."""
+        self._connect().execute(
+            "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value, separators=(",", ":")), time.time() + ttl),
+        )
+
+    def delete(self, key: str) -> None:
+        self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """Remove expired entries and leases; return the number of entries removed."""
+        now = time.time()
+        conn = self._connect()
+        conn.execute("DELETE FROM leases WHERE expires_at <= ?", (now,))
+        return conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,)).rowcount
+
+    def acquire_lease(self, key: str) -> bool:
+        """Try to become the one process that fetches a key."""
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT expires_at FROM leases WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[0] > now:
+                conn.execute("COMMIT")
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)",
+                (key, self._owner, now + self.lease_seconds),
+            )
+            conn.execute("COMMIT")
+            return True
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def release_lease(self, key: str) -> None:
+        self._connect().execute(
+            "DELETE FROM leases WHERE key = ? AND owner = ?", (key, self._owner)
+        )
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        poll_interval: float = 0.05,
+    ) -> Any:
+        """Return the cached value, or fetch it once across all processes sharing the cache."""
+        while True:
+            value = await asyncio.to_thread(self.get, key)
+            if value is not None:
+                return value
+
+            if await asyncio.to_thread(self.acquire_lease, key):
+                try:
+                    # The previous lease holder may have stored the value since our miss
+                    value = await asyncio.to_thread(self.get, key)
+                    if value is not None:
+                        return value
+                    value = await fetch()
+                    await asyncio.to_thread(self.set, key, value, ttl)
+                    return value
+                finally:
+                    await asyncio.to_thread(self.release_lease, key)
+
+            # Another process is fetching; wait for its result (or its lease to lapse)
+            await asyncio.sleep(poll_interval)
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        # Threads that still hold a closed connection reconnect on next use
+        self._local = threading.local()
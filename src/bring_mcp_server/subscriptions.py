@@ -0,0 +1,140 @@
+"""
+List subscriptions for the Bring! MCP Server
+
+A single shared poller fetches each subscribed shopping list once per
+interval, no matter how many sessions watch it, and sends
+``resources/updated`` notifications only when the rendered content changes.
+"""
+
+import asyncio
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+LIST_URI_PREFIX = "bring://lists/"
+
+DEFAULT_POLL_INTERVAL = 30.0
+
+
+def list_uri(list_uuid: str) -> str:
+    """Build the resource URI for a shopping list."""
+    return f"{LIST_URI_PREFIX}{list_uuid}"
+
+
+def list_uuid_from_uri(uri: Any) -> str:
+    """Extract the list UUID from a resource URI."""
+    uri = str(uri)
+    if not uri.startswith(LIST_URI_PREFIX) or len(uri) == len(LIST_URI_PREFIX):
+        raise ValueError(f"Unknown resource: {uri}")
+    return uri[len(LIST_URI_PREFIX):]
+
+
+class ListWatcher:
+    """Shared poller that notifies subscribed sessions when a list changes."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[str]],
+        interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self._fetch = fetch
+        self.interval = interval
+
+        # list_uuid -> sessions subscribed to it
+        self._subscribers: Dict[str, Set[Any]] = {}
+        # list_uuid -> last rendered content and its digest
+        self._snapshots: Dict[str, str] = {}
+        self._digests: Dict[str, str] = {}
+
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, list_uuid: str, session: Any) -> None:
+        self._subscribers.setdefault(list_uuid, set()).add(session)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def unsubscribe(self, list_uuid: str, session: Any) -> None:
+        sessions = self._subscribers.get(list_uuid)
+        if sessions is None:
+            return
+        sessions.discard(session)
+        if not sessions:
+            self._drop(list_uuid)
+
+    def unsubscribe_all(self, session: Any) -> None:
+        """Stop watching lists for a session that has ended."""
+        for list_uuid in [u for u, sessions in self._subscribers.items() if session in sessions]:
+            self.unsubscribe(list_uuid, session)
+
+    def _drop(self, list_uuid: str) -> None:
+        self._subscribers.pop(list_uuid, None)
+        self._snapshots.pop(list_uuid, None)
+        self._digests.pop(list_uuid, None)
+
+    def is_watched(self, list_uuid: str) -> bool:
+        return list_uuid in self._subscribers
+
+    def snapshot(self, list_uuid: str) -> Optional[str]:
+        """Return the last polled content of a watched list, if any."""
+        return self._snapshots.get(list_uuid)
+
+    def invalidate(self, list_uuid: str) -> None:
+        """Forget the snapshot of a list after a write, so it is not served stale."""
+        self._snapshots.pop(list_uuid, None)
+
+    def record(self, list_uuid: str, content: str) -> bool:
+        """Store fresh content for a watched list; return True if it changed."""
+        if list_uuid not in self._subscribers:
+            return False
+
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        previous = self._digests.get(list_uuid)
+        self._digests[list_uuid] = digest
+        self._snapshots[list_uuid] = content
+        # The first poll only establishes the baseline
+        return previous is not None and previous != digest
+
+    async def poll_once(self) -> None:
+        """Fetch every watched list once and notify subscribers of changes."""
+        for list_uuid in list(self._subscribers):
+            try:
+                content = await self._fetch(list_uuid)
+            except Exception as e:
+                logger.warning(f"Failed to poll list {list_uuid}: {e}")
+                continue
+
+            await self.update(list_uuid, content)
+
+    async def update(self, list_uuid: str, content: str) -> None:
+        """Record fresh content for a list, however it was fetched, and notify on change."""
+        if self.record(list_uuid, content):
+            await self._notify(list_uuid)
+
+    async def _notify(self, list_uuid: str) -> None:
+        uri = list_uri(list_uuid)
+        for session in list(self._subscribers.get(list_uuid, ())):
+            try:
+                await session.send_resource_updated(uri)
+            except Exception as e:
+                # The session is gone; stop notifying it
+                logger.debug(f"Dropping subscriber of {uri}: {e}")
+                self.unsubscribe(list_uuid, session)
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            await self.poll_once()
+            await asyncio.sleep(self.interval)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._subscribers.clear()
+        self._snapshots.clear()
+        self._digests.clear()
@@ -0,0 +1,111 @@
+"""
+List synchronization for the Bring! MCP Server
+
+Computes the smallest set of changes that makes a shopping list match a
+desired set of items. Items are matched by normalized name through dict
+lookups, so planning is linear in the size of the list and the desired set.
+Names can first be mapped to catalog itemIds, as Bring! returns list items
+translated into the list's language.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .catalog import _get, normalize_name
+
+ADD = "ADD"
+COMPLETE = "COMPLETE"
+REMOVE = "REMOVE"
+
+# What to do with active items that are not in the desired set
+UNWANTED_ACTIONS = ("complete", "remove", "keep")
+
+
+class SyncChange:
+    """One item operation of a sync plan."""
+
+    __slots__ = ("operation", "item_id", "spec", "uuid", "reason")
+
+    def __init__(self, operation: str, item_id: str, spec: str, uuid: Optional[str], reason: str):
+        self.operation = operation
+        self.item_id = item_id
+        self.spec = spec
+        self.uuid = uuid
+        self.reason = reason
+
+    def describe(self) -> str:
+        text = self.item_id
+        if self.spec:
+            text += f" ({self.spec})"
+        return f"{text} - {self.reason}"
+
+
+def _spec(item: Any) -> str:
+    return _get(item, "spec") or _get(item, "specification") or ""
+
+
+def _by_name(items: Iterable[Any], key: Callable[[str], str]) -> Dict[str, Any]:
+    # The first entry wins if an item is on the list more than once
+    index: Dict[str, Any] = {}
+    for item in items or []:
+        item_id = _get(item, "itemId") or _get(item, "name")
+        if item_id:
+            index.setdefault(normalize_name(key(item_id)), item)
+    return index
+
+
+def plan_sync(
+    purchase: Iterable[Any],
+    recently: Iterable[Any],
+    desired: Iterable[Tuple[str, Optional[str]]],
+    unwanted: str = "complete",
+    key: Optional[Callable[[str], str]] = None,
+) -> List[SyncChange]:
+    """Plan the changes that make the active items match the desired (itemId, spec) pairs.
+
+    A spec of None means "any spec": an item already on the list is left as it is.
+    ``key`` maps item names (e.g. localized ones) to the ids they are matched by.
+    """
+    if unwanted not in UNWANTED_ACTIONS:
+        raise ValueError(f"Invalid value for unwanted items: {unwanted}")
+
+    key = key or (lambda name: name)
+    active = _by_name(purchase, key)
+    completed = _by_name(recently, key)
+
+    wanted: Dict[str, Tuple[str, Optional[str]]] = {}
+    for item_id, spec in desired:
+        wanted[normalize_name(key(item_id))] = (item_id, spec.strip() if spec is not None else None)
+
+    changes: List[SyncChange] = []
+    for name, (item_id, spec) in wanted.items():
+        current = active.get(name)
+        if current is not None:
+            current_spec = _spec(current)
+            if spec is not None and spec != current_spec.strip():
+                changes.append(SyncChange(
+                    ADD, _get(current, "itemId") or item_id, spec, _get(current, "uuid"),
+                    f"spec changed from '{current_spec}'" if current_spec else "spec added",
+                ))
+            continue
+
+        previous = completed.get(name)
+        if previous is not None:
+            changes.append(SyncChange(
+                ADD, _get(previous, "itemId") or item_id,
+                spec if spec is not None else _spec(previous), _get(previous, "uuid"),
+                "moved back from recently completed",
+            ))
+        else:
+            changes.append(SyncChange(ADD, item_id, spec or "", None, "added"))
+
+    if unwanted != "keep":
+        operation = COMPLETE if unwanted == "complete" else REMOVE
+        reason = "completed" if unwanted == "complete" else "removed"
+        for name, current in active.items():
+            if name not in wanted:
+                changes.append(SyncChange(
+                    operation, _get(current, "itemId") or _get(current, "name"),
+                    _spec(current), _get(current, "uuid"), reason,
+                ))
+
+    return changes
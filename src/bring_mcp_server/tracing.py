@@ -0,0 +1,211 @@
+"""
+Tracing for the Bring! MCP Server
+
+Records a span per tool call, with child spans for Bring! client calls and
+rendering, and appends each finished trace to a JSONL file in the
+OpenTelemetry OTLP/JSON shape (one ``resourceSpans`` export per line).
+Exports are serialized and written on the background writer thread.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from .writer import BackgroundWriter, background_writer
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "bring-mcp-server"
+
+SPAN_KIND_INTERNAL = "SPAN_KIND_INTERNAL"
+SPAN_KIND_CLIENT = "SPAN_KIND_CLIENT"
+SPAN_KIND_SERVER = "SPAN_KIND_SERVER"
+
+# Client methods whose first argument is a list UUID
+LIST_METHODS = frozenset({
+    "get_list", "get_list_details", "save_item", "update_item",
+    "complete_item", "remove_item", "batch_update_list",
+})
+
+
+def _otel_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    """A single timed operation within a trace."""
+
+    __slots__ = (
+        "name", "kind", "trace_id", "span_id", "parent_span_id",
+        "start_ns", "end_ns", "attributes", "error",
+    )
+
+    def __init__(self, name: str, kind: str, trace_id: str, parent_span_id: Optional[str]):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        self.error = f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def to_otel(self) -> Dict[str, Any]:
+        """Convert to an OTLP/JSON span."""
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otel_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": (
+                {"code": "STATUS_CODE_ERROR", "message": self.error}
+                if self.error
+                else {"code": "STATUS_CODE_OK"}
+            ),
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+class _NoopSpan:
+    """Stand-in yielded when tracing is disabled."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("bring_current_span", default=None)
+
+
+class Tracer:
+    """Creates spans and exports finished traces to a JSONL file."""
+
+    def __init__(self, path: Optional[str] = None, writer: Optional[BackgroundWriter] = None):
+        self.path = path
+        self.writer = writer or background_writer()
+        self._pending: Dict[str, List[Span]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    @contextmanager
+    def span(self, name: str, kind: str = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Any]:
+        """Time a block as a span, nested under the current span if there is one."""
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent is not None else secrets.token_hex(16)
+        span = Span(name, kind, trace_id, parent.span_id if parent is not None else None)
+        span.attributes.update(attributes)
+        token = _current_span.set(span)
+
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(token)
+            # Spans outliving their parent (e.g. background tasks) are exported on their own
+            self._finish(span, is_root=parent is None or parent.end_ns is not None)
+
+    def _finish(self, span: Span, is_root: bool) -> None:
+        # Buffer spans until their root ends so each trace is one write
+        spans = self._pending.setdefault(span.trace_id, [])
+        spans.append(span)
+        if is_root:
+            self.writer.submit(self._export, self._pending.pop(span.trace_id))
+
+    def flush(self) -> None:
+        """Wait until finished traces have been written."""
+        self.writer.flush()
+
+    def _export(self, spans: List[Span]) -> None:
+        # Runs on the writer thread
+        record = {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": _otel_value(SERVICE_NAME)}],
+                },
+                "scopeSpans": [{
+                    "scope": {"name": "bring_mcp_server"},
+                    "spans": [span.to_otel() for span in spans],
+                }],
+            }]
+        }
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            logger.warning(f"Failed to export trace: {e}")
+
+
+class TracedClient:
+    """Proxy that wraps every coroutine method of the Bring client in a client span."""
+
+    def __init__(self, client: Any, tracer: Tracer):
+        self._client = client
+        self._tracer = tracer
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        tracer = self._tracer
+
+        @functools.wraps(attr)
+        async def traced(*args: Any, **kwargs: Any) -> Any:
+            with tracer.span(f"bring.{name}", kind=SPAN_KIND_CLIENT) as span:
+                if name in LIST_METHODS and args:
+                    span.set_attribute("bring.list_uuid", str(args[0]))
+                return await attr(*args, **kwargs)
+
+        return traced
+
+
+def tracer_from_env() -> Tracer:
+    """Create a tracer exporting to BRING_TRACE_FILE, or a disabled one."""
+    return Tracer(os.getenv("BRING_TRACE_FILE") or None)
@@ -0,0 +1,74 @@
+"""
+Background file output for the Bring! MCP Server
+
+Traces, traffic captures and profiles are written by a single background
+thread, so serializing and appending them never blocks the event loop.
+Work runs in submission order; ``flush`` waits until everything submitted
+so far has been written.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundWriter:
+    """Runs file-writing callables one at a time on a daemon thread."""
+
+    def __init__(self, name: str = "bring-writer"):
+        self.name = name
+        self._queue: "queue.Queue[Optional[Callable[[], Any]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            work = self._queue.get()
+            try:
+                if work is None:
+                    return
+                work()
+            except Exception as e:
+                logger.warning(f"Background write failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Run ``fn(*args)`` on the writer thread."""
+        self._ensure_started()
+        self._queue.put(lambda: fn(*args))
+
+    def flush(self) -> None:
+        """Wait until all submitted work has run."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Finish the submitted work and stop the thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        thread.join()
+
+
+_writer = BackgroundWriter()
+
+
+def background_writer() -> BackgroundWriter:
+    """The writer thread shared by tracing, traffic capture and profiling."""
+    return _writer
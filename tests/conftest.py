@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the Bring! MCP Server tests
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+async def reset_server_state():
+    """Start every test without a cached client or catalog."""
+    from bring_mcp_server import server
+
+    server._client_lock = asyncio.Lock()
+    server._bring = None
+    server._session = None
+    server._catalog_cache.clear()
+    server._translation_indexes.clear()
+    server._section_indexes.clear()
+    server._catalog_locks.clear()
+    server._catalog_failures.clear()
+    server._image_cache = None
+    server._image_fetches.clear()
+    server._list_watcher = None
+    server._shared_cache = None
+    server._shared_cache_lock = asyncio.Lock()
+    server._session_store = None
+    server._session_restored = False
+    yield
+    await server.cleanup()
+    if server._log_pipeline is not None:
+        server._log_pipeline.stop()
+        server._log_pipeline = None
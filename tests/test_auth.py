@@ -0,0 +1,163 @@
+"""
+Tests for encrypted session persistence
+"""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from bring_api import BringAuthException
+
+from bring_mcp_server.auth import SessionStore, read_handoff, write_handoff
+
+
+def make_state(**overrides):
+    state = {
+        'mail': 'test@example.com',
+        'uuid': 'user-uuid',
+        'public_uuid': 'public-uuid',
+        'headers': {'Authorization': 'Bearer token'},
+        'refresh_token': 'refresh',
+        'expires_at': time.time() + 3600,
+        'user_locale': 'de-DE',
+        'user_list_settings': {},
+    }
+    state.update(overrides)
+    return state
+
+
+def test_store_round_trip_is_encrypted(tmp_path):
+    """Stored sessions decrypt with the password and never hit the disk in clear text."""
+    path = tmp_path / 'session.bin'
+    state = make_state()
+    
+    SessionStore(path, 'pw').save(state)
+    
+    assert SessionStore(path, 'pw').load() == state
+    assert b'Bearer token' not in path.read_bytes()
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_store_rejects_wrong_password_and_tampering(tmp_path):
+    """A changed password or a modified file yields no session instead of an error."""
+    path = tmp_path / 'session.bin'
+    SessionStore(path, 'pw').save(make_state())
+    
+    assert SessionStore(path, 'other').load() is None
+    
+    path.write_text(path.read_text().replace('"token": "', '"token": "x'))
+    assert SessionStore(path, 'pw').load() is None
+    
+    SessionStore(path, 'pw').clear()
+    assert not path.exists()
+    assert SessionStore(path, 'pw').load() is None
+
+
+def make_client():
+    client = AsyncMock()
+    client.mail = 'test@example.com'
+    client.uuid = ''
+    client.public_uuid = ''
+    client.headers = {}
+    client.user_locale = 'de-DE'
+    client.user_list_settings = {}
+    client._expires_at = 0
+    client._Bring__refresh_token = None
+    
+    async def login():
+        client.uuid = 'user-uuid'
+        client.public_uuid = 'public-uuid'
+        client.headers['Authorization'] = 'Bearer token'
+        client._expires_at = time.time() + 3600
+    
+    client.login = AsyncMock(side_effect=login)
+    client.load_lists = AsyncMock(return_value=SimpleNamespace(
+        lists=[SimpleNamespace(name='Groceries', listUuid='list-1', theme='default')]
+    ))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_restart_reuses_session_and_relogs_in_when_rejected(tmp_path):
+    """A new process skips login(), and falls back to it once the token is rejected."""
+    clients = [make_client() for _ in range(3)]
+    env = {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw',
+           'BRING_SESSION_FILE': str(tmp_path / 'session.bin')}
+    
+    with patch.dict(os.environ, env), \
+            patch('bring_mcp_server.server.Bring', side_effect=clients):
+        from bring_mcp_server import server
+        
+        await server.call_tool('bring_get_lists', {})
+        clients[0].login.assert_called_once()
+        
+        # Restart: the stored session is reused
+        await server.cleanup()
+        result = await server.call_tool('bring_get_lists', {})
+        assert 'Groceries' in result[0].text
+        clients[1].login.assert_not_called()
+        assert clients[1].headers['Authorization'] == 'Bearer token'
+        
+        # The server revokes the token: log in again and retry the call
+        clients[1].load_lists.side_effect = BringAuthException('unauthorized')
+        result = await server.call_tool('bring_get_lists', {})
+        assert 'Groceries' in result[0].text
+        clients[2].login.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_share_one_login():
+    """No caller gets the client before it is authenticated, and login runs once."""
+    client = make_client()
+    login = client.login.side_effect
+    
+    async def slow_login():
+        await asyncio.sleep(0.05)
+        await login()
+    
+    client.login = AsyncMock(side_effect=slow_login)
+    
+    async def load_lists():
+        assert client.headers.get('Authorization') == 'Bearer token'
+        return SimpleNamespace(lists=[])
+    
+    client.load_lists = AsyncMock(side_effect=load_lists)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', side_effect=[client, make_client()]):
+        from bring_mcp_server import server
+        
+        results = await asyncio.gather(*(server.call_tool('bring_get_lists', {}) for _ in range(5)))
+    
+    assert not any(result[0].text.startswith('Error') for result in results)
+    client.login.assert_called_once()
+    assert client.load_lists.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_workers_reuse_the_parent_login_from_a_private_file():
+    """The parent's session reaches workers through an owner-only file, not the environment."""
+    path = write_handoff(make_state())
+    try:
+        assert os.stat(path).st_mode & 0o777 == 0o600
+        env = {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw',
+               'BRING_SESSION_HANDOFF': path}
+        client = make_client()
+        
+        with patch.dict(os.environ, env), \
+                patch('bring_mcp_server.server.Bring', return_value=client):
+            from bring_mcp_server import server
+            
+            result = await server.call_tool('bring_get_lists', {})
+            assert 'Groceries' in result[0].text
+            assert 'Bearer token' not in ''.join(os.environ.values())
+        
+        client.login.assert_not_called()
+        assert client.headers['Authorization'] == 'Bearer token'
+    finally:
+        os.unlink(path)
+    
+    assert read_handoff(path) is None
@@ -0,0 +1,70 @@
+"""
+Tests for the MCP load generator
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bring_mcp_server.bench import MIXES, StubBring, bench
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('mix', sorted(MIXES))
+async def test_bench_drives_the_protocol(mix):
+    """Every mix runs over real MCP sessions without tool errors."""
+    report = await bench(clients=3, calls=8, mix=mix)
+    
+    assert report.total_calls == 24
+    assert report.errors == 0
+    assert set(report.latencies) <= set(MIXES[mix])
+    assert report.upstream_calls > 0
+    assert 'p99 ms' in report.format()
+
+
+@pytest.mark.asyncio
+async def test_bench_bypasses_shared_cache_prefetcher_and_recorder(tmp_path):
+    """Stub data never reaches the account's shared cache or the capture file."""
+    from bring_mcp_server import server
+    
+    prefetcher, recorder = MagicMock(), MagicMock()
+    cache_path = tmp_path / 'cache.sqlite3'
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com',
+                                 'BRING_CACHE_PATH': str(cache_path)}), \
+            patch.object(server, '_prefetcher', prefetcher), \
+            patch.object(server, '_recorder', recorder):
+        report = await bench(clients=2, calls=8, mix='catalog-heavy')
+        
+        assert report.errors == 0
+        assert not cache_path.exists()
+        assert not prefetcher.mock_calls and not recorder.mock_calls
+        assert (server._prefetcher, server._recorder) == (prefetcher, recorder)
+        assert (await server.get_shared_cache()) is not None
+
+
+@pytest.mark.asyncio
+async def test_stub_backend_keeps_list_state():
+    """Writes to the stub are visible to later reads."""
+    stub = StubBring(lists=1, items_per_list=0)
+    list_uuid = stub.list_uuids[0]
+    
+    await stub.save_item(list_uuid, 'Milch', '1l')
+    await stub.batch_update_list(list_uuid, [{'itemId': 'Brot', 'operation': 'TO_PURCHASE'}])
+    await stub.complete_item(list_uuid, 'Milch')
+    response = await stub.get_list(list_uuid)
+    
+    assert [item.itemId for item in response.items.purchase] == ['Brot']
+    assert [(item.itemId, item.specification) for item in response.items.recently] == [('Milch', '1l')]
+    assert stub.upstream_calls == 4
+
+
+def test_bench_subcommand(capsys):
+    """bring-mcp-server bench prints the report."""
+    from bring_mcp_server.server import main
+    
+    main(['bench', '--clients', '2', '--calls', '3', '--mix', 'catalog-heavy'])
+    
+    out = capsys.readouterr().out
+    assert 'Mix: catalog-heavy' in out
+    assert 'Calls: 6' in out
@@ -0,0 +1,269 @@
+"""
+Tests for catalog name resolution
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+import os
+
+from bring_mcp_server.catalog import CatalogPool, SectionIndex, TranslationIndex, normalize_name
+
+
+CATALOG = [
+    {'itemId': 'Milch', 'translations': {'en-US': 'Milk', 'fr-FR': 'Lait'}, 'imagePath': 'milch.png'},
+    {'itemId': 'Käse', 'translations': {'en-US': 'Cheese', 'fr-FR': 'Fromage'}, 'imagePath': 'kaese.png'},
+    {'itemId': 'Crème fraîche', 'translations': {'en-US': 'Sour cream'}},
+]
+
+
+def test_normalize_name():
+    """Case, surrounding whitespace and diacritics are folded."""
+    assert normalize_name('  Käse ') == 'kase'
+    assert normalize_name('CRÈME  Fraîche') == 'creme fraiche'
+
+
+def test_translation_index_resolves_localized_names():
+    """Translated and canonical names resolve to the catalog itemId."""
+    index = TranslationIndex(CATALOG)
+    
+    assert index.resolve('milk') == 'Milch'
+    assert index.resolve('FROMAGE') == 'Käse'
+    assert index.resolve('kase') == 'Käse'
+    assert index.resolve('creme fraiche') == 'Crème fraîche'
+    assert index.resolve('Tofu') is None
+    assert index.canonicalize('Tofu') == 'Tofu'
+
+
+def test_translation_index_prefers_item_ids():
+    """A translation never shadows another entry's canonical itemId."""
+    index = TranslationIndex([
+        {'itemId': 'Apfel', 'translations': {'xx-XX': 'Birne'}},
+        {'itemId': 'Birne', 'translations': {}},
+    ])
+    
+    assert index.resolve('Birne') == 'Birne'
+
+
+def test_compact_catalog_behaves_like_raw_entries():
+    """Compact entries expose the same attributes and translation mapping."""
+    entries = CatalogPool().compact(CATALOG)
+    
+    assert [entry.itemId for entry in entries] == ['Milch', 'Käse', 'Crème fraîche']
+    assert entries[0].imagePath == 'milch.png'
+    assert entries[2].imagePath is None
+    assert dict(entries[1].translations) == {'en-US': 'Cheese', 'fr-FR': 'Fromage'}
+    assert entries[1].translations['fr-FR'] == 'Fromage'
+    assert list(entries[0].translations.values()) == ['Milk', 'Lait']
+    assert TranslationIndex(entries).resolve('lait') == 'Milch'
+
+
+def test_compact_catalog_shares_entries_across_locales():
+    """Catalogs of several locales share entries and translation rows."""
+    pool = CatalogPool()
+    de = pool.compact(CATALOG)
+    fr = pool.compact([dict(item) for item in CATALOG])
+    
+    assert all(a is b for a, b in zip(de, fr))
+    assert de[0].translations._layout is de[1].translations._layout
+
+
+SECTIONED_CATALOG = [
+    {'itemId': 'Äpfel', 'section': 'Fruits & Vegetables', 'translations': {}},
+    {'itemId': 'Milch', 'section': 'Dairy', 'translations': {}},
+    {'itemId': 'Salat', 'section': 'Fruits & Vegetables', 'translations': {}},
+    {'itemId': 'Käse', 'sectionId': 'Dairy', 'translations': {}},
+]
+
+
+def test_section_index_groups_in_catalog_order():
+    """Items are grouped by section in catalog order, unknown items last."""
+    index = SectionIndex(CatalogPool().compact(SECTIONED_CATALOG))
+    items = [SimpleNamespace(itemId=name) for name in ['Milch', 'Tofu', 'Salat', 'käse', 'Äpfel']]
+    
+    assert index.section('Käse') == 'Dairy'
+    assert index.section('apfel') == 'Fruits & Vegetables'
+    assert index.section('Tofu') is None
+    assert [(section, [i.itemId for i in group]) for section, group in index.group(items)] == [
+        ('Fruits & Vegetables', ['Salat', 'Äpfel']),
+        ('Dairy', ['Milch', 'käse']),
+        ('Other', ['Tofu']),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_items_grouped_by_section():
+    """bring_get_list_items groups by section using the cached catalog only."""
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(return_value=SECTIONED_CATALOG)
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(items=SimpleNamespace(
+        purchase=[SimpleNamespace(itemId='Milch', spec='', uuid=''),
+                  SimpleNamespace(itemId='Äpfel', spec='red', uuid='')],
+        recently=[],
+    )))
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import call_tool
+        
+        arguments = {'list_uuid': 'list-1', 'group_by_section': True}
+        result = await call_tool('bring_get_list_items', arguments)
+        await call_tool('bring_get_list_items', arguments)
+    
+    assert '[Fruits & Vegetables]\n- Äpfel (red)\n\n[Dairy]\n- Milch\n' in result[0].text
+    mock_bring.get_items_details.assert_called_once_with()
+
+
+LOCALIZED_CATALOG = [
+    {'itemId': 'Äpfel', 'section': 'Fruits & Vegetables', 'translations': {'en-US': 'Apples'}},
+    {'itemId': 'Milch', 'section': 'Dairy', 'translations': {'en-US': 'Milk'}},
+    {'itemId': 'Milk', 'section': 'Drinks', 'translations': {}},
+]
+
+
+@pytest.mark.asyncio
+async def test_localized_list_items_grouped_by_section():
+    """Items translated into the list's language are grouped under their catalog section."""
+    index = SectionIndex(CatalogPool().compact(LOCALIZED_CATALOG[:2]))
+    assert index.section('Milk') == 'Dairy'
+    assert index.section('apples') == 'Fruits & Vegetables'
+    assert SectionIndex(CatalogPool().compact(LOCALIZED_CATALOG)).section('Milk') == 'Drinks'
+    
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(return_value=LOCALIZED_CATALOG[:2])
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(items=SimpleNamespace(
+        purchase=[SimpleNamespace(itemId='Milk', spec='', uuid=''),
+                  SimpleNamespace(itemId='Apples', spec='', uuid='')],
+        recently=[],
+    )))
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import call_tool
+        
+        result = await call_tool('bring_get_list_items',
+                                 {'list_uuid': 'list-1', 'group_by_section': True})
+    
+    assert '[Fruits & Vegetables]\n- Apples\n\n[Dairy]\n- Milk\n' in result[0].text
+    assert '[Other]' not in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_add_item_uses_canonical_item_id():
+    """bring_add_item writes the catalog itemId and downloads the catalog once."""
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(return_value=CATALOG)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import call_tool
+        
+        result = await call_tool('bring_add_item', {'list_uuid': 'list-1', 'item_name': 'milk'})
+        await call_tool('bring_batch_update_items', {
+            'list_uuid': 'list-1',
+            'items': [{'itemId': 'cheese'}, {'itemId': 'Tofu'}],
+            'operation': 'ADD',
+        })
+    
+    assert "as 'Milch'" in result[0].text
+    mock_bring.save_item.assert_called_once_with('list-1', 'Milch', '')
+    
+    batch_items = mock_bring.batch_update_list.call_args.args[1]
+    assert [item['itemId'] for item in batch_items] == ['Käse', 'Tofu']
+    mock_bring.get_items_details.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_complete_and_remove_use_canonical_item_id():
+    """Completing or removing a localized name targets the itemId bring_add_item stored."""
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(return_value=CATALOG)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import call_tool
+        
+        result = await call_tool('bring_complete_item', {'list_uuid': 'list-1', 'item_name': 'milk'})
+        await call_tool('bring_remove_item', {'list_uuid': 'list-1', 'item_name': 'Fromage'})
+    
+    assert "'milk' ('Milch')" in result[0].text
+    mock_bring.complete_item.assert_called_once_with('list-1', 'Milch')
+    mock_bring.remove_item.assert_called_once_with('list-1', 'Käse')
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_download_catalog_once():
+    """Concurrent name lookups share one catalog download."""
+    mock_bring = AsyncMock()
+    
+    async def slow_catalog():
+        await asyncio.sleep(0.05)
+        return CATALOG
+    
+    mock_bring.get_items_details = AsyncMock(side_effect=slow_catalog)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import call_tool
+        
+        await asyncio.gather(*(
+            call_tool('bring_add_item', {'list_uuid': 'list-1', 'item_name': 'milk'})
+            for _ in range(10)
+        ))
+    
+    mock_bring.get_items_details.assert_called_once_with()
+    assert mock_bring.save_item.await_count == 10
+
+
+@pytest.mark.asyncio
+async def test_failed_catalog_download_is_not_retried_by_every_write():
+    """After a failed download, writes use the typed name until the retry period ends."""
+    mock_bring = AsyncMock()
+    
+    async def hanging_catalog():
+        await asyncio.sleep(0.05)
+        raise TimeoutError('catalog timed out')
+    
+    mock_bring.get_items_details = AsyncMock(side_effect=hanging_catalog)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring), \
+            patch('bring_mcp_server.server.CATALOG_RETRY', 0.2):
+        from bring_mcp_server.server import call_tool
+        
+        await asyncio.gather(*(
+            call_tool('bring_add_item', {'list_uuid': 'list-1', 'item_name': 'milk'})
+            for _ in range(5)
+        ))
+        assert mock_bring.get_items_details.await_count == 1
+        mock_bring.save_item.assert_awaited_with('list-1', 'milk', '')
+        
+        mock_bring.get_items_details = AsyncMock(return_value=CATALOG)
+        await asyncio.sleep(0.25)
+        await call_tool('bring_add_item', {'list_uuid': 'list-1', 'item_name': 'milk'})
+    
+    assert mock_bring.save_item.await_count == 6
+    mock_bring.save_item.assert_awaited_with('list-1', 'Milch', '')
+    mock_bring.get_items_details.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_list_items_ungrouped_when_catalog_is_unavailable():
+    """A failed catalog download does not fail a grouped listing of a fetched list."""
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(side_effect=TimeoutError('catalog timed out'))
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(items=SimpleNamespace(
+        purchase=[SimpleNamespace(itemId='Milch', spec='', uuid='')],
+        recently=[],
+    )))
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import call_tool
+        
+        result = await call_tool('bring_get_list_items',
+                                 {'list_uuid': 'list-1', 'group_by_section': True})
+    
+    assert not result[0].text.startswith('Error')
+    assert 'Milch' in result[0].text
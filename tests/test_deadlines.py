@@ -0,0 +1,148 @@
+"""
+Tests for tool deadlines, cancellation and metrics
+"""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import web
+from bring_api import BringRequestException
+
+from bring_mcp_server.deadlines import Deadlines, parse_overrides
+from bring_mcp_server.metrics import Metrics
+
+
+def test_parse_overrides():
+    """Per-tool deadlines are configured as tool=seconds pairs."""
+    assert parse_overrides('bring_get_lists=5, bring_get_item_image=0.5,') == {
+        'bring_get_lists': 5.0,
+        'bring_get_item_image': 0.5,
+    }
+    with pytest.raises(ValueError, match='tool=seconds'):
+        parse_overrides('bring_get_lists')
+    
+    deadlines = Deadlines(10, {'bring_get_lists': 5})
+    assert deadlines.for_tool('bring_get_lists') == 5
+    assert deadlines.for_tool('bring_add_item') == 10
+
+
+def test_metrics_render():
+    """Counters are rendered in the Prometheus text format."""
+    metrics = Metrics()
+    metrics.increment('tool_timeouts_total', tool='bring_get_lists')
+    metrics.increment('tool_timeouts_total', tool='bring_get_lists')
+    metrics.increment('tool_errors_total')
+    
+    assert metrics.get('tool_timeouts_total', tool='bring_get_lists') == 2
+    assert metrics.render() == (
+        'bring_tool_errors_total 1\n'
+        'bring_tool_timeouts_total{tool="bring_get_lists"} 2\n'
+    )
+
+
+@pytest.fixture
+async def hanging_url():
+    """URL of a local endpoint that never answers in time."""
+    release = asyncio.Event()
+    
+    async def hang(request):
+        await release.wait()
+        return web.Response(text='too late')
+    
+    http_app = web.Application()
+    http_app.router.add_get('/hang', hang)
+    runner = web.AppRunner(http_app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f'http://127.0.0.1:{port}/hang'
+    release.set()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_upstream_request(hanging_url):
+    """A hung endpoint fails the call at its deadline and frees the pooled connection."""
+    from bring_mcp_server import server
+    
+    async def load_lists():
+        async with server._session.get(hanging_url) as response:
+            return await response.text()
+    
+    mock_bring = AsyncMock()
+    mock_bring.load_lists = AsyncMock(side_effect=load_lists)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring), \
+            patch.object(server, '_deadlines', Deadlines(10, {'bring_get_lists': 0.2})), \
+            patch.object(server, '_metrics', Metrics()):
+        result = await asyncio.wait_for(server.call_tool('bring_get_lists', {}), 5)
+        
+        assert result[0].text == 'Error: bring_get_lists did not finish within 0.2s'
+        assert server._metrics.get('tool_timeouts_total', tool='bring_get_lists') == 1
+        assert not server._session.connector._acquired
+
+
+@pytest.mark.asyncio
+async def test_upstream_timeout_is_counted(hanging_url):
+    """An HTTP timeout wrapped by bring_api is counted as an upstream timeout."""
+    from bring_mcp_server import server
+    
+    async def load_lists():
+        # As bring_api's _request does
+        try:
+            async with server._session.get(hanging_url) as response:
+                return await response.text()
+        except TimeoutError as e:
+            raise BringRequestException('Loading lists failed due to connection timeout.') from e
+    
+    mock_bring = AsyncMock()
+    mock_bring.load_lists = AsyncMock(side_effect=load_lists)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring), \
+            patch.object(server, 'HTTP_TIMEOUT', 0.1), \
+            patch.object(server, '_metrics', Metrics()):
+        result = await asyncio.wait_for(server.call_tool('bring_get_lists', {}), 5)
+        
+        assert 'connection timeout' in result[0].text
+        assert server._metrics.get('upstream_timeouts_total', tool='bring_get_lists') == 1
+        assert server._metrics.get('tool_timeouts_total', tool='bring_get_lists') == 0
+
+
+@pytest.mark.asyncio
+async def test_client_cancellation_is_counted():
+    """Cancelling a call cancels its upstream work and is counted separately."""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+    
+    async def load_lists():
+        started.set()
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+    
+    mock_bring = AsyncMock()
+    mock_bring.load_lists = AsyncMock(side_effect=load_lists)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server import server
+        
+        with patch.object(server, '_metrics', Metrics()):
+            task = asyncio.create_task(server.call_tool('bring_get_lists', {}))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            
+            assert cancelled.is_set()
+            assert server._metrics.get('tool_cancellations_total', tool='bring_get_lists') == 1
+            
+            contents = await server.read_resource('bring://metrics')
+            assert 'bring_tool_cancellations_total{tool="bring_get_lists"} 1' in contents[0].content
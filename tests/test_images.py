@@ -0,0 +1,104 @@
+"""
+Tests for the on-disk item image cache
+"""
+
+import asyncio
+import base64
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from bring_mcp_server.images import ImageCache
+
+
+def test_cache_hit_and_content_addressing(tmp_path):
+    """Identical content is stored once and served from disk."""
+    cache = ImageCache(tmp_path, max_bytes=1024)
+    
+    digest_a = cache.put('https://img/a.png', b'same-bytes', 'image/png')
+    digest_b = cache.put('https://img/b.png', b'same-bytes', 'image/png')
+    
+    assert digest_a == digest_b
+    assert cache.total_bytes == len(b'same-bytes')
+    assert cache.get('https://img/a.png') == (b'same-bytes', 'image/png')
+    assert cache.get('https://img/missing.png') is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """The cache stays within its size bound by evicting the LRU image."""
+    cache = ImageCache(tmp_path, max_bytes=20)
+    
+    cache.put('a', b'a' * 8, 'image/png')
+    cache.put('b', b'b' * 8, 'image/png')
+    cache.get('a')
+    cache.put('c', b'c' * 8, 'image/png')
+    
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+    assert cache.total_bytes <= 20
+
+
+def test_cache_survives_restart(tmp_path):
+    """A new cache instance serves images written by a previous one, via mmap."""
+    ImageCache(tmp_path).put('https://img/a.png', b'png-data', 'image/png')
+    
+    cache = ImageCache(tmp_path, use_mmap=True)
+    data, mime_type = cache.get('https://img/a.png')
+    assert isinstance(data, memoryview) and data.readonly
+    assert (data, mime_type) == (b'png-data', 'image/png')
+
+
+@pytest.mark.asyncio
+async def test_get_item_image_fetches_once(tmp_path):
+    """bring_get_item_image downloads an image once and then serves it from disk."""
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(return_value=[
+        {'itemId': 'Milch', 'translations': {'en-US': 'Milk'}, 'imagePath': 'milch.png'},
+    ])
+    
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.read = AsyncMock(return_value=b'\x89PNG')
+    response.content_type = 'image/png'
+    request = MagicMock()
+    request.__aenter__ = AsyncMock(return_value=response)
+    request.__aexit__ = AsyncMock(return_value=False)
+    fake_session = MagicMock()
+    fake_session.get = MagicMock(return_value=request)
+    
+    env = {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw',
+           'BRING_IMAGE_CACHE_DIR': str(tmp_path)}
+    with patch.dict(os.environ, env), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server import server
+        
+        await server.get_bring_client()
+        await server._session.close()
+        server._session = fake_session
+        
+        # Concurrent misses share one download
+        first, _ = await asyncio.gather(
+            server.call_tool('bring_get_item_image', {'item_id': 'milk'}),
+            server.call_tool('bring_get_item_image', {'item_id': 'Milch'}),
+        )
+        second = await server.call_tool('bring_get_item_image', {'item_id': 'Milch'})
+        server._session = None
+    
+    assert first[1].type == 'image'
+    assert base64.b64decode(second[1].data) == b'\x89PNG'
+    assert second[1].mimeType == 'image/png'
+    fake_session.get.assert_called_once_with('https://web.getbring.com/assets/images/items/milch.png')
+
+
+def test_instances_sharing_a_directory_keep_each_others_entries(tmp_path):
+    """Writing the index merges URLs cached by other instances instead of dropping them."""
+    first, second = ImageCache(tmp_path), ImageCache(tmp_path)
+    first.put('https://img/a.png', b'a-data', 'image/png')
+    second.put('https://img/b.png', b'b-data', 'image/png')
+    
+    assert second.get('https://img/a.png') == (b'a-data', 'image/png')
+    restarted = ImageCache(tmp_path)
+    assert restarted.get('https://img/a.png') == (b'a-data', 'image/png')
+    assert restarted.get('https://img/b.png') == (b'b-data', 'image/png')
@@ -0,0 +1,109 @@
+"""
+Tests for the queue-based logging pipeline
+"""
+
+import io
+import logging
+import queue
+import threading
+import time
+
+import pytest
+
+from bring_mcp_server.logs import (
+    BoundedQueueHandler,
+    LogPipeline,
+    SamplingFilter,
+    log_context,
+    log_pipeline_from_env,
+    parse_sample_rates,
+)
+from bring_mcp_server.metrics import Metrics
+
+
+class BlockingStream(io.StringIO):
+    """A stderr pipe nobody reads until released."""
+    
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+    
+    def write(self, text):
+        self.release.wait(5)
+        return super().write(text)
+
+
+def test_records_are_written_off_the_calling_thread():
+    """A stalled stream does not block logging calls; queued records are written on stop."""
+    stream = BlockingStream()
+    pipeline = LogPipeline(Metrics(), stream=stream)
+    pipeline.start()
+    try:
+        t0 = time.perf_counter()
+        with log_context(tool='bring_add_item', list_uuid='list-1'):
+            logging.getLogger('bring_mcp_server.test').info(
+                'Tool call finished', extra={'latency_ms': 12.34}
+            )
+            logging.getLogger('bring_mcp_server.test').info('Added %s', 'Milch')
+        assert time.perf_counter() - t0 < 0.5
+    finally:
+        stream.release.set()
+        pipeline.stop()
+    
+    assert stream.getvalue().splitlines() == [
+        'INFO:bring_mcp_server.test:Tool call finished tool=bring_add_item list_uuid=list-1 '
+        'latency_ms=12.3',
+        'INFO:bring_mcp_server.test:Added Milch tool=bring_add_item list_uuid=list-1',
+    ]
+    assert pipeline.handler not in logging.getLogger().handlers
+
+
+def test_full_queue_drops_and_counts():
+    """Records that do not fit in the queue are dropped instead of waiting."""
+    metrics = Metrics()
+    handler = BoundedQueueHandler(queue.Queue(2), metrics)
+    logger = logging.getLogger('bring_mcp_server.test.overflow')
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for n in range(5):
+            logger.warning(f'record {n}')
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+    
+    assert handler.queue.qsize() == 2
+    assert metrics.get('log_records_dropped_total', reason='overflow') == 3
+
+
+def test_sampling_keeps_a_fraction_of_high_volume_loggers():
+    """Sampled loggers keep the configured share; warnings and other loggers always pass."""
+    metrics = Metrics()
+    sampler = SamplingFilter({'mcp.server': 0.25}, metrics)
+    
+    def record(name, level=logging.INFO):
+        return logging.LogRecord(name, level, __file__, 1, 'message', None, None)
+    
+    kept = [sampler.filter(record('mcp.server.lowlevel.server')) for _ in range(8)]
+    assert kept.count(True) == 2
+    assert sampler.filter(record('mcp.server.lowlevel.server', logging.WARNING))
+    assert sampler.filter(record('bring_mcp_server.server'))
+    assert metrics.get('log_records_dropped_total', reason='sampled') == 6
+
+
+def test_log_pipeline_from_env(monkeypatch):
+    """Level, queue size and sample rates come from the environment."""
+    monkeypatch.setenv('BRING_LOG_LEVEL', 'debug')
+    monkeypatch.setenv('BRING_LOG_QUEUE', '0')
+    monkeypatch.setenv('BRING_LOG_SAMPLE', 'bring_mcp_server.server.calls=0.1')
+    pipeline = log_pipeline_from_env(Metrics())
+    
+    assert pipeline.level == logging.DEBUG
+    assert pipeline.handler is pipeline.writer
+    assert parse_sample_rates('a=0.5, b=1') == {'a': 0.5, 'b': 1.0}
+    with pytest.raises(ValueError):
+        parse_sample_rates('a=2')
+    
+    monkeypatch.setenv('BRING_LOG_LEVEL', 'chatty')
+    with pytest.raises(ValueError):
+        log_pipeline_from_env(Metrics())
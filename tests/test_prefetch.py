@@ -0,0 +1,169 @@
+"""
+Tests for predictive prefetching
+"""
+
+import asyncio
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bring_mcp_server.metrics import Metrics
+from bring_mcp_server.prefetch import DEFAULT_POLICY, MISS, Prefetcher, TransitionModel
+from bring_mcp_server.recorder import from_jsonable
+
+
+def test_model_learns_transitions():
+    """Frequent follow-up tools are predicted once they have enough support."""
+    model = TransitionModel(min_support=3)
+    for session in ('a', 'b', 'c'):
+        model.observe(session, 'bring_get_lists')
+        model.observe(session, 'bring_get_list_items', 'list-1')
+    model.observe('c', 'bring_get_list_items', 'list-2')
+    
+    assert model.predict('bring_get_lists') == ['bring_get_list_items']
+    assert model.predict('bring_get_list_items') == []
+    assert model.likely_lists() == ['list-1', 'list-2']
+    assert TransitionModel(DEFAULT_POLICY).predict('bring_get_lists') == ['bring_get_list_items']
+
+
+def test_model_forgets_old_sessions():
+    """Only the most recently active sessions are remembered (one per stateless request)."""
+    model = TransitionModel(min_support=1, max_sessions=2)
+    model.observe('a', 'bring_get_lists')
+    for n in range(100):
+        model.observe(f'request-{n}', 'bring_get_item_details')
+    
+    assert len(model._last_tool) == 2
+    model.observe('a', 'bring_get_list_items')
+    assert model.predict('bring_get_lists') == []
+
+
+@pytest.mark.asyncio
+async def test_prefetcher_hits_waste_and_bounds():
+    """Results are handed out once; unused, invalidated and excess prefetches are counted."""
+    metrics = Metrics()
+    prefetcher = Prefetcher(TransitionModel(), metrics, max_inflight=2, ttl=60)
+    release = asyncio.Event()
+    
+    async def slow():
+        await release.wait()
+        return 'value'
+    
+    assert prefetcher.schedule('a', slow)
+    assert prefetcher.schedule('b', slow)
+    assert not prefetcher.schedule('c', slow)
+    release.set()
+    
+    assert await prefetcher.take('a') == 'value'
+    assert await prefetcher.take('a') is MISS
+    prefetcher.discard('b')
+    
+    prefetcher.ttl = 0
+    prefetcher.schedule('d', slow)
+    assert await prefetcher.take('d') is MISS
+    
+    prefetcher.ttl = 60
+    prefetcher.schedule('e', asyncio.Event().wait)
+    await prefetcher.close()
+    
+    assert metrics.snapshot() == {
+        'prefetch_hits_total': 1,
+        'prefetch_skipped_total': 1,
+        'prefetch_started_total': 4,
+        'prefetch_wasted_total{reason="cancelled"}': 1,
+        'prefetch_wasted_total{reason="expired"}': 1,
+        'prefetch_wasted_total{reason="invalidated"}': 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_follow_up_call_is_served_from_prefetch():
+    """After bring_get_lists, the user's usual list is fetched before it is asked for."""
+    mock_bring = AsyncMock()
+    mock_bring.load_lists = AsyncMock(return_value=SimpleNamespace(
+        lists=[SimpleNamespace(name='Groceries', listUuid='list-1', theme='default')]
+    ))
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(
+        items=SimpleNamespace(purchase=[SimpleNamespace(itemId='Milch', spec='', uuid='')], recently=[])
+    ))
+    metrics = Metrics()
+    prefetcher = Prefetcher(TransitionModel(DEFAULT_POLICY), metrics)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server import server
+        
+        with patch.object(server, '_prefetcher', prefetcher):
+            await server.call_tool('bring_get_list_items', {'list_uuid': 'list-1'})
+            await server.call_tool('bring_get_lists', {})
+            result = await server.call_tool('bring_get_list_items', {'list_uuid': 'list-1'})
+            
+            assert 'Milch' in result[0].text
+            assert mock_bring.get_list.call_count == 2
+            assert metrics.get('prefetch_hits_total') == 1
+            
+            # A write makes a pending prefetch of the list useless
+            await server.call_tool('bring_get_lists', {})
+            await server.call_tool('bring_add_item', {'list_uuid': 'list-1', 'item_name': 'Brot'})
+            assert metrics.get('prefetch_wasted_total', reason='invalidated') == 1
+            await server.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_goes_through_shared_cache(tmp_path):
+    """Prefetched responses are stored in, and served from, the shared cache."""
+    mock_bring = AsyncMock()
+    mock_bring.load_lists = AsyncMock(return_value=SimpleNamespace(lists=[]))
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(
+        items=SimpleNamespace(purchase=[SimpleNamespace(itemId='Milch', spec='', uuid='')], recently=[])
+    ))
+    prefetcher = Prefetcher(TransitionModel(DEFAULT_POLICY), Metrics())
+    env = {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw',
+           'BRING_CACHE_PATH': str(tmp_path / 'cache.sqlite3')}
+    
+    with patch.dict(os.environ, env), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server import server
+        
+        with patch.object(server, '_prefetcher', prefetcher):
+            await server.call_tool('bring_get_list_items', {'list_uuid': 'list-1'})
+            shared = await server.get_shared_cache()
+            shared.delete(server.shared_key('list:list-1'))
+            await server.call_tool('bring_get_lists', {})
+            assert await prefetcher.take('list:list-1') is not MISS
+            
+            cached = from_jsonable(shared.get(server.shared_key('list:list-1')))
+            assert cached.items.purchase[0].itemId == 'Milch'
+            
+            # A fresh shared copy is used instead of asking Bring! again
+            await server.call_tool('bring_get_lists', {})
+            await prefetcher.take('list:list-1')
+            assert mock_bring.get_list.call_count == 2
+            await server.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_failure_does_not_fail_the_call():
+    """A prefetch the client cannot serve only counts as a prefetch error."""
+    from bring_api import Bring
+    
+    mock_bring = AsyncMock(spec=Bring)
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(
+        items=SimpleNamespace(purchase=[SimpleNamespace(itemId='Milch', spec='', uuid='')], recently=[])
+    ))
+    metrics = Metrics()
+    prefetcher = Prefetcher(TransitionModel(DEFAULT_POLICY), metrics)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server import server
+        
+        with patch.object(server, '_prefetcher', prefetcher):
+            result = await server.call_tool('bring_get_list_items', {'list_uuid': 'list-1'})
+            assert await prefetcher.take('catalog:default') is MISS
+            
+            assert 'Milch' in result[0].text
+            assert metrics.get('prefetch_errors_total') == 1
+            await server.cleanup()
@@ -0,0 +1,123 @@
+"""
+Tests for traffic capture and replay
+"""
+
+import json
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bring_mcp_server.metrics import Metrics
+from bring_mcp_server.prefetch import DEFAULT_POLICY, Prefetcher, TransitionModel
+from bring_mcp_server.recorder import REDACTED, TrafficRecorder, hash_id, redact
+from bring_mcp_server.replay import load_capture, percentile, replay
+
+
+def test_redact_hashes_ids_and_drops_secrets():
+    """Identifiers are hashed consistently and secrets never reach the capture."""
+    redacted = redact({'list_uuid': 'abc', 'password': 'hunter2', 'item_name': 'Milk'})
+    
+    assert redacted == {'list_uuid': hash_id('abc'), 'password': REDACTED, 'item_name': 'Milk'}
+    assert hash_id('abc') == hash_id('abc') != 'abc'
+
+
+def test_percentile():
+    """Nearest-rank percentiles."""
+    samples = [float(i) for i in range(1, 101)]
+    
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay(tmp_path):
+    """Recorded sessions replay against a stubbed client without network access."""
+    capture = tmp_path / 'capture.jsonl'
+    recorder = TrafficRecorder(str(capture))
+    mock_bring = AsyncMock()
+    mock_bring.load_lists = AsyncMock(return_value=SimpleNamespace(
+        lists=[SimpleNamespace(name='Groceries', listUuid='list-1', theme='default')]
+    ))
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(
+        items=SimpleNamespace(purchase=[SimpleNamespace(itemId='Milk', spec='', uuid='')], recently=[])
+    ))
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring), \
+            patch('bring_mcp_server.server._recorder', recorder):
+        from bring_mcp_server import server
+        
+        await server.call_tool('bring_get_lists', {})
+        await server.call_tool('bring_get_list_items', {'list_uuid': 'list-1'})
+    recorder.flush()
+    
+    lines = [json.loads(line) for line in capture.read_text().splitlines()]
+    assert [line['tool'] for line in lines] == ['bring_get_lists', 'bring_get_list_items']
+    assert 'list-1' not in capture.read_text()
+    assert lines[1]['upstream'][0]['method'] == 'get_list'
+    
+    # Replay with a fresh server state and no real client; the recorder and
+    # the shared cache of the real account stay untouched
+    server._bring = None
+    captured = capture.read_text()
+    cache_path = tmp_path / 'cache.sqlite3'
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com',
+                                 'BRING_CACHE_PATH': str(cache_path)}), \
+            patch('bring_mcp_server.server._recorder', recorder):
+        report = await replay(load_capture(str(capture)), speed=0)
+    recorder.flush()
+    
+    assert capture.read_text() == captured
+    assert not cache_path.exists()
+    assert report.total_calls == 2
+    assert report.errors == 0
+    assert report.upstream_calls == 2
+    assert 'bring_get_list_items' in report.format()
+    assert server._bring is None
+
+
+@pytest.mark.asyncio
+async def test_replay_of_calls_served_by_prefetch(tmp_path):
+    """A call answered from a prefetch is replayed with the response it was served."""
+    capture = tmp_path / 'capture.jsonl'
+    recorder = TrafficRecorder(str(capture))
+    mock_bring = AsyncMock()
+    mock_bring.load_lists = AsyncMock(return_value=SimpleNamespace(lists=[]))
+    mock_bring.get_list = AsyncMock(side_effect=lambda uuid: SimpleNamespace(items=SimpleNamespace(
+        purchase=[SimpleNamespace(itemId=f'only-{uuid}', spec='', uuid='')], recently=[]
+    )))
+    prefetcher = Prefetcher(TransitionModel(DEFAULT_POLICY), Metrics())
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring), \
+            patch('bring_mcp_server.server._recorder', recorder), \
+            patch('bring_mcp_server.server._prefetcher', prefetcher):
+        from bring_mcp_server import server
+        
+        await server.call_tool('bring_get_list_items', {'list_uuid': 'L1'})
+        await server.call_tool('bring_get_list_items', {'list_uuid': 'L2'})
+        await server.call_tool('bring_get_lists', {})
+        result = await server.call_tool('bring_get_list_items', {'list_uuid': 'L1'})
+        await prefetcher.close()
+    recorder.flush()
+    
+    assert 'only-L1' in result[0].text
+    assert prefetcher.metrics.get('prefetch_hits_total') == 1
+    
+    server._bring = None
+    rendered = []
+    real_call_tool = server.call_tool
+    
+    async def capture_result(name, arguments):
+        result = await real_call_tool(name, arguments)
+        rendered.append(result[0].text)
+        return result
+    
+    with patch.object(server, 'call_tool', capture_result):
+        report = await replay(load_capture(str(capture)), speed=0)
+    
+    assert report.errors == 0
+    assert 'only-L1' in rendered[3] and 'only-L2' not in rendered[3]
@@ -0,0 +1,82 @@
+"""
+Tests for the event loop runtime and the loop-lag monitor
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from bring_mcp_server import runtime
+from bring_mcp_server.metrics import Metrics
+from bring_mcp_server.runtime import LoopLagMonitor, lag_monitor_from_env, loop_factory
+
+
+def test_loop_factory_choices():
+    """'asyncio' always gives the standard loop; unknown kinds are rejected."""
+    assert loop_factory('asyncio') is asyncio.new_event_loop
+    with pytest.raises(ValueError):
+        loop_factory('trio')
+    
+    with patch.dict('sys.modules', {'uvloop': None}):
+        assert loop_factory('auto') is asyncio.new_event_loop
+        with pytest.raises(ImportError, match=r'bring-mcp-server\[speed\]'):
+            loop_factory('uvloop')
+
+
+def test_run_uses_selected_loop():
+    """runtime.run returns the coroutine result on the requested loop."""
+    async def loop_type():
+        return type(asyncio.get_running_loop()).__module__
+    
+    assert runtime.run(loop_type(), 'asyncio').startswith('asyncio')
+    
+    uvloop = pytest.importorskip('uvloop')
+    assert runtime.run(loop_type(), 'uvloop').startswith(uvloop.__name__)
+
+
+def test_run_with_eager_tasks():
+    """Eager tasks start running before create_task returns (Python 3.12+)."""
+    async def started_eagerly():
+        started = []
+    
+        async def task():
+            started.append(True)
+    
+        pending = asyncio.get_running_loop().create_task(task())
+        eager = bool(started)
+        await pending
+        return eager
+    
+    assert runtime.run(started_eagerly(), 'asyncio') is False
+    expected = hasattr(asyncio, 'eager_task_factory')
+    assert runtime.run(started_eagerly(), 'asyncio', eager_tasks=True) is expected
+
+
+@pytest.mark.asyncio
+async def test_lag_monitor_names_blocking_handler():
+    """Blocking the loop inside a tracked handler is measured and attributed to it."""
+    metrics = Metrics()
+    monitor = LoopLagMonitor(metrics, threshold=0.05, interval=0.01)
+    try:
+        with monitor.track('bring_slow_tool'):
+            await asyncio.sleep(0.02)
+            time.sleep(0.3)
+            await asyncio.sleep(0.05)
+    
+        assert metrics.get('loop_slow_callbacks_total', handler='bring_slow_tool') == 1
+        assert metrics.get('loop_lag_events_total') >= 1
+        assert metrics.get('loop_lag_max_seconds') >= 0.2
+    finally:
+        monitor.stop()
+
+
+def test_lag_monitor_from_env(monkeypatch):
+    """The monitor is off unless BRING_LOOP_LAG_MS sets a threshold."""
+    monkeypatch.delenv('BRING_LOOP_LAG_MS', raising=False)
+    assert lag_monitor_from_env(Metrics()) is None
+    
+    monkeypatch.setenv('BRING_LOOP_LAG_MS', '250')
+    monitor = lag_monitor_from_env(Metrics())
+    assert monitor is not None and monitor.threshold == 0.25
@@ -0,0 +1,92 @@
+"""
+Tests for per-list write sequencing
+"""
+
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bring_mcp_server.sequencer import ListSequencer, SequencedClient
+
+
+class SlowClient:
+    """Records when each write starts and finishes."""
+    
+    def __init__(self, latency):
+        self.latency = latency
+        self.log = []
+        self.reads = 0
+    
+    async def save_item(self, list_uuid, item_id, spec=''):
+        self.log.append(('start', list_uuid, item_id))
+        # Later writes finish faster, so unsequenced writes would complete out of order
+        await asyncio.sleep(self.latency / (1 + len(self.log)))
+        self.log.append(('end', list_uuid, item_id))
+    
+    async def get_list(self, list_uuid):
+        self.reads += 1
+        await asyncio.sleep(self.latency)
+
+
+@pytest.mark.asyncio
+async def test_writes_to_one_list_apply_in_arrival_order():
+    """Writes to a list never overlap and complete in the order they were issued."""
+    sequencer = ListSequencer()
+    stub = SlowClient(0.02)
+    client = SequencedClient(stub, sequencer)
+    
+    await asyncio.gather(*(client.save_item('list-1', f'item-{i}') for i in range(5)))
+    
+    assert stub.log == [
+        (event, 'list-1', f'item-{i}') for i in range(5) for event in ('start', 'end')
+    ]
+    assert len(sequencer) == 0
+
+
+@pytest.mark.asyncio
+async def test_lists_and_reads_run_in_parallel():
+    """Writes to different lists, and reads, do not wait for each other."""
+    client = SequencedClient(SlowClient(0.1), ListSequencer())
+    
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client.save_item(f'list-{i}', 'Milch') for i in range(10)),
+        client.get_list('list-0'),
+        client.get_list('list-0'),
+    )
+    
+    assert time.perf_counter() - start < 0.3
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_sequenced_per_list():
+    """Concurrent bring_complete_item calls reach the API one after another."""
+    active = 0
+    overlaps = 0
+    
+    async def complete_item(list_uuid, item_name):
+        nonlocal active, overlaps
+        active += 1
+        overlaps += active > 1
+        await asyncio.sleep(0.01)
+        active -= 1
+    
+    mock_bring = AsyncMock()
+    mock_bring.complete_item = AsyncMock(side_effect=complete_item)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import call_tool
+        
+        await asyncio.gather(*(
+            call_tool('bring_complete_item', {'list_uuid': 'list-1', 'item_name': f'item-{i}'})
+            for i in range(5)
+        ))
+    
+    assert overlaps == 0
+    assert [c.args[1] for c in mock_bring.complete_item.call_args_list] == [
+        f'item-{i}' for i in range(5)
+    ]
@@ -0,0 +1,194 @@
+"""
+Tests for the cross-process shared cache and multi-worker support
+"""
+
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+from bring_api import Bring
+
+from bring_mcp_server.auth import export_session, restore_session
+from bring_mcp_server.shared_cache import SharedCache
+
+
+def test_set_get_and_expiry(tmp_path):
+    """Values round-trip as JSON and disappear after their TTL."""
+    cache = SharedCache(tmp_path / 'cache.sqlite3')
+    
+    cache.set('fresh', {'items': [1, 2]}, ttl=60)
+    cache.set('stale', 'old', ttl=-1)
+    
+    assert cache.get('fresh') == {'items': [1, 2]}
+    assert cache.get('stale') is None
+    assert cache.purge_expired() == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_fetches_once_across_instances(tmp_path):
+    """Concurrent misses from several processes trigger a single upstream fetch."""
+    caches = [SharedCache(tmp_path / 'cache.sqlite3') for _ in range(4)]
+    calls = 0
+    
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return ['catalog']
+    
+    results = await asyncio.gather(*(
+        cache.get_or_fetch('catalog', fetch, ttl=60, poll_interval=0.01) for cache in caches
+    ))
+    
+    assert results == [['catalog']] * 4
+    assert calls == 1
+    for cache in caches:
+        cache.close()
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_shared_between_processes(tmp_path):
+    """A second process (fresh in-memory state) reads the catalog from the shared cache."""
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(return_value=[
+        {'itemId': 'Milch', 'translations': {'en-US': 'Milk'}, 'imagePath': 'milch.png'},
+    ])
+    env = {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw',
+           'BRING_CACHE_PATH': str(tmp_path / 'cache.sqlite3')}
+    
+    with patch.dict(os.environ, env), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server import server
+        
+        await server.call_tool('bring_get_item_details', {'item_ids': ['Milch']})
+        
+        # Simulate another worker: empty per-process caches, same shared file
+        await server.cleanup()
+        result = await server.call_tool('bring_get_item_details', {'item_ids': ['Milch']})
+    
+    assert 'milch.png' in result[0].text
+    mock_bring.get_items_details.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_session_export_and_restore():
+    """A fresh client adopts an exported login without calling login()."""
+    async with aiohttp.ClientSession() as session:
+        source = Bring(session, 'test@example.com', 'pw')
+        source.uuid = 'user-uuid'
+        source.public_uuid = 'public-uuid'
+        source.headers['Authorization'] = 'Bearer token'
+        source._expires_at = 3600
+        state = export_session(source)
+        
+        target = Bring(session, 'test@example.com', 'pw')
+        assert await restore_session(target, state)
+        assert target.uuid == 'user-uuid'
+        assert target.headers['Authorization'] == 'Bearer token'
+        assert not target._token_expired
+        
+        other_account = Bring(session, 'other@example.com', 'pw')
+        assert not await restore_session(other_account, state)
+        
+        state['expires_at'] = time.time() + 5
+        assert not await restore_session(Bring(session, 'test@example.com', 'pw'), state)
+
+
+def test_create_http_app():
+    """The HTTP transport mounts the MCP endpoint."""
+    from bring_mcp_server.server import create_http_app
+    
+    http_app = create_http_app()
+    
+    assert [route.path for route in http_app.routes] == ['/mcp']
+
+
+def test_http_sessions_are_stateful_with_one_worker():
+    """Only pre-forked workers run stateless; HTTP sessions are offered subscriptions."""
+    from bring_mcp_server.server import app, create_http_app
+    
+    with patch('mcp.server.streamable_http_manager.StreamableHTTPSessionManager') as manager:
+        create_http_app()
+        with patch.dict(os.environ, {'BRING_HTTP_WORKERS': '4'}):
+            create_http_app()
+    
+    assert [call.kwargs['stateless'] for call in manager.call_args_list] == [False, True]
+    assert app.create_initialization_options().capabilities.resources.subscribe
+
+
+@pytest.mark.asyncio
+async def test_stdio_instances_share_lists_and_invalidate_on_write(tmp_path):
+    """A restarted instance starts hot, and writes drop the shared list snapshot."""
+    from types import SimpleNamespace
+    
+    mock_bring = AsyncMock()
+    mock_bring.load_lists = AsyncMock(return_value=SimpleNamespace(
+        lists=[SimpleNamespace(name='Groceries', listUuid='list-1', theme='default')]
+    ))
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(
+        items=SimpleNamespace(purchase=[SimpleNamespace(itemId='Milk', spec='', uuid='')], recently=[])
+    ))
+    env = {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw',
+           'BRING_CACHE_PATH': str(tmp_path / 'cache.sqlite3')}
+    
+    with patch.dict(os.environ, env), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server import server
+        
+        await server.call_tool('bring_get_lists', {})
+        await server.call_tool('bring_get_list_items', {'list_uuid': 'list-1'})
+        
+        # Restart: the new instance is served from disk
+        await server.cleanup()
+        result = await server.call_tool('bring_get_lists', {})
+        await server.call_tool('bring_get_list_items', {'list_uuid': 'list-1'})
+        assert 'Groceries' in result[0].text
+        mock_bring.load_lists.assert_called_once()
+        mock_bring.get_list.assert_called_once()
+        
+        await server.call_tool('bring_add_item', {'list_uuid': 'list-1', 'item_name': 'Bread'})
+        await server.call_tool('bring_get_list_items', {'list_uuid': 'list-1'})
+    
+    assert mock_bring.get_list.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_writes_wait_off_the_event_loop(tmp_path):
+    """Opening the cache and invalidating a list do not block while another process writes."""
+    import sqlite3
+    
+    from bring_mcp_server import server
+    
+    path = tmp_path / 'cache.sqlite3'
+    SharedCache(path).close()
+    other_process = sqlite3.connect(path, isolation_level=None)
+    other_process.execute('BEGIN IMMEDIATE')
+    
+    async def release_later():
+        await asyncio.sleep(0.3)
+        other_process.execute('COMMIT')
+    
+    ticks = 0
+    
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+    
+    ticker = asyncio.create_task(tick())
+    try:
+        with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com',
+                                     'BRING_CACHE_PATH': str(path)}):
+            await asyncio.gather(server.get_shared_cache(), release_later())
+            other_process.execute('BEGIN IMMEDIATE')
+            await asyncio.gather(server.invalidate_list('list-1'), release_later())
+    finally:
+        ticker.cancel()
+        other_process.close()
+    
+    assert ticks >= 30
@@ -0,0 +1,146 @@
+"""
+Tests for list resources and subscriptions
+"""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bring_mcp_server.subscriptions import ListWatcher, list_uri, list_uuid_from_uri
+
+
+def test_list_uri_roundtrip():
+    """List UUIDs survive the trip through a resource URI."""
+    assert list_uuid_from_uri(list_uri('abc-123')) == 'abc-123'
+    
+    with pytest.raises(ValueError, match="Unknown resource"):
+        list_uuid_from_uri('bring://other/abc')
+
+
+@pytest.mark.asyncio
+async def test_watcher_polls_once_per_list_and_notifies_on_change():
+    """N sessions watching a list cost one fetch; they are only notified on change."""
+    contents = {'list-1': 'Milk'}
+    fetch = AsyncMock(side_effect=lambda list_uuid: contents[list_uuid])
+    sessions = [AsyncMock(), AsyncMock(), AsyncMock()]
+    
+    watcher = ListWatcher(fetch, interval=3600)
+    for session in sessions:
+        watcher.subscribe('list-1', session)
+    
+    try:
+        await watcher.poll_once()
+        await watcher.poll_once()
+        for session in sessions:
+            session.send_resource_updated.assert_not_called()
+        
+        contents['list-1'] = 'Milk, Bread'
+        fetch.reset_mock()
+        await watcher.poll_once()
+        
+        fetch.assert_called_once_with('list-1')
+        for session in sessions:
+            session.send_resource_updated.assert_called_once_with(list_uri('list-1'))
+        assert watcher.snapshot('list-1') == 'Milk, Bread'
+    finally:
+        await watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_watcher_drops_dead_sessions():
+    """A session that fails to receive a notification is unsubscribed."""
+    contents = {'list-1': 'Milk'}
+    watcher = ListWatcher(AsyncMock(side_effect=lambda list_uuid: contents[list_uuid]), interval=3600)
+    dead = AsyncMock()
+    dead.send_resource_updated.side_effect = RuntimeError('closed')
+    watcher.subscribe('list-1', dead)
+    
+    try:
+        await watcher.poll_once()
+        contents['list-1'] = 'Bread'
+        await watcher.poll_once()
+        
+        assert not watcher.is_watched('list-1')
+    finally:
+        await watcher.close()
+
+
+@pytest.mark.asyncio
+async def test_list_and_read_resources():
+    """Shopping lists are exposed as readable resources."""
+    mock_bring = AsyncMock()
+    mock_bring.load_lists = AsyncMock(return_value={
+        'lists': [{'name': 'Groceries', 'listUuid': 'list-1', 'theme': 'default'}]
+    })
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(
+        items=SimpleNamespace(purchase=[{'itemId': 'Milk', 'spec': '', 'uuid': ''}], recently=[])
+    ))
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import list_resources, read_resource
+        
+        resources = await list_resources()
+        contents = await read_resource(resources[0].uri)
+    
+    assert str(resources[0].uri) == 'bring://lists/list-1'
+    assert resources[0].name == 'Groceries'
+    assert '- Milk' in contents[0].content
+
+
+@pytest.mark.asyncio
+async def test_read_after_write_notifies_subscribers():
+    """A change first seen by a resource read is still sent to subscribers, once."""
+    items = [SimpleNamespace(itemId='Milk', spec='', uuid='')]
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(return_value=[])
+    mock_bring.get_list = AsyncMock(side_effect=lambda list_uuid: SimpleNamespace(
+        items=SimpleNamespace(purchase=list(items), recently=[])
+    ))
+    
+    async def save_item(list_uuid, item_id, spec=''):
+        items.append(SimpleNamespace(itemId=item_id, spec=spec, uuid=''))
+    
+    mock_bring.save_item = AsyncMock(side_effect=save_item)
+    session = AsyncMock()
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server import server
+        
+        watcher = server.get_list_watcher()
+        watcher.interval = 3600
+        watcher.subscribe('list-1', session)
+        await watcher.poll_once()
+        
+        await server.call_tool('bring_add_item', {'list_uuid': 'list-1', 'item_name': 'Bread'})
+        contents = await server.read_resource(list_uri('list-1'))
+        await watcher.poll_once()
+    
+    assert '- Bread' in contents[0].content
+    session.send_resource_updated.assert_called_once_with(list_uri('list-1'))
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_end_with_the_session():
+    """A list no client watches any more is no longer polled."""
+    from mcp.shared.memory import create_connected_server_and_client_session
+    
+    mock_bring = AsyncMock()
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(
+        items=SimpleNamespace(purchase=[], recently=[])
+    ))
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server import server
+        
+        async with create_connected_server_and_client_session(server.app) as client:
+            await client.subscribe_resource(list_uri('list-1'))
+            await client.subscribe_resource(list_uri('list-2'))
+            assert server._list_watcher.is_watched('list-1')
+        
+        assert not server._list_watcher.is_watched('list-1')
+        assert not server._list_watcher.is_watched('list-2')
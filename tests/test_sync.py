@@ -0,0 +1,152 @@
+"""
+Tests for the bring_sync_list tool
+"""
+
+import asyncio
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from bring_api import BringItemOperation
+
+from bring_mcp_server.sync import plan_sync
+
+
+def item(item_id, spec='', uuid=''):
+    return SimpleNamespace(itemId=item_id, spec=spec, uuid=uuid)
+
+
+def summarize(changes):
+    return sorted((c.operation, c.item_id, c.spec, c.uuid) for c in changes)
+
+
+def test_plan_sync_minimal_changes():
+    """Only differences produce changes; matching ignores case and diacritics."""
+    purchase = [item('Milch', '1l', 'u-milch'), item('Käse', '', 'u-kase'), item('Salz', '', 'u-salz')]
+    recently = [item('Brot', 'dark', 'u-brot')]
+    desired = [('milch', '1l'), ('KASE', 'Gouda'), ('Brot', None), ('Eier', None)]
+    
+    changes = plan_sync(purchase, recently, desired)
+    
+    assert summarize(changes) == [
+        ('ADD', 'Brot', 'dark', 'u-brot'),
+        ('ADD', 'Eier', '', None),
+        ('ADD', 'Käse', 'Gouda', 'u-kase'),
+        ('COMPLETE', 'Salz', '', 'u-salz'),
+    ]
+    assert plan_sync(purchase, recently, [('Milch', None), ('Käse', ''), ('Salz', None)]) == []
+    assert summarize(plan_sync(purchase, [], [('Milch', None)], 'remove'))[0][0] == 'REMOVE'
+    assert plan_sync(purchase, [], [], 'keep') == []
+    
+    # Localized list items are matched through the key
+    english = {'Milk': 'Milch'}
+    localized = [item('Milk', '', 'u-milk')]
+    assert plan_sync(localized, [], [('Milch', None)], key=lambda n: english.get(n, n)) == []
+    
+    with pytest.raises(ValueError, match='Invalid value'):
+        plan_sync(purchase, [], [], 'delete')
+
+
+@pytest.mark.asyncio
+async def test_sync_list_applies_one_batch():
+    """The tool reads the list once and writes every change in a single request."""
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(return_value=[
+        {'itemId': 'Milch', 'translations': {'en-US': 'Milk'}},
+    ])
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(items=SimpleNamespace(
+        purchase=[item('Milch', '', 'u-milch'), item('Salz', '', 'u-salz')],
+        recently=[],
+    )))
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import call_tool
+        
+        result = await call_tool('bring_sync_list', {
+            'list_uuid': 'list-1',
+            'items': [{'itemId': 'Milk', 'spec': '2l'}, {'itemId': 'Eier'}],
+            'unwanted': 'remove',
+        })
+        
+        mock_bring.get_list.assert_called_once_with('list-1')
+        mock_bring.batch_update_list.assert_called_once()
+        list_uuid, batch = mock_bring.batch_update_list.call_args.args
+        assert list_uuid == 'list-1'
+        assert [(c['itemId'], c['spec'], c['operation']) for c in batch] == [
+            ('Milch', '2l', BringItemOperation.ADD),
+            ('Eier', '', BringItemOperation.ADD),
+            ('Salz', '', BringItemOperation.REMOVE),
+        ]
+        assert batch[0]['uuid'] == 'u-milch'
+        assert 'Synced list list-1: 3 change(s)' in result[0].text
+        assert 'REMOVE: Salz - removed' in result[0].text
+        
+        result = await call_tool('bring_sync_list', {
+            'list_uuid': 'list-1',
+            'items': [{'itemId': 'Milch'}, {'itemId': 'Salz'}],
+        })
+        assert result[0].text == 'List list-1 is already up to date.'
+        mock_bring.batch_update_list.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_list_matches_localized_list_items():
+    """Items of a list in another language are matched by catalog itemId, not completed."""
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(return_value=[
+        {'itemId': 'Milch', 'translations': {'en-US': 'Milk'}},
+        {'itemId': 'Brot', 'translations': {'en-US': 'Bread'}},
+    ])
+    # bring_api returns the itemIds of an en-US list in English
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(items=SimpleNamespace(
+        purchase=[item('Milk', '', 'u-milk'), item('Bread', '', 'u-bread')],
+        recently=[],
+    )))
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import call_tool
+        
+        result = await call_tool('bring_sync_list', {
+            'list_uuid': 'list-1',
+            'items': [{'itemId': 'Milk'}],
+        })
+    
+    batch = mock_bring.batch_update_list.call_args.args[1]
+    assert [(c['itemId'], c['operation']) for c in batch] == [
+        ('Bread', BringItemOperation.COMPLETE),
+    ]
+    assert 'Milk' not in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_concurrent_syncs_of_one_list_apply_once():
+    """A sync plans against the list as left by the previous sync of the same list."""
+    purchase = [item('Milch', '', 'u-milch')]
+    
+    async def get_list(list_uuid):
+        snapshot = list(purchase)
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(items=SimpleNamespace(purchase=snapshot, recently=[]))
+    
+    async def batch_update_list(list_uuid, batch):
+        await asyncio.sleep(0.01)
+        purchase.extend(item(change['itemId'], change['spec'], change['uuid']) for change in batch)
+    
+    mock_bring = AsyncMock()
+    mock_bring.get_items_details = AsyncMock(return_value=[])
+    mock_bring.get_list = AsyncMock(side_effect=get_list)
+    mock_bring.batch_update_list = AsyncMock(side_effect=batch_update_list)
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring):
+        from bring_mcp_server.server import call_tool
+        
+        arguments = {'list_uuid': 'list-1', 'items': [{'itemId': 'Milch'}, {'itemId': 'Eier'}]}
+        results = await asyncio.gather(*(call_tool('bring_sync_list', arguments) for _ in range(3)))
+    
+    mock_bring.batch_update_list.assert_awaited_once()
+    assert [i.itemId for i in purchase] == ['Milch', 'Eier']
+    assert sum('already up to date' in result[0].text for result in results) == 2
@@ -0,0 +1,127 @@
+"""
+Tests for tracing spans and the sampling profiler
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bring_mcp_server.profiler import SamplingProfiler
+from bring_mcp_server.tracing import Tracer
+from bring_mcp_server.writer import BackgroundWriter
+
+
+def read_spans(path):
+    spans = []
+    for line in path.read_text().splitlines():
+        record = json.loads(line)
+        for scope in record['resourceSpans'][0]['scopeSpans']:
+            spans.extend(scope['spans'])
+    return spans
+
+
+def test_disabled_tracer_writes_nothing(tmp_path):
+    """Without an export path spans are no-ops."""
+    tracer = Tracer(None)
+    
+    with tracer.span('call_tool x') as span:
+        span.set_attribute('key', 'value')
+    
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_nested_spans_export_one_trace(tmp_path):
+    """Child spans share the trace id and point at their parent."""
+    path = tmp_path / 'traces.jsonl'
+    tracer = Tracer(str(path))
+    
+    with tracer.span('root', tool='bring_get_lists'):
+        with tracer.span('child'):
+            pass
+    tracer.flush()
+    
+    assert len(path.read_text().splitlines()) == 1
+    spans = {span['name']: span for span in read_spans(path)}
+    assert spans['child']['traceId'] == spans['root']['traceId']
+    assert spans['child']['parentSpanId'] == spans['root']['spanId']
+    assert 'parentSpanId' not in spans['root']
+    assert spans['root']['attributes'] == [{'key': 'tool', 'value': {'stringValue': 'bring_get_lists'}}]
+
+
+def test_traces_are_written_off_the_calling_thread(tmp_path):
+    """Finished traces are exported by the writer thread, in order."""
+    writer = BackgroundWriter()
+    tracer = Tracer(str(tmp_path / 'traces.jsonl'), writer)
+    threads = []
+    export = tracer._export
+    tracer._export = lambda spans: (threads.append(threading.get_ident()), export(spans))
+    
+    try:
+        for name in ('first', 'second'):
+            with tracer.span(name):
+                pass
+        tracer.flush()
+    finally:
+        writer.close()
+    
+    assert len(threads) == 2 and threading.get_ident() not in threads
+    assert [span['name'] for span in read_spans(tmp_path / 'traces.jsonl')] == ['first', 'second']
+
+
+@pytest.mark.asyncio
+async def test_call_tool_records_client_and_render_spans(tmp_path):
+    """A tool call produces a root span with login, client and render children."""
+    path = tmp_path / 'traces.jsonl'
+    tracer = Tracer(str(path))
+    mock_bring = AsyncMock()
+    mock_bring.get_list = AsyncMock(return_value=SimpleNamespace(
+        items=SimpleNamespace(purchase=[{'itemId': 'Milk'}], recently=[])
+    ))
+    
+    with patch.dict(os.environ, {'BRING_EMAIL': 'test@example.com', 'BRING_PASSWORD': 'pw'}), \
+            patch('bring_mcp_server.server.Bring', return_value=mock_bring), \
+            patch('bring_mcp_server.server._tracer', tracer):
+        from bring_mcp_server.server import call_tool
+        
+        await call_tool('bring_get_list_items', {'list_uuid': 'list-1'})
+        await call_tool('invalid_tool', {})
+    tracer.flush()
+    
+    spans = read_spans(path)
+    names = [span['name'] for span in spans]
+    assert 'bring.login' in names
+    assert 'render' in names
+    
+    client_span = next(span for span in spans if span['name'] == 'bring.get_list')
+    assert client_span['kind'] == 'SPAN_KIND_CLIENT'
+    assert {'key': 'bring.list_uuid', 'value': {'stringValue': 'list-1'}} in client_span['attributes']
+    
+    failed = next(span for span in spans if span['name'] == 'call_tool invalid_tool')
+    assert failed['status']['code'] == 'STATUS_CODE_ERROR'
+
+
+@pytest.mark.asyncio
+async def test_profiler_keeps_slowest_calls(tmp_path):
+    """Only the slowest N calls keep their collapsed stacks on disk."""
+    profiler = SamplingProfiler(2, tmp_path, interval=0.001)
+    
+    try:
+        for label, seconds in [('fast', 0.0), ('slow', 0.05), ('slower', 0.08)]:
+            with profiler.profile(label):
+                # Block the loop so the sampler sees this call's stack
+                time.sleep(seconds)
+                await asyncio.sleep(0)
+    finally:
+        profiler.stop()
+    
+    assert [call.label for call in profiler.slowest_calls] == ['slower', 'slow']
+    files = sorted(path.name for path in tmp_path.iterdir())
+    assert len(files) == 2
+    assert all(name.endswith('.folded') for name in files)
+    assert 'test_profiler_keeps_slowest_calls' in profiler.slowest_calls[0].collapsed()